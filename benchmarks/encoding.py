@@ -0,0 +1,93 @@
+"""Result-encoding benchmark: time and payload size per output format.
+
+Encodes a tabular result of mixed-type rows (Decimal, datetime, date, UUID,
+bytes, NULL) with the encoders in db_mcp.encoding and with the encoder the
+server used before them, ``json.dumps(indent=2, default=str)``.  The JSON
+format is timed both with orjson (when installed) and with the stdlib
+fallback.
+
+Usage::
+
+    python benchmarks/encoding.py [--rows 10000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import decimal
+import json
+import sys
+import time
+import uuid
+from typing import Any, Callable
+
+from db_mcp import encoding
+
+
+def _rows(n: int) -> dict:
+    base = datetime.datetime(2024, 1, 1, 12, 0, 0)
+    rows = [
+        {
+            "id": i,
+            "uuid": uuid.UUID(int=i),
+            "name": f"customer {i}",
+            "balance": decimal.Decimal(i) / 100,
+            "created_at": base + datetime.timedelta(minutes=i),
+            "birthday": datetime.date(1990, 1, 1) + datetime.timedelta(days=i % 10000),
+            "avatar": i.to_bytes(8, "big"),
+            "score": i * 0.5,
+            "active": i % 2 == 0,
+            "note": None if i % 3 else "vip",
+        }
+        for i in range(n)
+    ]
+    return {"rows": rows, "rowCount": n, "truncated": False}
+
+
+def _legacy(result: Any) -> str:
+    return json.dumps(result, indent=2, ensure_ascii=False, default=str)
+
+
+def _stdlib_json(result: Any) -> str:
+    orjson, encoding.orjson = encoding.orjson, None
+    try:
+        return encoding.to_json(result)
+    finally:
+        encoding.orjson = orjson
+
+
+def _best(fn: Callable[[Any], str], result: Any, repeat: int) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn(result)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, len(out.encode())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    result = _rows(args.rows)
+    fast = "orjson" if encoding.orjson is not None else "stdlib, orjson not installed"
+    encoders: list[tuple[str, Callable[[Any], str]]] = [
+        ("json.dumps(indent=2) (old)", _legacy),
+        (f"json ({fast})", encoding.to_json),
+        ("json (stdlib)", _stdlib_json),
+        (f"columnar ({fast})", encoding.to_columnar),
+        ("csv", encoding.to_csv),
+    ]
+    print(f"{args.rows} rows")
+    print(f"{'encoder':<40}{'ms':>9}{'MB':>8}{'rows/s':>12}")
+    for name, fn in encoders:
+        ms, size = _best(fn, result, args.repeat)
+        print(f"{name:<40}{ms:>9.1f}{size / 1e6:>8.2f}{args.rows / ms * 1000:>12,.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""Cold-start benchmark: import time and time to the first tools/list.
+
+For each backend this spawns fresh interpreters and reports the median of:
+
+- ``import db_mcp.server`` (configuration, driver and tool modules);
+- process spawn to the first ``tools/list`` response over stdio.
+
+No database is needed: the server runs with ``DB_LAZY_CONNECT=true``, so it
+answers the MCP handshake before (failing to) connect.  The run also checks
+that no other backend's driver, nor the SSH libraries, were imported, and
+exits non-zero if one was.
+
+Usage::
+
+    python benchmarks/startup.py [--runs 8] [--backend sqlite ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+# Driver modules each backend may load; everything else in DRIVERS must not be.
+DRIVERS = {
+    "mysql": {"aiomysql", "pymysql"},
+    "postgresql": {"asyncpg"},
+    "mongodb": {"motor", "pymongo"},
+    "sqlite": {"aiosqlite"},
+}
+SSH_MODULES = {"paramiko", "sshtunnel"}
+
+_PROBE = (
+    "import json, sys, time\n"
+    "start = time.perf_counter()\n"
+    "import db_mcp.server\n"
+    "ms = (time.perf_counter() - start) * 1000\n"
+    "print(json.dumps({'ms': ms, 'modules': sorted(m for m in sys.modules if '.' not in m)}))\n"
+)
+
+
+def _env(backend: str, db_path: str) -> dict[str, str]:
+    env = {k: v for k, v in os.environ.items() if not k.startswith(("DB_", "SSH_"))}
+    env.update(DB_TYPE=backend, DB_DATABASE="bench", DB_LAZY_CONNECT="true")
+    if backend == "sqlite":
+        env["DB_PATH"] = db_path
+    elif backend == "mongodb":
+        env["DB_URL"] = "mongodb://127.0.0.1:1"
+    else:
+        env.update(DB_HOST="127.0.0.1", DB_PORT="1")
+    return env
+
+
+def _import_once(env: dict[str, str]) -> tuple[float, set[str]]:
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    data = json.loads(out.splitlines()[-1])
+    return data["ms"], set(data["modules"])
+
+
+async def _tools_list_once(env: dict[str, str]) -> float:
+    start = time.perf_counter()
+    params = StdioServerParameters(command=sys.executable, args=["-m", "db_mcp"], env=env)
+    with open(os.devnull, "w") as devnull:
+        async with stdio_client(params, errlog=devnull) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                await session.list_tools()
+                return (time.perf_counter() - start) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=8)
+    parser.add_argument("--backend", action="append", choices=sorted(DRIVERS))
+    args = parser.parse_args()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        open(db_path, "wb").close()
+        print(f"{'backend':<12}{'import ms':>12}{'tools/list ms':>16}  unexpected modules")
+        for backend in args.backend or sorted(DRIVERS):
+            env = _env(backend, db_path)
+            imports, loaded = [], set()
+            for _ in range(args.runs):
+                ms, modules = _import_once(env)
+                imports.append(ms)
+                loaded |= modules
+            listed = [asyncio.run(_tools_list_once(env)) for _ in range(args.runs)]
+            others = set().union(*(m for b, m in DRIVERS.items() if b != backend))
+            unexpected = sorted(loaded & (others | SSH_MODULES))
+            failed |= bool(unexpected)
+            print(
+                f"{backend:<12}{statistics.median(imports):>12.0f}"
+                f"{statistics.median(listed):>16.0f}  {', '.join(unexpected) or '-'}"
+            )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
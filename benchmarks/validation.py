@@ -0,0 +1,122 @@
+"""Micro-benchmark for validate_read_only_query on small and very large SQL.
+
+Compares the regex lexer in db_mcp.validation with the character-by-character
+splitter it replaced (kept below as ``_legacy_validate``), and reports the
+verdict cache separately: "cold" clears it before every call, "cached"
+repeats the same SQL.
+
+Usage::
+
+    python benchmarks/validation.py [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from typing import Callable
+
+from db_mcp import validation
+
+_READ_ONLY_PREFIXES = ("select", "show", "describe", "explain", "with")
+
+
+def _legacy_split(sql: str) -> list[str]:
+    """The splitter validation.py used before the regex lexer."""
+    statements: list[str] = []
+    current: list[str] = []
+    in_quote: str | None = None
+    i = 0
+    while i < len(sql):
+        ch = sql[i]
+        if in_quote is not None and ch == "\\":
+            current.append(ch)
+            i += 1
+            if i < len(sql):
+                current.append(sql[i])
+                i += 1
+            continue
+        if ch in ("'", '"', "`"):
+            if in_quote is None:
+                in_quote = ch
+            elif in_quote == ch:
+                if i + 1 < len(sql) and sql[i + 1] == ch:
+                    current.append(ch)
+                    current.append(ch)
+                    i += 2
+                    continue
+                in_quote = None
+            current.append(ch)
+            i += 1
+            continue
+        if ch == ";" and in_quote is None:
+            stmt = "".join(current).strip()
+            if stmt:
+                statements.append(stmt)
+            current = []
+            i += 1
+            continue
+        current.append(ch)
+        i += 1
+    stmt = "".join(current).strip()
+    if stmt:
+        statements.append(stmt)
+    return statements
+
+
+def _legacy_validate(sql: str) -> None:
+    statements = _legacy_split(sql)
+    if not statements:
+        raise ValueError("Empty query.")
+    for stmt in statements:
+        if not stmt.lower().startswith(_READ_ONLY_PREFIXES):
+            raise ValueError("Only SELECT, SHOW, DESCRIBE, EXPLAIN, WITH queries are allowed.")
+
+
+def _cold(sql: str) -> None:
+    validation._verdicts.clear()
+    validation.validate_read_only_query(sql)
+
+
+def _cases() -> list[tuple[str, str]]:
+    ints = ", ".join(str(100000 + i) for i in range(80_000))
+    strings = ", ".join(f"'name-{i:06d}'" for i in range(45_000))
+    semis = ", ".join(f"'n;{i:05d}'" for i in range(45_000))
+    return [
+        ("SELECT ... WHERE id = 42", "SELECT id, name FROM users WHERE id = 42"),
+        ("IN list of 80k ints", f"SELECT * FROM t WHERE id IN ({ints})"),
+        ("IN list of 45k strings", f"SELECT * FROM t WHERE name IN ({strings})"),
+        ("same, ';' in each literal", f"SELECT * FROM t WHERE name IN ({semis})"),
+    ]
+
+
+def _best_ms(fn: Callable[[str], None], sql: str, repeat: int) -> float:
+    number = max(1, min(1000, int(2_000_000 / max(1, len(sql)))))
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn(sql)
+        best = min(best, (time.perf_counter() - start) / number)
+    return best * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'query':<28}{'size':>10}{'legacy ms':>12}{'cold ms':>10}{'cached ms':>11}")
+    for name, sql in _cases():
+        size = len(sql.encode())
+        size_text = f"{size / 1024:.0f} KiB" if size >= 1024 else f"{size} B"
+        legacy = _best_ms(_legacy_validate, sql, args.repeat)
+        cold = _best_ms(_cold, sql, args.repeat)
+        cached = _best_ms(validation.validate_read_only_query, sql, args.repeat)
+        print(f"{name:<28}{size_text:>10}{legacy:>12.3f}{cold:>10.3f}{cached:>11.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator
+
+from db_mcp.config import Config
+from db_mcp.metrics import phase
+
+# Tool-call lanes, each with its own concurrency limit.
+LANES = ("read", "write", "meta")
+
+
+class _Lane:
+    __slots__ = ("limit", "active", "pinned", "waiters", "admitted", "queued", "rejected")
+
+    def __init__(self, limit: int) -> None:
+        self.limit = max(1, limit)
+        # Slots in use, including pinned ones.
+        self.active = 0
+        self.pinned = 0
+        self.waiters: deque[asyncio.Future[None]] = deque()
+        self.admitted = 0
+        self.queued = 0
+        self.rejected = 0
+
+
+class AdmissionController:
+    """Concurrency limits for tool calls, per lane, with a bounded wait queue.
+
+    Reads, writes and metadata calls each have their own slots, so cheap
+    metadata calls never queue behind long analytic queries.  A call that
+    finds its lane full waits in FIFO order; once ``max_queue`` calls are
+    waiting across all lanes, further calls are rejected at once instead
+    of piling up.  A finishing call hands its slot straight to the next
+    waiter of its lane.
+
+    Work that fans out or outlives its call takes extra slots: a call may
+    :meth:`reserve` free slots without waiting, and a resource still
+    checked out after the call returns (an open cursor) holds a slot
+    through :meth:`pin` until it is released.
+    """
+
+    def __init__(self, limits: dict[str, int], max_queue: int) -> None:
+        self._lanes = {name: _Lane(limits[name]) for name in LANES}
+        self.max_queue = max_queue
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(lane.waiters) for lane in self._lanes.values())
+
+    @asynccontextmanager
+    async def admit(self, lane_name: str) -> AsyncIterator[None]:
+        """Hold a slot of lane *lane_name* for the duration of the block."""
+        lane = self._lanes[lane_name]
+        if lane.active < lane.limit and not lane.waiters:
+            lane.active += 1
+        else:
+            if self.waiting >= self.max_queue:
+                lane.rejected += 1
+                raise RuntimeError(
+                    f"Server busy: {lane.active} {lane_name} calls running and "
+                    f"{self.waiting} waiting (see DB_MAX_QUEUED). Retry shortly."
+                )
+            lane.queued += 1
+            fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            lane.waiters.append(fut)
+            try:
+                with phase("admit"):
+                    await fut
+            except asyncio.CancelledError:
+                if fut.done() and not fut.cancelled():
+                    # The slot was handed over just as this call was cancelled.
+                    self._release(lane)
+                elif fut in lane.waiters:
+                    lane.waiters.remove(fut)
+                raise
+        lane.admitted += 1
+        try:
+            yield
+        finally:
+            self._release(lane)
+
+    def reserve(self, lane_name: str, n: int) -> int:
+        """Take up to *n* free slots of lane *lane_name* without waiting.
+
+        Returns how many were taken (none while calls are waiting); give
+        them back with :meth:`release`.
+        """
+        lane = self._lanes[lane_name]
+        if lane.waiters:
+            return 0
+        taken = max(0, min(n, lane.limit - lane.active))
+        lane.active += taken
+        return taken
+
+    def release(self, lane_name: str, n: int = 1) -> None:
+        lane = self._lanes[lane_name]
+        for _ in range(n):
+            self._release(lane)
+
+    def pin(self, lane_name: str) -> None:
+        """Hold a slot of lane *lane_name* until :meth:`unpin`.
+
+        Never waits: the lane may go over its limit until running calls
+        finish, and new calls wait meanwhile.
+        """
+        lane = self._lanes[lane_name]
+        lane.active += 1
+        lane.pinned += 1
+
+    def unpin(self, lane_name: str) -> None:
+        lane = self._lanes[lane_name]
+        lane.pinned -= 1
+        self._release(lane)
+
+    def _release(self, lane: _Lane) -> None:
+        # Over the limit (pinned slots), a finishing call frees nothing.
+        while lane.waiters and lane.active <= lane.limit:
+            fut = lane.waiters.popleft()
+            if not fut.done():
+                # The slot passes to the waiter; the active count is unchanged.
+                fut.set_result(None)
+                return
+        lane.active -= 1
+
+    def stats(self) -> dict:
+        return {
+            "maxQueued": self.max_queue,
+            "waiting": self.waiting,
+            **{
+                name: {
+                    "limit": lane.limit,
+                    "active": lane.active,
+                    "pinned": lane.pinned,
+                    "waiting": len(lane.waiters),
+                    "admitted": lane.admitted,
+                    "queued": lane.queued,
+                    "rejected": lane.rejected,
+                }
+                for name, lane in self._lanes.items()
+            },
+        }
+
+
+@dataclass(frozen=True)
+class LaneSizes:
+    """Lane limits and the open-cursor cap derived from the connection pool."""
+
+    pool: int  # connections tool calls can draw on at once (SQLite: readers)
+    reads: int
+    writes: int
+    primary_reads: int  # read slots backed by the primary's own connections
+    cursors: int
+
+    @property
+    def limits(self) -> dict[str, int]:
+        return {"read": self.reads, "write": self.writes, "meta": self.pool}
+
+
+def lane_sizes(config: Config) -> LaneSizes:
+    """Size the admission lanes for *config*.
+
+    By default reads and writes together leave one connection free for
+    metadata calls.  SQLite writes use the separate writer connection and
+    a read-only database takes no write slots; each read replica adds a
+    pool's worth of read slots.  An open SQL cursor keeps a primary
+    connection checked out and so holds a read slot until closed; one read
+    slot always stays free for other reads, so with a single one
+    ``query_page`` is disabled.
+    """
+    if config.is_sqlite:
+        pool = max(1, config.sqlite_readers)
+    elif config.is_mongodb:
+        pool = config.mongo_pool_size
+    else:
+        pool = config.pool_max_size
+    if config.max_concurrent_writes:
+        writes = config.max_concurrent_writes
+    elif config.is_read_only:
+        # The lane still admits one call at a time, only to be rejected.
+        writes = 0
+    else:
+        writes = 1 if config.is_sqlite else max(1, (pool - 1) // 3)
+    primary_reads = max(1, pool - 1 - (0 if config.is_sqlite else writes))
+    reads = config.max_concurrent_reads or primary_reads + pool * len(config.replicas)
+    cursors = config.max_cursors
+    if not config.is_mongodb:
+        cursors = max(0, min(cursors, min(primary_reads, reads) - 1))
+        if config.max_cursors and not cursors:
+            print(
+                f"[db-mcp] query_page disabled: {min(primary_reads, reads)} read slot(s), "
+                "and one must stay free for other reads. Raise DB_POOL_MAX_SIZE "
+                "(SQLite: DB_SQLITE_READERS) or DB_MAX_CONCURRENT_READS to enable it.",
+                file=sys.stderr,
+            )
+    return LaneSizes(pool, reads, writes, primary_reads, cursors)
@@ -0,0 +1,6 @@
+"""Per-backend driver modules.
+
+Each module imports its database driver at the top, so importing one is
+what loads the driver: :class:`db_mcp.connection.Connection` imports only
+the module for the configured ``DB_TYPE``.
+"""
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+import motor.motor_asyncio
+
+from db_mcp.config import Config
+
+
+class MongoClient:
+    """Motor client bound to the configured database."""
+
+    def __init__(self, config: Config) -> None:
+        self.config = config
+        self._client: motor.motor_asyncio.AsyncIOMotorClient | None = None
+        self._db: Any = None
+
+    @property
+    def db(self) -> Any:
+        assert self._db is not None, "MongoDB database not initialized"
+        return self._db
+
+    async def open(self) -> None:
+        print(
+            f"[db-mcp] Connecting to MongoDB {self.config.db_database} "
+            f"({self.config.db_mode})...",
+            file=sys.stderr,
+        )
+        self._client = motor.motor_asyncio.AsyncIOMotorClient(self.config.db_url)
+        self._db = self._client[self.config.db_database]
+        # Verify connectivity
+        await self._db.command("ping")
+        print("[db-mcp] MongoDB connected.", file=sys.stderr)
+
+    async def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+            self._db = None
+            print("[db-mcp] MongoDB disconnected.", file=sys.stderr)
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import struct
+import sys
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import aiomysql
+import pymysql
+from pymysql.constants import COMMAND, ER
+
+from db_mcp.backends.stats import PoolMetrics
+from db_mcp.config import Config
+
+# MySQL COM_SET_OPTION argument to turn off multi-statement support.
+_MULTI_STATEMENTS_OFF = struct.pack("<H", 1)
+
+# Client-side error codes (CR_*): the connection itself failed.
+_CLIENT_ERRORS = range(2000, 3000)
+
+
+def connection_reusable(exc: BaseException) -> bool:
+    """Whether a connection whose statement failed with *exc* can go back to the pool.
+
+    Errors the server returned (syntax, unknown table, duplicate key, its
+    own statement timeout) leave the session intact.  Client and network
+    errors, timeouts and cancellation do not: the connection may be dead or
+    still busy with the statement.
+    """
+    if isinstance(exc, (pymysql.err.InterfaceError, pymysql.err.InternalError)):
+        return False
+    if isinstance(exc, pymysql.err.OperationalError):
+        return not (exc.args and exc.args[0] in _CLIENT_ERRORS)
+    return isinstance(exc, pymysql.err.MySQLError)
+
+
+class MySQLPool:
+    """aiomysql pool whose connections have multi-statements disabled."""
+
+    def __init__(self, config: Config) -> None:
+        self.config = config
+        self._pool: aiomysql.Pool | None = None
+        # Track connections where multi-statements have been disabled, mapped
+        # to the server thread id they were hardened on.  A reconnect (same
+        # object, new server session) yields a new thread id and forces the
+        # option to be re-sent.
+        self._safe_conns: weakref.WeakKeyDictionary[aiomysql.Connection, int] = (
+            weakref.WeakKeyDictionary()
+        )
+        # Monotonic timestamp of the last checkout release, per connection.
+        self._last_used: weakref.WeakKeyDictionary[aiomysql.Connection, float] = (
+            weakref.WeakKeyDictionary()
+        )
+        # Session statement timeout (ms) per connection, keyed like
+        # _safe_conns by the thread id it was set on.
+        self._timeouts: weakref.WeakKeyDictionary[aiomysql.Connection, tuple[int, int]] = (
+            weakref.WeakKeyDictionary()
+        )
+        # (thread id, monotonic start) of each server session, for
+        # pool_max_lifetime.
+        self._born: weakref.WeakKeyDictionary[aiomysql.Connection, tuple[int, float]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._mariadb = False
+        self._host = ""
+        self._port = 0
+        self.metrics = PoolMetrics()
+
+    @property
+    def pool(self) -> aiomysql.Pool:
+        assert self._pool is not None, "MySQL pool not initialized"
+        return self._pool
+
+    async def _disable_multi_statements(self, conn: aiomysql.Connection) -> None:
+        """Disable multi-statement query support on *conn*.
+
+        aiomysql unconditionally sets CLIENT_MULTI_STATEMENTS during the
+        handshake.  We send COM_SET_OPTION(MYSQL_OPTION_MULTI_STATEMENTS_OFF)
+        to instruct the server to reject any query containing multiple
+        statements, closing the protocol-level loophole.
+
+        The option is session state, so it is only sent once per server
+        session: connections already hardened on their current thread id
+        are skipped.
+        """
+        thread_id = conn.thread_id()
+        if self._safe_conns.get(conn) == thread_id:
+            return
+        await conn._execute_command(COMMAND.COM_SET_OPTION, _MULTI_STATEMENTS_OFF)
+        pkt = await conn._read_packet()
+        if not pkt.is_ok_packet() and not pkt.is_eof_packet():
+            raise RuntimeError("Failed to disable multi-statement queries")
+        self._safe_conns[conn] = thread_id
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiomysql.Connection]:
+        """Acquire a MySQL connection with multi-statements disabled.
+
+        Connections idle for longer than ``ping_interval`` seconds (or never
+        checked out before) are pinged, reconnecting if needed.  Recently
+        used connections go straight to the caller, so the fast path costs
+        no extra round trips.
+
+        Sessions older than ``pool_max_lifetime`` are closed on release and
+        replaced by the pool on a later checkout.
+        """
+        pool = self.pool
+        conn = await self.metrics.acquire(pool.acquire(), self.config.pool_acquire_timeout)
+        try:
+            last_used = self._last_used.get(conn)
+            if last_used is None or time.monotonic() - last_used > self.config.ping_interval:
+                await conn.ping(reconnect=True)
+            await self._disable_multi_statements(conn)
+            thread_id = conn.thread_id()
+            born = self._born.get(conn)
+            if born is None or born[0] != thread_id:
+                born = self._born[conn] = (thread_id, time.monotonic())
+            try:
+                yield conn
+            finally:
+                now = time.monotonic()
+                self._last_used[conn] = now
+                lifetime = self.config.pool_max_lifetime
+                if lifetime and now - born[1] > lifetime:
+                    conn.close()
+        finally:
+            pool.release(conn)
+            if conn.closed:
+                # aiomysql only wakes waiters for connections it keeps; let
+                # one of them open a replacement.
+                await pool._wakeup()
+
+    async def set_statement_timeout(self, conn: aiomysql.Connection, seconds: float | None) -> None:
+        """Have the server abort SELECTs on *conn* running longer than *seconds*.
+
+        Uses ``max_execution_time`` (MySQL, milliseconds) or, on MariaDB,
+        ``max_statement_time`` (seconds).  Only sent when the session value
+        has to change.
+        """
+        ms = int(seconds * 1000) if seconds else 0
+        thread_id = conn.thread_id()
+        current = self._timeouts.get(conn)
+        if (current[1] if current and current[0] == thread_id else 0) == ms:
+            return
+        async with conn.cursor() as cur:
+            if not self._mariadb:
+                try:
+                    await cur.execute("SET SESSION max_execution_time = %s", (ms,))
+                except pymysql.err.OperationalError as exc:
+                    if exc.args[0] != ER.UNKNOWN_SYSTEM_VARIABLE:
+                        raise
+                    self._mariadb = True
+            if self._mariadb:
+                await cur.execute("SET SESSION max_statement_time = %s", (ms / 1000,))
+        self._timeouts[conn] = (thread_id, ms)
+
+    async def kill_query(self, conn: aiomysql.Connection) -> None:
+        """Stop the statement running on *conn*, from a separate connection.
+
+        Errors are logged, not raised: the caller drops *conn* either way.
+        """
+        try:
+            killer = await aiomysql.connect(
+                host=self._host,
+                port=self._port,
+                user=self.config.db_user,
+                password=self.config.db_password,
+            )
+            try:
+                async with killer.cursor() as cur:
+                    await cur.execute("KILL QUERY %s", (conn.thread_id(),))
+            finally:
+                killer.close()
+        except Exception as exc:
+            print(f"[db-mcp] Could not cancel MySQL query: {exc}", file=sys.stderr)
+
+    async def open(self, host: str, port: int) -> None:
+        self._host, self._port = host, port
+        print(
+            f"[db-mcp] Connecting to MySQL {host}:{port}"
+            f"/{self.config.db_database} ({self.config.db_mode})...",
+            file=sys.stderr,
+        )
+        self._pool = await aiomysql.create_pool(
+            host=host,
+            port=port,
+            user=self.config.db_user,
+            password=self.config.db_password,
+            db=self.config.db_database,
+            autocommit=True,
+            minsize=self.config.pool_min_size,
+            maxsize=self.config.pool_max_size,
+            # aiomysql recycles connections by idle time; -1 disables it.
+            pool_recycle=self.config.pool_max_idle or -1,
+        )
+        # Verify connectivity and disable multi-statement support.
+        async with self.acquire() as conn:
+            await conn.ping()
+        print("[db-mcp] MySQL connected.", file=sys.stderr)
+
+    async def replication_lag(self) -> float | None:
+        """Seconds this server's replication is behind its source.
+
+        None when the server is not replicating, replication is stopped, or
+        the user lacks the REPLICATION CLIENT privilege.  Doubles as the
+        replica health probe, so it always makes a round trip.
+        """
+        async with self.acquire() as conn:
+            async with conn.cursor(aiomysql.DictCursor) as cur:
+                try:
+                    try:
+                        await cur.execute("SHOW REPLICA STATUS")
+                    except pymysql.err.ProgrammingError as exc:
+                        if exc.args[0] != ER.PARSE_ERROR:
+                            raise
+                        # MySQL before 8.0.22, MariaDB before 10.5.1
+                        await cur.execute("SHOW SLAVE STATUS")
+                except pymysql.err.MySQLError as exc:
+                    if exc.args[0] != ER.SPECIFIC_ACCESS_DENIED_ERROR:
+                        raise
+                    return None
+                row = await cur.fetchone()
+        if not row:
+            return None
+        lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+        return None if lag is None else float(lag)
+
+    def stats(self) -> dict:
+        pool = self.pool
+        return self.metrics.stats(pool.size, pool.freesize, pool.maxsize, pool.minsize)
+
+    async def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            await self._pool.wait_closed()
+            self._pool = None
+            print("[db-mcp] MySQL disconnected.", file=sys.stderr)
@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable
+
+import asyncpg
+
+from db_mcp.backends.statements import StatementCache
+from db_mcp.backends.stats import PoolMetrics
+from db_mcp.config import Config
+
+# Seconds a replaced pool gets to drain checked-out connections before it
+# is terminated.
+_RETIRE_TIMEOUT = 30.0
+
+_CONNECTION_ERRORS = (
+    asyncpg.ConnectionDoesNotExistError,
+    asyncpg.InterfaceError,
+    OSError,
+)
+
+
+class _ReconnectNeeded(Exception):
+    """Internal sentinel: raised when a pool ping fails inside acquire."""
+
+
+Release = Callable[[], Awaitable[None]]
+
+
+class PostgresPool:
+    """asyncpg pool that reconnects (endpoint included) when it goes stale.
+
+    *endpoint* opens a route to the server and returns ``(host, port,
+    release)``; it is called again on every reconnect, so a caller using an
+    SSH tunnel starts a new one there.  *release*, if not None, is awaited
+    once the pool opened over that route has been retired.
+
+    A reconnect opens the new pool before retiring the old one, and the old
+    pool is closed in the background: queries still running on healthy old
+    connections finish normally instead of holding up the reconnect.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        endpoint: Callable[[], Awaitable[tuple[str, int, Release | None]]],
+    ) -> None:
+        self.config = config
+        self._endpoint = endpoint
+        self._pool: asyncpg.Pool | None = None
+        self._release: Release | None = None
+        self._retiring: set[asyncio.Task[None]] = set()
+        # Last use or successful ping of each underlying asyncpg connection.
+        self._last_used: weakref.WeakKeyDictionary[asyncpg.Connection, float] = (
+            weakref.WeakKeyDictionary()
+        )
+        # First checkout of each underlying connection, for pool_max_lifetime.
+        self._born: weakref.WeakKeyDictionary[asyncpg.Connection, float] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._reconnect_lock = asyncio.Lock()
+        self.metrics = PoolMetrics()
+        self.statements = StatementCache(config.statement_cache_size)
+
+    @property
+    def pool(self) -> asyncpg.Pool:
+        assert self._pool is not None, "PostgreSQL pool not initialized"
+        return self._pool
+
+    async def _checkout(self, pool: asyncpg.Pool) -> asyncpg.Connection:
+        """Acquire a connection from *pool*, pinging it if it has been idle.
+
+        Connections used or validated within the last ``ping_interval``
+        seconds are handed out without a round trip; the background
+        keepalive task normally keeps idle members fresh.
+        """
+        conn = await self.metrics.acquire(pool.acquire(), self.config.pool_acquire_timeout)
+        last_used = self._last_used.get(conn._con)
+        if last_used is None or time.monotonic() - last_used > self.config.ping_interval:
+            try:
+                await conn.fetchval("SELECT 1")
+            except _CONNECTION_ERRORS:
+                # Connection is dead — caller will reconnect.
+                await pool.release(conn)
+                raise _ReconnectNeeded()
+        return conn
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[asyncpg.Connection]:
+        """Acquire a PostgreSQL connection from the pool.
+
+        Automatically reconnects (including SSH tunnel) if the connection
+        has gone stale (e.g. "Connection reset by peer" after idle timeout).
+        Connections older than ``pool_max_lifetime`` are closed instead of
+        released; the pool opens a fresh one in their place.
+        """
+        pool = self.pool
+        try:
+            conn = await self._checkout(pool)
+        except (*_CONNECTION_ERRORS, _ReconnectNeeded):
+            print(
+                "[db-mcp] PostgreSQL connection lost, reconnecting...",
+                file=sys.stderr,
+            )
+            await self.reconnect(pool)
+            pool = self.pool
+            conn = await self.metrics.acquire(pool.acquire(), self.config.pool_acquire_timeout)
+        raw = conn._con
+        born = self._born.setdefault(raw, time.monotonic())
+        try:
+            yield conn
+        finally:
+            now = time.monotonic()
+            self._last_used[raw] = now
+            lifetime = self.config.pool_max_lifetime
+            if lifetime and now - born > lifetime and not raw.is_closed():
+                # Closing hands the holder back to the pool.
+                await raw.close()
+            else:
+                await pool.release(conn)
+
+    async def open(self) -> None:
+        """Open a pool over a new route and make it the current one."""
+        host, port, release = await self._endpoint()
+        print(
+            f"[db-mcp] Connecting to PostgreSQL {host}:{port}"
+            f"/{self.config.db_database} ({self.config.db_mode})...",
+            file=sys.stderr,
+        )
+        try:
+            pool = await asyncpg.create_pool(
+                host=host,
+                port=port,
+                user=self.config.db_user,
+                password=self.config.db_password,
+                database=self.config.db_database,
+                min_size=self.config.pool_min_size,
+                max_size=self.config.pool_max_size,
+                max_inactive_connection_lifetime=self.config.pool_max_idle,
+                statement_cache_size=self.config.statement_cache_size,
+            )
+            try:
+                # Verify connectivity
+                async with pool.acquire() as conn:
+                    await conn.fetchval("SELECT 1")
+                    self._last_used[conn._con] = time.monotonic()
+            except BaseException:
+                pool.terminate()
+                raise
+        except BaseException:
+            if release is not None:
+                await release()
+            raise
+        self._pool = pool
+        self._release = release
+        print("[db-mcp] PostgreSQL connected.", file=sys.stderr)
+
+    async def _retire(self, pool: asyncpg.Pool, release: Release | None) -> None:
+        """Close a replaced pool once its checked-out connections are back."""
+        try:
+            await asyncio.wait_for(pool.close(), _RETIRE_TIMEOUT)
+        except asyncio.CancelledError:
+            pool.terminate()
+            raise
+        except Exception:
+            pool.terminate()
+        if release is not None:
+            await release()
+
+    async def reconnect(self, stale_pool: asyncpg.Pool | None = None) -> None:
+        """Open a new pool and retire the existing one in the background.
+
+        When *stale_pool* is given and another caller has already replaced
+        it, this is a no-op, so concurrent failures trigger one reconnect.
+        If the new pool cannot be opened the old one stays current.
+        """
+        async with self._reconnect_lock:
+            if stale_pool is not None and self._pool is not stale_pool:
+                return
+            old, old_release = self._pool, self._release
+            await self.open()
+            if old is not None:
+                task = asyncio.create_task(self._retire(old, old_release))
+                self._retiring.add(task)
+                task.add_done_callback(self._retiring.discard)
+
+    async def keepalive_round(self) -> None:
+        """Ping idle pool members that have not been used recently.
+
+        A dead member means the server or tunnel went away, so the whole
+        pool is rebuilt before a tool call runs into it.
+
+        asyncpg hands out idle connections last-in first-out, so members due
+        for a ping sit below recently used ones.  The round takes the idle
+        members out without any I/O, hands recently used ones straight back
+        and pings the rest concurrently, releasing each right after its ping.
+        It never waits for, or opens, a connection.
+        """
+        pool = self._pool
+        if pool is None:
+            return
+        taken: list[asyncpg.Connection] = []
+        try:
+            for _ in range(pool.get_idle_size()):
+                if not pool.get_idle_size():
+                    break
+                taken.append(await pool.acquire())
+        except BaseException:
+            for conn in taken:
+                await pool.release(conn)
+            raise
+        now = time.monotonic()
+        fresh: list[asyncpg.Connection] = []
+        due: list[asyncpg.Connection] = []
+        for conn in taken:
+            last_used = self._last_used.get(conn._con)
+            recent = last_used is not None and now - last_used < self.config.keepalive_interval
+            (fresh if recent else due).append(conn)
+        alive = await asyncio.gather(
+            *(pool.release(conn) for conn in fresh),
+            *(self._keepalive_ping(pool, conn) for conn in due),
+        )
+        if False in alive:
+            print(
+                "[db-mcp] Keepalive found a dead PostgreSQL connection, reconnecting...",
+                file=sys.stderr,
+            )
+            await self.reconnect(pool)
+
+    async def _keepalive_ping(self, pool: asyncpg.Pool, conn: asyncpg.Connection) -> bool:
+        """Ping an idle member checked out by :meth:`keepalive_round`, then release it."""
+        try:
+            await conn.fetchval("SELECT 1")
+        except _CONNECTION_ERRORS:
+            return False
+        finally:
+            await pool.release(conn)
+        self._last_used[conn._con] = time.monotonic()
+        return True
+
+    async def prepare(
+        self, conn: asyncpg.Connection, sql: str
+    ) -> asyncpg.prepared_stmt.PreparedStatement | None:
+        """*sql* prepared on the checked-out *conn*, or None when caching is off.
+
+        Statements are cached per underlying connection and survive release
+        back to the pool; an evicted statement is deallocated by asyncpg once
+        it is garbage collected.
+        """
+        if not self.statements.enabled:
+            return None
+        return await self.statements.get(conn._con, sql, lambda: conn.prepare(sql))
+
+    def forget(self, conn: asyncpg.Connection, sql: str) -> None:
+        """Drop the cached statement for *sql* on *conn* so the next call re-prepares it."""
+        self.statements.discard(conn._con, sql)
+
+    async def replication_lag(self) -> float | None:
+        """Seconds since the last replayed transaction on this standby.
+
+        0 when everything received has been replayed (an idle primary does
+        not make a standby look stale); None on a server that is not in
+        recovery.  Doubles as the replica health probe.
+        """
+        async with self.acquire() as conn:
+            lag = await conn.fetchval(
+                "SELECT CASE"
+                " WHEN NOT pg_is_in_recovery() THEN NULL"
+                " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+                " ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())"
+                " END"
+            )
+        return None if lag is None else float(lag)
+
+    def stats(self) -> dict:
+        pool = self.pool
+        return self.metrics.stats(
+            pool.get_size(), pool.get_idle_size(), pool.get_max_size(), pool.get_min_size()
+        )
+
+    async def close(self) -> None:
+        for task in list(self._retiring):
+            task.cancel()
+        await asyncio.gather(*self._retiring, return_exceptions=True)
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+            print("[db-mcp] PostgreSQL disconnected.", file=sys.stderr)
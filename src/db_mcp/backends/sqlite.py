@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator
+
+import aiosqlite
+
+from db_mcp.backends.statements import StatementCache
+from db_mcp.backends.stats import PoolMetrics
+
+
+class SqlitePool:
+    """Long-lived aiosqlite connections: one writer plus N readers.
+
+    Each aiosqlite connection owns a worker thread, so readers run queries in
+    parallel while keeping SQLite's page cache and statement cache warm
+    between tool calls.  sqlite3 keeps up to ``statement_cache`` compiled
+    statements per connection with LRU eviction; :attr:`statements` mirrors
+    that bookkeeping to report the hit rate.  In read-only mode there is no
+    writer and readers are opened with a ``mode=ro`` URI.  In read-write
+    mode the database is switched to WAL (readers then never block on the
+    writer) and restored to its original journal mode on close.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        readers: int,
+        read_only: bool,
+        wal: bool,
+        acquire_timeout: float = 0.0,
+        statement_cache: int = 128,
+    ) -> None:
+        self.path = path
+        self.size = max(1, readers)
+        self.read_only = read_only
+        self.wal = wal and not read_only
+        self._readers: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._all_readers: list[aiosqlite.Connection] = []
+        self._writer: aiosqlite.Connection | None = None
+        self._writer_lock = asyncio.Lock()
+        self._original_journal_mode: str | None = None
+        self.acquire_timeout = acquire_timeout
+        self.metrics = PoolMetrics()
+        self.statements = StatementCache(statement_cache)
+
+    async def _open(self, read_only: bool) -> aiosqlite.Connection:
+        if read_only:
+            uri = Path(self.path).resolve().as_uri() + "?mode=ro"
+            db = await aiosqlite.connect(uri, uri=True, cached_statements=self.statements.size)
+        else:
+            db = await aiosqlite.connect(self.path, cached_statements=self.statements.size)
+        db.row_factory = aiosqlite.Row
+        return db
+
+    async def open(self) -> None:
+        if not self.read_only:
+            self._writer = await self._open(read_only=False)
+            if self.wal:
+                async with self._writer.execute("PRAGMA journal_mode") as cur:
+                    row = await cur.fetchone()
+                mode = str(row[0]).lower() if row else "delete"
+                if mode != "wal":
+                    async with self._writer.execute("PRAGMA journal_mode=WAL") as cur:
+                        row = await cur.fetchone()
+                    if row and str(row[0]).lower() == "wal":
+                        self._original_journal_mode = mode
+        for _ in range(self.size):
+            db = await self._open(read_only=self.read_only)
+            self._all_readers.append(db)
+            self._readers.put_nowait(db)
+
+    @asynccontextmanager
+    async def acquire(self, write: bool = False) -> AsyncIterator[aiosqlite.Connection]:
+        """Check out the writer (serialised) or an idle reader."""
+        if write:
+            assert self._writer is not None, "SQLite writer not available in read-only mode"
+            await self.metrics.acquire(self._writer_lock.acquire(), self.acquire_timeout)
+            try:
+                yield self._writer
+            finally:
+                try:
+                    if self._writer.in_transaction:
+                        await self._writer.rollback()
+                finally:
+                    self._writer_lock.release()
+            return
+
+        db = await self.metrics.acquire(self._readers.get(), self.acquire_timeout)
+        try:
+            yield db
+        finally:
+            try:
+                # A write slipped through query() in read-write mode: never
+                # leave a pooled reader holding a transaction open.
+                if db.in_transaction:
+                    await db.rollback()
+            finally:
+                self._readers.put_nowait(db)
+
+    def stats(self) -> dict:
+        size = len(self._all_readers)
+        idle = self._readers.qsize()
+        if self._writer is not None:
+            size += 1
+            idle += not self._writer_lock.locked()
+        return self.metrics.stats(size, idle, size)
+
+    async def close(self) -> None:
+        for db in self._all_readers:
+            await db.close()
+        self._all_readers.clear()
+        if self._writer is not None:
+            if self._original_journal_mode is not None:
+                try:
+                    async with self._writer.execute(
+                        f"PRAGMA journal_mode={self._original_journal_mode}"
+                    ):
+                        pass
+                except Exception as exc:
+                    print(
+                        f"[db-mcp] Could not restore SQLite journal mode: {exc}",
+                        file=sys.stderr,
+                    )
+            await self._writer.close()
+            self._writer = None
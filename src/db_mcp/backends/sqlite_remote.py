@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import shlex
+import sqlite3
+import sys
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator
+
+from db_mcp.backends.stats import PoolMetrics
+
+if TYPE_CHECKING:
+    import paramiko
+
+# Runs remotely as `python3 -u -c`: opens the database read-only and answers
+# one JSON request per line.  {"sql": ..., "params": [...]?} -> {"columns": [...]},
+# {"fetch": n} -> {"rows": [[...], ...], "done": bool}, {"close": true} -> {}.
+# Rows travel as arrays; BLOBs as hex, like the local encoder renders them.
+# A thread reads stdin so that the channel closing (end of input) interrupts
+# a running statement instead of waiting for it to finish.
+_HELPER = """
+import json, queue, sqlite3, sys, threading
+from urllib.parse import quote
+def out(o):
+    sys.stdout.write(json.dumps(o, default=lambda v: v.hex() if isinstance(v, bytes) else str(v)))
+    sys.stdout.write("\\n")
+    sys.stdout.flush()
+try:
+    db = sqlite3.connect("file:%s?mode=ro" % quote(sys.argv[1]), uri=True)
+    db.execute("SELECT 1 FROM sqlite_master LIMIT 1")
+except Exception as e:
+    out({"error": str(e)})
+    sys.exit(1)
+out({"ok": sqlite3.sqlite_version})
+requests = queue.Queue()
+def watch():
+    for line in sys.stdin:
+        requests.put(line)
+    db.interrupt()
+    requests.put(None)
+threading.Thread(target=watch, daemon=True).start()
+cur = None
+for line in iter(requests.get, None):
+    req = json.loads(line)
+    try:
+        if "sql" in req:
+            cur = None
+            cur = db.execute(req["sql"], req.get("params") or ())
+            out({"columns": [d[0] for d in cur.description or ()]})
+        elif "fetch" in req:
+            rows = cur.fetchmany(req["fetch"]) if cur is not None else []
+            out({"rows": rows, "done": len(rows) < req["fetch"]})
+        else:
+            cur = None
+            out({})
+    except Exception as e:
+        cur = None
+        out({"error": str(e)})
+"""
+
+
+class RemoteSqliteError(Exception):
+    """The remote helper could not be started, or its output was not understood."""
+
+
+class _Channel:
+    """One remote helper process on an exec channel of the SSH connection.
+
+    Requests are blocking round trips, so each runs in a worker thread.  A
+    round trip that fails or is cancelled half-way leaves the framing out of
+    step, so the channel is marked broken and replaced by the pool.
+    """
+
+    def __init__(self, client: paramiko.SSHClient, path: str) -> None:
+        cmd = f"python3 -u -c {shlex.quote(_HELPER)} {shlex.quote(path)}"
+        self.broken = True
+        self._stdin = None
+        try:
+            self._stdin, self._stdout, self._stderr = client.exec_command(cmd)
+            reply = self._handshake()
+        except Exception as exc:
+            # Anything from the SSH transport (SSHException, EOFError, ...)
+            # means the helper is unusable; the caller falls back to a mirror.
+            self.close()
+            if isinstance(exc, RemoteSqliteError):
+                raise
+            raise RemoteSqliteError(f"{type(exc).__name__}: {exc}") from exc
+        if "ok" not in reply:
+            self.close()
+            raise RemoteSqliteError(reply.get("error", "remote helper failed to start"))
+        self.broken = False
+        self.sqlite_version = reply["ok"]
+
+    def _handshake(self) -> dict[str, Any]:
+        """The helper's first reply, skipping lines a login shell may print first."""
+        while True:
+            line = self._stdout.readline()
+            if not line:
+                return self._exited()
+            try:
+                reply = json.loads(line)
+            except ValueError:
+                continue  # banner or MOTD line
+            if isinstance(reply, dict):
+                return reply
+
+    def _exited(self) -> dict[str, Any]:
+        err = self._stderr.read().decode(errors="replace").strip()
+        return {"error": err or "remote helper exited"}
+
+    def _read(self) -> dict[str, Any]:
+        line = self._stdout.readline()
+        if not line:
+            return self._exited()
+        try:
+            return json.loads(line)
+        except ValueError:
+            raise RemoteSqliteError(f"unexpected output from remote helper: {line[:200]!r}")
+
+    def _round_trip(self, request: dict[str, Any]) -> dict[str, Any]:
+        self._stdin.write(json.dumps(request) + "\n")
+        self._stdin.flush()
+        return self._read()
+
+    async def request(self, request: dict[str, Any]) -> dict[str, Any]:
+        if self.broken:
+            raise sqlite3.OperationalError("remote SQLite channel is closed")
+        self.broken = True
+        reply = await asyncio.to_thread(self._round_trip, request)
+        self.broken = False
+        if "error" in reply:
+            raise sqlite3.OperationalError(reply["error"])
+        return reply
+
+    def close(self) -> None:
+        self.broken = True
+        if self._stdin is not None:
+            self._stdin.channel.close()
+
+
+class RemoteCursor:
+    """The subset of the aiosqlite cursor API the tools use."""
+
+    def __init__(self, channel: _Channel, columns: list[str]) -> None:
+        self._channel = channel
+        self.description = [(name, None, None, None, None, None, None) for name in columns]
+        self._done = not columns
+
+    async def fetchmany(self, size: int) -> list[tuple]:
+        if self._done:
+            return []
+        reply = await self._channel.request({"fetch": size})
+        self._done = reply["done"]
+        return [tuple(row) for row in reply["rows"]]
+
+    async def fetchone(self) -> tuple | None:
+        rows = await self.fetchmany(1)
+        return rows[0] if rows else None
+
+    async def fetchall(self) -> list[tuple]:
+        rows: list[tuple] = []
+        while batch := await self.fetchmany(500):
+            rows.extend(batch)
+        return rows
+
+    async def close(self) -> None:
+        if not self._done and not self._channel.broken:
+            await self._channel.request({"close": True})
+        self._done = True
+
+
+class RemoteSqlite:
+    """Connection-like wrapper over a remote helper channel."""
+
+    def __init__(self, channel: _Channel) -> None:
+        self._channel = channel
+
+    @asynccontextmanager
+    async def execute(self, sql: str, params: Any = None) -> AsyncIterator[RemoteCursor]:
+        req: dict[str, Any] = {"sql": sql}
+        if params:
+            req["params"] = list(params)
+        reply = await self._channel.request(req)
+        cursor = RemoteCursor(self._channel, reply["columns"])
+        try:
+            yield cursor
+        finally:
+            await cursor.close()
+
+    async def interrupt(self) -> None:
+        """Abort the running statement by closing the channel.
+
+        The helper sees its input end, interrupts the statement and exits;
+        the pool replaces the channel on the next checkout.
+        """
+        self._channel.close()
+
+
+class RemoteSqlitePool:
+    """Read-only SQLite access that runs queries on the SSH host itself.
+
+    Each of the N channels is a separate helper process multiplexed on the
+    one SSH connection, so queries run in parallel like local readers.
+    Nothing is downloaded: time to first result does not depend on the
+    size of the file.
+    """
+
+    def __init__(
+        self, client: paramiko.SSHClient, path: str, readers: int, acquire_timeout: float = 0.0
+    ) -> None:
+        self.client = client
+        self.path = path
+        self.size = max(1, readers)
+        self._idle: asyncio.Queue[_Channel] = asyncio.Queue()
+        self._all: list[_Channel] = []
+        self.acquire_timeout = acquire_timeout
+        self.metrics = PoolMetrics()
+
+    async def _open_channel(self) -> _Channel:
+        channel = await asyncio.to_thread(_Channel, self.client, self.path)
+        self._all.append(channel)
+        return channel
+
+    async def open(self) -> None:
+        first = await self._open_channel()
+        print(
+            f"[db-mcp] Remote SQLite helper running (SQLite {first.sqlite_version}).",
+            file=sys.stderr,
+        )
+        self._idle.put_nowait(first)
+        for _ in range(self.size - 1):
+            self._idle.put_nowait(await self._open_channel())
+
+    @asynccontextmanager
+    async def acquire(self, write: bool = False) -> AsyncIterator[RemoteSqlite]:
+        assert not write, "Remote SQLite is read-only"
+        channel = await self.metrics.acquire(self._idle.get(), self.acquire_timeout)
+        try:
+            if channel.broken:
+                # Replace a channel whose framing was interrupted; if that
+                # fails, the broken one goes back and is retried next time.
+                replacement = await self._open_channel()
+                channel.close()
+                self._all.remove(channel)
+                channel = replacement
+            yield RemoteSqlite(channel)
+        finally:
+            self._idle.put_nowait(channel)
+
+    def stats(self) -> dict:
+        return self.metrics.stats(len(self._all), self._idle.qsize(), self.size)
+
+    async def close(self) -> None:
+        for channel in self._all:
+            channel.close()
+        self._all.clear()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import weakref
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class StatementCache:
+    """Per-connection LRU of prepared statements, keyed by SQL text.
+
+    Prepared statements belong to one server session, so each pooled
+    connection has its own LRU of up to ``size`` entries; hit, miss and
+    eviction counters are shared.  Entries go away with their connection.
+
+    :meth:`get` stores what *prepare* returns (asyncpg).  :meth:`seen` only
+    keeps the bookkeeping, for drivers that cache statements themselves
+    with the same LRU policy (sqlite3's ``cached_statements``).
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._conns: weakref.WeakKeyDictionary[Any, OrderedDict[str, Any]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0
+
+    def _lookup(self, conn: Any, sql: str) -> tuple[OrderedDict[str, Any], Any]:
+        entries = self._conns.get(conn)
+        if entries is None:
+            entries = self._conns[conn] = OrderedDict()
+        stmt = entries.get(sql)
+        if stmt is not None:
+            entries.move_to_end(sql)
+            self.hits += 1
+        else:
+            self.misses += 1
+        return entries, stmt
+
+    def _store(self, entries: OrderedDict[str, Any], sql: str, stmt: Any) -> None:
+        entries[sql] = stmt
+        if len(entries) > self.size:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    async def get(self, conn: Any, sql: str, prepare: Callable[[], Awaitable[T]]) -> T:
+        """The statement for *sql* on *conn*, prepared with *prepare* on a miss."""
+        entries, stmt = self._lookup(conn, sql)
+        if stmt is None:
+            stmt = await prepare()
+            self._store(entries, sql, stmt)
+        return stmt
+
+    def discard(self, conn: Any, sql: str) -> None:
+        """Drop the entry for *sql* on *conn*, e.g. after the schema changed under it."""
+        entries = self._conns.get(conn)
+        if entries is not None:
+            entries.pop(sql, None)
+
+    def seen(self, conn: Any, sql: str) -> None:
+        """Count *sql* running on *conn* against a driver-managed cache."""
+        if not self.enabled:
+            return
+        entries, stmt = self._lookup(conn, sql)
+        if stmt is None:
+            self._store(entries, sql, True)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Awaitable, TypeVar
+
+from db_mcp.metrics import phase
+
+T = TypeVar("T")
+
+# Upper bounds (seconds) of the acquire-wait histogram buckets.
+_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+class PoolTimeout(Exception):
+    """No pooled connection became free within the acquire timeout.
+
+    Deliberately not a :class:`TimeoutError`: that is an :class:`OSError`
+    subclass, which reconnect handlers treat as a lost connection, and a
+    saturated pool is not a broken one.
+    """
+
+
+def _bucket_label(bound: float) -> str:
+    return f"{bound * 1000:g}ms" if bound < 1 else f"{bound:g}s"
+
+
+class PoolMetrics:
+    """Checkout counters for a connection pool.
+
+    Tracks how many callers are waiting for a connection and how long each
+    checkout waited.  Pool size and idle counts come from the pool itself.
+    """
+
+    def __init__(self) -> None:
+        self.waiters = 0
+        self.acquired = 0
+        self.timeouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._buckets = [0] * (len(_WAIT_BUCKETS) + 1)
+
+    async def acquire(self, waiter: Awaitable[T], timeout: float) -> T:
+        """Await the checkout *waiter*, giving up after *timeout* seconds (0 = no limit)."""
+        self.waiters += 1
+        start = time.perf_counter()
+        try:
+            with phase("acquire"):
+                if timeout:
+                    conn = await asyncio.wait_for(waiter, timeout)
+                else:
+                    conn = await waiter
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise PoolTimeout(
+                f"No database connection became free within {timeout:g}s "
+                "(see DB_POOL_MAX_SIZE / DB_POOL_ACQUIRE_TIMEOUT)."
+            ) from None
+        finally:
+            self.waiters -= 1
+        self._observe(time.perf_counter() - start)
+        return conn
+
+    def _observe(self, waited: float) -> None:
+        self.acquired += 1
+        self._wait_total += waited
+        self._wait_max = max(self._wait_max, waited)
+        for i, bound in enumerate(_WAIT_BUCKETS):
+            if waited <= bound:
+                self._buckets[i] += 1
+                return
+        self._buckets[-1] += 1
+
+    def stats(self, size: int, idle: int, max_size: int, min_size: int | None = None) -> dict:
+        info: dict = {"size": size}
+        if min_size is not None:
+            info["minSize"] = min_size
+        histogram = {_bucket_label(b): n for b, n in zip(_WAIT_BUCKETS, self._buckets)}
+        histogram["+Inf"] = self._buckets[-1]
+        info.update(
+            maxSize=max_size,
+            inUse=size - idle,
+            idle=idle,
+            waiters=self.waiters,
+            acquired=self.acquired,
+            timeouts=self.timeouts,
+            acquireWait={
+                "meanMs": round(self._wait_total / self.acquired * 1000, 3) if self.acquired else 0.0,
+                "maxMs": round(self._wait_max * 1000, 3),
+                "histogram": histogram,
+            },
+        )
+        return info
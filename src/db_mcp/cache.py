@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import re
+import sys
+import time
+from collections import OrderedDict
+from typing import Hashable
+
+# Quoted literals are kept verbatim; whitespace runs outside them collapse.
+_SQL_WS_RE = re.compile(
+    r"""('(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|`[^`]*`)|\s+""",
+    re.DOTALL,
+)
+
+
+def normalize_sql(sql: str) -> str:
+    """Canonical form of *sql* for cache keys: collapsed whitespace, no trailing ';'."""
+    collapsed = _SQL_WS_RE.sub(lambda m: m.group(1) or " ", sql)
+    return collapsed.strip().rstrip(";").rstrip()
+
+
+class ResultCache:
+    """In-process LRU cache of encoded tool responses.
+
+    Bounded by the memory held by cached strings; each entry expires
+    ``ttl`` seconds after it was stored.  Writes through this server call
+    :meth:`invalidate`, which drops everything: triggers, views and foreign
+    key cascades make per-table invalidation unsafe to infer from SQL text.
+    A ``ttl`` or ``max_bytes`` of 0 disables the cache.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float) -> None:
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, int, str]] = OrderedDict()
+        self._bytes = 0
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 and self.ttl > 0
+
+    def get(self, key: Hashable) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires, size, value = entry
+        if time.monotonic() >= expires:
+            del self._entries[key]
+            self._bytes -= size
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: str, generation: int) -> None:
+        """Store *value* unless the cache was invalidated since *generation*.
+
+        Callers read :attr:`generation` before running the query, so a result
+        computed concurrently with a write is never cached.
+        """
+        if not self.enabled or generation != self.generation:
+            return
+        size = sys.getsizeof(value)
+        if size > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+        self._entries[key] = (time.monotonic() + self.ttl, size, value)
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, (_, evicted, _) = self._entries.popitem(last=False)
+            self._bytes -= evicted
+            self.evictions += 1
+
+    def invalidate(self) -> None:
+        self.generation += 1
+        if self._entries:
+            self.invalidations += 1
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "maxBytes": self.max_bytes,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
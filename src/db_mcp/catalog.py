@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import Any, Hashable
+
+
+class SchemaCatalog:
+    """In-memory schema snapshot, valid for as long as its fingerprint is.
+
+    The fingerprint is a cheap value that changes whenever the schema does
+    (SQLite ``schema_version``, a hash over catalog rows for MySQL and
+    PostgreSQL), so a full catalog extraction only runs after DDL.
+    """
+
+    def __init__(self) -> None:
+        self.fingerprint: Hashable | None = None
+        self.snapshot: dict | None = None
+        self.hits = 0
+        self.refreshes = 0
+
+    def lookup(self, fingerprint: Hashable) -> dict | None:
+        if self.snapshot is not None and fingerprint == self.fingerprint:
+            self.hits += 1
+            return self.snapshot
+        return None
+
+    def store(self, fingerprint: Hashable, snapshot: dict) -> dict:
+        self.fingerprint = fingerprint
+        self.snapshot = snapshot
+        self.refreshes += 1
+        return snapshot
+
+    def stats(self) -> dict:
+        return {
+            "tables": len(self.snapshot["tables"]) if self.snapshot else 0,
+            "hits": self.hits,
+            "refreshes": self.refreshes,
+        }
+
+
+def new_table() -> dict[str, Any]:
+    return {"columns": [], "primaryKey": [], "foreignKeys": [], "indexes": []}
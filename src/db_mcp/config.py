@@ -2,7 +2,59 @@ from __future__ import annotations
 
 import getpass
 import os
+import re
 from dataclasses import dataclass
+from urllib.parse import parse_qsl, urlsplit
+
+# One DB_REPLICAS entry: [ssh_user@ssh_host[:ssh_port]/]host[:port]
+_REPLICA_RE = re.compile(
+    r"^(?:(?:(?P<ssh_user>[^@/\s]+)@)?(?P<ssh_host>[^@:/\s]+)(?::(?P<ssh_port>\d+))?/)?"
+    r"(?P<host>[^@:/\s]+)(?::(?P<port>\d+))?$"
+)
+# PyMongo's maxPoolSize when DB_URL does not set one (or sets 0, no limit).
+_MONGO_DEFAULT_POOL_SIZE = 100
+
+
+@dataclass(frozen=True)
+class Replica:
+    """A read replica, optionally reached through its own SSH tunnel."""
+
+    host: str
+    port: int
+    ssh_host: str = ""
+    ssh_port: int = 22
+    ssh_user: str = ""
+
+    @property
+    def has_ssh_tunnel(self) -> bool:
+        return bool(self.ssh_host)
+
+    @property
+    def label(self) -> str:
+        if self.has_ssh_tunnel:
+            return f"{self.ssh_user}@{self.ssh_host}:{self.ssh_port}/{self.host}:{self.port}"
+        return f"{self.host}:{self.port}"
+
+
+def _parse_replicas(value: str, db_port: int, ssh_user: str) -> tuple[Replica, ...]:
+    replicas = []
+    for entry in filter(None, (e.strip() for e in value.split(","))):
+        m = _REPLICA_RE.match(entry)
+        if m is None:
+            raise RuntimeError(
+                f"Invalid DB_REPLICAS entry: '{entry}'.\n"
+                "Use [ssh_user@ssh_host[:ssh_port]/]host[:port], separated by commas."
+            )
+        replicas.append(
+            Replica(
+                host=m["host"],
+                port=int(m["port"] or db_port),
+                ssh_host=m["ssh_host"] or "",
+                ssh_port=int(m["ssh_port"] or 22),
+                ssh_user=(m["ssh_user"] or ssh_user) if m["ssh_host"] else "",
+            )
+        )
+    return tuple(replicas)
 
 
 @dataclass(frozen=True)
@@ -30,6 +82,62 @@ class Config:
     ssh_key: str
     ssh_password: str
 
+    # Connection lifecycle
+    ping_interval: float = 30.0  # seconds idle before a pooled conn is pinged
+    keepalive_interval: float = 30.0  # background idle-conn check period, 0 = off
+    lazy_connect: bool = False  # answer the MCP handshake before connecting
+    timeout: float = 0.0  # statement timeout in seconds, 0 = no limit
+
+    # MySQL / PostgreSQL connection pool
+    pool_min_size: int = 1
+    pool_max_size: int = 10
+    pool_max_idle: float = 300.0  # close idle conns after this many seconds, 0 = never
+    pool_max_lifetime: float = 0.0  # replace conns older than this, 0 = never
+    pool_acquire_timeout: float = 0.0  # wait for a free conn (all pools), 0 = forever
+    statement_cache_size: int = 100  # prepared statements per PG/SQLite conn, 0 = off
+
+    # Read replicas (MySQL / PostgreSQL)
+    replicas: tuple[Replica, ...] = ()
+    replica_max_lag: float = 0.0  # seconds behind the primary, 0 = not checked
+    replica_check_interval: float = 10.0  # seconds between replica health checks
+
+    # Admission control of tool calls (0 = derived from the pool size)
+    max_concurrent_reads: int = 0
+    max_concurrent_writes: int = 0
+    max_queued: int = 100  # calls waiting for a slot before new ones are rejected
+
+    # Per-tool latency / throughput instrumentation
+    metrics: bool = False
+    metrics_file: str = ""  # Prometheus text dump, rewritten periodically
+
+    # Slow-query log (0 = off); statement stats are always kept
+    slow_query_ms: float = 1000.0
+    slow_query_log: str = ""  # JSON lines file, stderr when empty
+
+    # Query result limits (0 = unlimited)
+    max_rows: int = 1000
+    max_bytes: int = 1_048_576
+
+    # Default response encoding: "json", "columnar" or "csv"
+    output_format: str = "json"
+
+    # Result cache for read tools (0 disables)
+    cache_ttl: float = 60.0
+    cache_max_bytes: int = 16 * 1024 * 1024
+
+    # Paginated query cursors
+    cursor_idle_timeout: float = 300.0
+    max_cursors: int = 8  # 0 = query_page disabled
+
+    # SQLite pool
+    sqlite_readers: int = 4
+    sqlite_wal: bool = True
+    # Local mirrors of remote (SSH) SQLite databases
+    sqlite_cache_dir: str = "~/.cache/db-mcp"
+    sqlite_cache_max_bytes: int = 10 * 1024**3  # 0 = unlimited
+    sqlite_cache_verify: bool = False  # compare block hashes even if size/mtime match
+    sqlite_remote: bool = False  # query over SSH instead of mirroring (read-only)
+
     @property
     def is_mysql(self) -> bool:
         return self.db_type == "mysql"
@@ -50,6 +158,14 @@ class Config:
     def is_read_only(self) -> bool:
         return self.db_mode == "read-only"
 
+    @property
+    def mongo_pool_size(self) -> int:
+        """Connections per server in the MongoDB client pool (maxPoolSize in DB_URL)."""
+        for key, value in parse_qsl(urlsplit(self.db_url).query):
+            if key.lower() == "maxpoolsize" and value.isdigit() and int(value) > 0:
+                return int(value)
+        return _MONGO_DEFAULT_POOL_SIZE
+
     @property
     def has_ssh_tunnel(self) -> bool:
         return bool(self.ssh_host)
@@ -93,6 +209,15 @@ class Config:
         db_path = os.environ.get("DB_PATH", "")
         if db_type == "sqlite" and not db_path:
             missing.append("DB_PATH")
+        sqlite_readers = int(os.environ.get("DB_SQLITE_READERS", "4"))
+        sqlite_wal = os.environ.get("DB_SQLITE_WAL", "true").lower() in ("1", "true", "yes")
+        sqlite_cache_dir = os.environ.get(
+            "DB_SQLITE_CACHE_DIR",
+            os.path.join(os.environ.get("XDG_CACHE_HOME", "~/.cache"), "db-mcp"),
+        )
+        sqlite_cache_max_bytes = int(os.environ.get("DB_SQLITE_CACHE_MAX_BYTES", str(10 * 1024**3)))
+        sqlite_cache_verify = os.environ.get("DB_SQLITE_CACHE_VERIFY", "false").lower() in ("1", "true", "yes")
+        sqlite_remote = os.environ.get("DB_SQLITE_REMOTE", "false").lower() in ("1", "true", "yes")
 
         # SSH tunnel vars
         ssh_host = os.environ.get("SSH_HOST", "")
@@ -101,6 +226,61 @@ class Config:
         ssh_key = os.environ.get("SSH_KEY", "")
         ssh_password = os.environ.get("SSH_PASSWORD", "")
 
+        # Instrumentation (a dump file implies metrics on)
+        metrics_file = os.environ.get("DB_METRICS_FILE", "")
+        metrics = bool(metrics_file) or os.environ.get("DB_METRICS", "false").lower() in ("1", "true", "yes")
+
+        # Slow-query log
+        slow_query_ms = float(os.environ.get("DB_SLOW_QUERY_MS", "1000"))
+        slow_query_log = os.environ.get("DB_SLOW_QUERY_LOG", "")
+
+        # Query result limits
+        max_rows = int(os.environ.get("DB_MAX_ROWS", "1000"))
+        max_bytes = int(os.environ.get("DB_MAX_BYTES", "1048576"))
+        output_format = os.environ.get("DB_OUTPUT_FORMAT", "json").lower()
+        if output_format not in ("json", "columnar", "csv"):
+            raise RuntimeError(
+                "DB_OUTPUT_FORMAT must be 'json', 'columnar', or 'csv'.\n"
+                f"Got: '{output_format}'"
+            )
+        cache_ttl = float(os.environ.get("DB_CACHE_TTL", "60"))
+        cache_max_bytes = int(os.environ.get("DB_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+        cursor_idle_timeout = float(os.environ.get("DB_CURSOR_IDLE_TIMEOUT", "300"))
+        max_cursors = int(os.environ.get("DB_MAX_CURSORS", "8"))
+        if max_cursors < 0:
+            raise RuntimeError(f"DB_MAX_CURSORS must be 0 or more. Got: {max_cursors}")
+
+        # Connection lifecycle
+        ping_interval = float(os.environ.get("DB_PING_INTERVAL", "30"))
+        keepalive_interval = float(os.environ.get("DB_KEEPALIVE_INTERVAL", "30"))
+        lazy_connect = os.environ.get("DB_LAZY_CONNECT", "false").lower() in ("1", "true", "yes")
+        timeout = float(os.environ.get("DB_TIMEOUT", "0"))
+
+        # Connection pool
+        pool_min_size = int(os.environ.get("DB_POOL_MIN_SIZE", "1"))
+        pool_max_size = int(os.environ.get("DB_POOL_MAX_SIZE", "10"))
+        pool_max_idle = float(os.environ.get("DB_POOL_MAX_IDLE", "300"))
+        pool_max_lifetime = float(os.environ.get("DB_POOL_MAX_LIFETIME", "0"))
+        pool_acquire_timeout = float(os.environ.get("DB_POOL_ACQUIRE_TIMEOUT", "0"))
+        statement_cache_size = int(os.environ.get("DB_STATEMENT_CACHE_SIZE", "100"))
+        if pool_max_size < 1 or not 0 <= pool_min_size <= pool_max_size:
+            raise RuntimeError(
+                "DB_POOL_MIN_SIZE and DB_POOL_MAX_SIZE must satisfy 0 <= min <= max, max >= 1.\n"
+                f"Got: min={pool_min_size}, max={pool_max_size}"
+            )
+        max_concurrent_reads = int(os.environ.get("DB_MAX_CONCURRENT_READS", "0"))
+        max_concurrent_writes = int(os.environ.get("DB_MAX_CONCURRENT_WRITES", "0"))
+        max_queued = int(os.environ.get("DB_MAX_QUEUED", "100"))
+        if min(max_concurrent_reads, max_concurrent_writes, max_queued) < 0:
+            raise RuntimeError(
+                "DB_MAX_CONCURRENT_READS, DB_MAX_CONCURRENT_WRITES and DB_MAX_QUEUED "
+                "must be 0 or more."
+            )
+        if statement_cache_size < 0:
+            raise RuntimeError(
+                f"DB_STATEMENT_CACHE_SIZE must be 0 or more. Got: {statement_cache_size}"
+            )
+
         if ssh_host:
             if db_type == "mongodb":
                 raise RuntimeError(
@@ -114,6 +294,32 @@ class Config:
                     "Set SSH_KEY (path to private key) or SSH_PASSWORD."
                 )
 
+        replicas = _parse_replicas(os.environ.get("DB_REPLICAS", ""), db_port, ssh_user)
+        replica_max_lag = float(os.environ.get("DB_REPLICA_MAX_LAG", "0"))
+        replica_check_interval = float(os.environ.get("DB_REPLICA_CHECK_INTERVAL", "10"))
+        if replicas:
+            if db_type not in ("mysql", "postgresql"):
+                raise RuntimeError(
+                    "DB_REPLICAS is only supported for MySQL and PostgreSQL.\n"
+                    "For MongoDB, set readPreference in DB_URL instead."
+                )
+            if replica_check_interval <= 0:
+                raise RuntimeError(
+                    f"DB_REPLICA_CHECK_INTERVAL must be positive. Got: {replica_check_interval}"
+                )
+            if any(r.has_ssh_tunnel for r in replicas) and not ssh_key and not ssh_password:
+                raise RuntimeError(
+                    "DB_REPLICAS uses SSH but no authentication provided.\n"
+                    "Set SSH_KEY (path to private key) or SSH_PASSWORD."
+                )
+
+        if sqlite_remote and db_type == "sqlite":
+            if not ssh_host or db_mode != "read-only":
+                raise RuntimeError(
+                    "DB_SQLITE_REMOTE requires SSH_HOST and DB_MODE=read-only.\n"
+                    "Remote queries run against the live file and never write to it."
+                )
+
         if missing:
             raise RuntimeError(
                 f"Missing required environment variables: {', '.join(missing)}.\n"
@@ -142,6 +348,39 @@ class Config:
             ssh_user=ssh_user,
             ssh_key=ssh_key,
             ssh_password=ssh_password,
+            ping_interval=ping_interval,
+            keepalive_interval=keepalive_interval,
+            lazy_connect=lazy_connect,
+            timeout=timeout,
+            pool_min_size=pool_min_size,
+            pool_max_size=pool_max_size,
+            pool_max_idle=pool_max_idle,
+            pool_max_lifetime=pool_max_lifetime,
+            pool_acquire_timeout=pool_acquire_timeout,
+            statement_cache_size=statement_cache_size,
+            replicas=replicas,
+            replica_max_lag=replica_max_lag,
+            replica_check_interval=replica_check_interval,
+            max_concurrent_reads=max_concurrent_reads,
+            max_concurrent_writes=max_concurrent_writes,
+            max_queued=max_queued,
+            max_rows=max_rows,
+            metrics=metrics,
+            metrics_file=metrics_file,
+            slow_query_ms=slow_query_ms,
+            slow_query_log=slow_query_log,
+            max_bytes=max_bytes,
+            output_format=output_format,
+            cache_ttl=cache_ttl,
+            cache_max_bytes=cache_max_bytes,
+            cursor_idle_timeout=cursor_idle_timeout,
+            max_cursors=max_cursors,
+            sqlite_readers=sqlite_readers,
+            sqlite_wal=sqlite_wal,
+            sqlite_cache_dir=sqlite_cache_dir,
+            sqlite_cache_max_bytes=sqlite_cache_max_bytes,
+            sqlite_cache_verify=sqlite_cache_verify,
+            sqlite_remote=sqlite_remote,
         )
 
 
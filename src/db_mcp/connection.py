@@ -1,318 +1,429 @@
 from __future__ import annotations
 
-import os
-import sqlite3
-import struct
+import asyncio
 import sys
-import tempfile
+import time
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator
+from typing import IO, TYPE_CHECKING, Any, AsyncContextManager, AsyncIterator, Awaitable, Callable
 
-import aiosqlite
-import paramiko
-import aiomysql
-import asyncpg
-import motor.motor_asyncio
-from pymysql.constants import COMMAND
+from db_mcp.config import Config, Replica
 
-# Compatibility shim: paramiko >=4 removed DSSKey (DSA is deprecated).
-# sshtunnel 0.4.0 still references it, so we provide a stub to prevent crashes.
-if not hasattr(paramiko, "DSSKey"):
+# Drivers (and the SSH stack) are imported in connect(), only for the
+# configured backend, so start-up never pays for the ones it will not use.
+if TYPE_CHECKING:
+    import aiomysql
+    import aiosqlite
+    import asyncpg
+    import paramiko
+    from sshtunnel import SSHTunnelForwarder
 
-    class _DSSKeyStub:
-        """Stub that makes sshtunnel skip DSA keys gracefully."""
+    from db_mcp.backends.mongodb import MongoClient
+    from db_mcp.backends.mysql import MySQLPool
+    from db_mcp.backends.postgresql import PostgresPool
+    from db_mcp.backends.sqlite import SqlitePool
+    from db_mcp.backends.sqlite_remote import RemoteSqlitePool
+    from db_mcp.replicas import ReplicaNode, ReplicaSet
+    from db_mcp.sqlite_sync import SqliteMirror
 
-        @classmethod
-        def from_private_key_file(cls, *a: Any, **kw: Any) -> None:
-            raise paramiko.SSHException("DSA keys not supported")
-
-    paramiko.DSSKey = _DSSKeyStub  # type: ignore[attr-defined]
-
-from sshtunnel import SSHTunnelForwarder
-
-from db_mcp.config import Config
-
-# MySQL COM_SET_OPTION argument to turn off multi-statement support.
-_MULTI_STATEMENTS_OFF = struct.pack("<H", 1)
-
-
-class _PgReconnectNeeded(Exception):
-    """Internal sentinel: raised when a PG pool ping fails inside acquire_pg."""
+Endpoint = Callable[[], Awaitable[tuple[str, int, Callable[[], Awaitable[None]] | None]]]
 
 
 class Connection:
     def __init__(self, config: Config) -> None:
         self.config = config
-        self._pool: aiomysql.Pool | None = None
-        self._pg_pool: asyncpg.Pool | None = None
-        self._mongo_client: motor.motor_asyncio.AsyncIOMotorClient | None = None
-        self._mongo_db: Any = None
+        self._mysql: MySQLPool | None = None
+        self._pg: PostgresPool | None = None
+        self._mongo: MongoClient | None = None
         self._sqlite_path: str | None = None
+        self._sqlite_pool: SqlitePool | RemoteSqlitePool | None = None
         self._ssh_client: paramiko.SSHClient | None = None
+        self._mirror: SqliteMirror | None = None
+        self._mirror_lock: IO | None = None
         self._tunnel: SSHTunnelForwarder | None = None
-        # Track connections where multi-statements have been disabled.
-        self._safe_conns: set[int] = set()
+        self._replicas: ReplicaSet | None = None
+        self._replica_tunnels: set[SSHTunnelForwarder] = set()
+        # Pool each checked-out read connection came from, when routed.
+        self._owners: dict[Any, Any] = {}
+        # Lifecycle: "disconnected" -> "connecting" -> "connected" | "failed".
+        self.state = "disconnected"
+        self.connect_seconds: float | None = None
+        self.last_error: str | None = None
+        self._connect_task: asyncio.Task[None] | None = None
 
     @property
     def pool(self) -> aiomysql.Pool:
-        assert self._pool is not None, "MySQL pool not initialized"
-        return self._pool
+        assert self._mysql is not None, "MySQL pool not initialized"
+        return self._mysql.pool
 
     @property
     def pg_pool(self) -> asyncpg.Pool:
-        assert self._pg_pool is not None, "PostgreSQL pool not initialized"
-        return self._pg_pool
+        assert self._pg is not None, "PostgreSQL pool not initialized"
+        return self._pg.pool
 
     @property
     def db(self) -> Any:
-        assert self._mongo_db is not None, "MongoDB database not initialized"
-        return self._mongo_db
+        assert self._mongo is not None, "MongoDB database not initialized"
+        return self._mongo.db
 
-    def _start_tunnel(self) -> tuple[str, int]:
-        """Open an SSH tunnel and return (local_host, local_port)."""
-        cfg = self.config
-        kwargs: dict[str, Any] = {
-            "ssh_username": cfg.ssh_user,
-            "remote_bind_address": (cfg.db_host, cfg.db_port),
-            "local_bind_address": ("127.0.0.1", 0),
-        }
-        if cfg.ssh_key:
-            kwargs["ssh_pkey"] = os.path.expanduser(cfg.ssh_key)
-        if cfg.ssh_password:
-            kwargs["ssh_password"] = cfg.ssh_password
+    async def _start_tunnel(self) -> SSHTunnelForwarder:
+        """Open an SSH tunnel (in a worker thread) and make it the current one."""
+        from db_mcp import ssh
 
-        print(
-            f"[db-mcp] Opening SSH tunnel via {cfg.ssh_user}@{cfg.ssh_host}:{cfg.ssh_port}"
-            f" -> {cfg.db_host}:{cfg.db_port}...",
-            file=sys.stderr,
-        )
-        self._tunnel = SSHTunnelForwarder(
-            (cfg.ssh_host, cfg.ssh_port),
-            **kwargs,
-        )
-        self._tunnel.start()
-        local_host = "127.0.0.1"
-        local_port = self._tunnel.local_bind_port
-        print(
-            f"[db-mcp] SSH tunnel established on {local_host}:{local_port}.",
-            file=sys.stderr,
+        self._tunnel = await asyncio.to_thread(ssh.start_tunnel, self.config)
+        return self._tunnel
+
+    async def _endpoint(self) -> tuple[str, int, Callable[[], Awaitable[None]] | None]:
+        """Open a route to the database server: ``(host, port, release)``.
+
+        With SSH every call starts a fresh tunnel, and *release* stops it
+        once no connection uses it any more; the previous tunnel is left
+        running so connections still open through it can finish.  Without
+        SSH *release* is None.
+        """
+        if not self.config.has_ssh_tunnel:
+            return self.config.db_host, self.config.db_port, None
+        tunnel = await self._start_tunnel()
+
+        async def release() -> None:
+            if self._tunnel is tunnel:
+                self._tunnel = None
+            await asyncio.to_thread(tunnel.stop)
+
+        return "127.0.0.1", tunnel.local_bind_port, release
+
+    def _replica_endpoint(self, replica: Replica) -> Endpoint:
+        """Like :meth:`_endpoint`, for a read replica behind its own optional tunnel."""
+
+        async def endpoint() -> tuple[str, int, Callable[[], Awaitable[None]] | None]:
+            if not replica.has_ssh_tunnel:
+                return replica.host, replica.port, None
+            from db_mcp import ssh
+
+            tunnel = await asyncio.to_thread(ssh.start_tunnel, self.config, replica)
+            self._replica_tunnels.add(tunnel)
+
+            async def release() -> None:
+                self._replica_tunnels.discard(tunnel)
+                await asyncio.to_thread(tunnel.stop)
+
+            return "127.0.0.1", tunnel.local_bind_port, release
+
+        return endpoint
+
+    def _replica_node(self, replica: Replica) -> ReplicaNode:
+        from db_mcp.replicas import ReplicaNode
+
+        endpoint = self._replica_endpoint(replica)
+        if self.config.is_postgresql:
+            from db_mcp.backends.postgresql import PostgresPool
+
+            pg = PostgresPool(self.config, endpoint)
+            return ReplicaNode(replica.label, pg, pg.open)
+
+        from db_mcp.backends.mysql import MySQLPool
+
+        mysql = MySQLPool(self.config)
+
+        async def open_mysql() -> None:
+            host, port, release = await endpoint()
+            try:
+                await mysql.open(host, port)
+            except BaseException:
+                if release is not None:
+                    await release()
+                raise
+
+        return ReplicaNode(replica.label, mysql, open_mysql)
+
+    async def _open_replicas(self) -> None:
+        """Open the read replicas; any that fail stay out of rotation until a later check."""
+        from db_mcp.replicas import ReplicaSet
+
+        nodes = [self._replica_node(r) for r in self.config.replicas]
+        self._replicas = ReplicaSet(
+            nodes, self.config.replica_max_lag, self.config.replica_check_interval
         )
-        return local_host, local_port
+        await self._replicas.check_all()
 
     async def connect(self) -> None:
-        if self.config.is_sqlite:
-            await self._connect_sqlite()
+        self.state = "connecting"
+        started = time.monotonic()
+        try:
+            await self._open()
+        except Exception as exc:
+            self.state = "failed"
+            self.last_error = str(exc)
+            await self._discard_ssh()
+            raise
+        self.connect_seconds = time.monotonic() - started
+        self.state = "connected"
+        self.last_error = None
+
+    def start(self) -> None:
+        """Connect in a background task (again, if the last attempt failed)."""
+        task = self._connect_task
+        if task is None or (task.done() and self.state != "connected"):
+            self._connect_task = asyncio.create_task(self.connect())
+            self._connect_task.add_done_callback(self._log_connect_failure)
+
+    @staticmethod
+    def _log_connect_failure(task: asyncio.Task[None]) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            print(f"[db-mcp] Connection failed: {task.exception()}", file=sys.stderr)
+
+    async def ready(self) -> None:
+        """Wait for the background connection, retrying a failed attempt."""
+        if self.state == "connected":
             return
+        self.start()
+        assert self._connect_task is not None
+        # Shielded: a cancelled tool call must not abort the shared connect.
+        await asyncio.shield(self._connect_task)
 
-        host = self.config.db_host
-        port = self.config.db_port
-
-        if self.config.has_ssh_tunnel:
-            host, port = self._start_tunnel()
-
-        if self.config.is_mysql:
-            await self._connect_mysql(host, port)
+    async def _open(self) -> None:
+        if self.config.is_sqlite:
+            await self._connect_sqlite()
+        elif self.config.is_mysql:
+            from db_mcp.backends.mysql import MySQLPool
+
+            self._mysql = MySQLPool(self.config)
+            host, port, _ = await self._endpoint()
+            await self._mysql.open(host, port)
+            if self.config.replicas:
+                await self._open_replicas()
         elif self.config.is_postgresql:
-            await self._connect_postgresql(host, port)
+            from db_mcp.backends.postgresql import PostgresPool
+
+            self._pg = PostgresPool(self.config, self._endpoint)
+            await self._pg.open()
+            if self.config.replicas:
+                await self._open_replicas()
         else:
-            await self._connect_mongodb()
+            from db_mcp.backends.mongodb import MongoClient
 
-    # ------------------------------------------------------------------
-    # MySQL helpers
-    # ------------------------------------------------------------------
+            if self.config.has_ssh_tunnel:
+                await self._start_tunnel()
+            self._mongo = MongoClient(self.config)
+            await self._mongo.open()
+
+    @asynccontextmanager
+    async def _acquire_read(self, primary: Any) -> AsyncIterator[Any]:
+        """Check out a read connection from a replica, or *primary* as fallback."""
+        assert self._replicas is not None
+        async with self._replicas.acquire(primary) as (conn, pool):
+            self._owners[conn] = pool
+            try:
+                yield conn
+            finally:
+                del self._owners[conn]
 
-    async def _disable_multi_statements(self, conn: aiomysql.Connection) -> None:
-        """Disable multi-statement query support on *conn*.
+    def acquire_mysql(self, read: bool = False) -> AsyncContextManager[aiomysql.Connection]:
+        """Acquire a MySQL connection with multi-statements disabled.
 
-        aiomysql unconditionally sets CLIENT_MULTI_STATEMENTS during the
-        handshake.  We send COM_SET_OPTION(MYSQL_OPTION_MULTI_STATEMENTS_OFF)
-        to instruct the server to reject any query containing multiple
-        statements, closing the protocol-level loophole.
+        With *read* the connection may come from a read replica; only pass
+        it for statements known not to write.
+        """
+        assert self._mysql is not None, "MySQL pool not initialized"
+        if read and self._replicas is not None:
+            return self._acquire_read(self._mysql)
+        return self._mysql.acquire()
+
+    async def set_mysql_statement_timeout(
+        self, conn: aiomysql.Connection, seconds: float | None
+    ) -> None:
+        assert self._mysql is not None, "MySQL pool not initialized"
+        await self._owners.get(conn, self._mysql).set_statement_timeout(conn, seconds)
+
+    async def kill_mysql_query(self, conn: aiomysql.Connection) -> None:
+        """Stop the statement running on *conn* (KILL QUERY from another connection)."""
+        assert self._mysql is not None, "MySQL pool not initialized"
+        await self._owners.get(conn, self._mysql).kill_query(conn)
+
+    def acquire_pg(self, read: bool = False) -> AsyncContextManager[asyncpg.Connection]:
+        """Acquire a PostgreSQL connection, reconnecting if it went stale.
+
+        With *read* the connection may come from a read replica; only pass
+        it for statements known not to write.
         """
-        conn_id = id(conn)
-        if conn_id in self._safe_conns:
+        assert self._pg is not None, "PostgreSQL pool not initialized"
+        if read and self._replicas is not None:
+            return self._acquire_read(self._pg)
+        return self._pg.acquire()
+
+    def acquire_sqlite(self, write: bool = False) -> AsyncContextManager[aiosqlite.Connection]:
+        """Acquire a pooled aiosqlite connection (the writer if *write*)."""
+        assert self._sqlite_pool is not None, "SQLite pool not initialized"
+        return self._sqlite_pool.acquire(write=write)
+
+    async def prepare_pg(
+        self, conn: asyncpg.Connection, sql: str
+    ) -> asyncpg.prepared_stmt.PreparedStatement | None:
+        """Cached prepared statement for *sql* on *conn* (None if the cache is off)."""
+        assert self._pg is not None, "PostgreSQL pool not initialized"
+        return await self._owners.get(conn, self._pg).prepare(conn, sql)
+
+    def forget_pg_statement(self, conn: asyncpg.Connection, sql: str) -> None:
+        """Drop a cached statement invalidated by a schema change."""
+        assert self._pg is not None, "PostgreSQL pool not initialized"
+        self._owners.get(conn, self._pg).forget(conn, sql)
+
+    def sqlite_statement(self, db: aiosqlite.Connection, sql: str) -> None:
+        """Count *sql* against the statement cache of the local SQLite connection *db*."""
+        statements = getattr(self._sqlite_pool, "statements", None)
+        if statements is not None:
+            statements.seen(db, sql)
+
+    def statement_cache_stats(self) -> dict | None:
+        """Hit-rate counters of the prepared-statement cache, if the backend has one."""
+        for backend in (self._pg, self._sqlite_pool):
+            statements = getattr(backend, "statements", None)
+            if statements is not None:
+                return statements.stats()
+        return None
+
+    def pool_stats(self) -> dict | None:
+        """Size, usage and checkout-wait metrics of the open pool, if any."""
+        for backend in (self._mysql, self._pg, self._sqlite_pool):
+            if backend is not None and self.state == "connected":
+                return backend.stats()
+        return None
+
+    def replica_stats(self) -> dict | None:
+        """Health, load and lag of the read replicas, if any are configured."""
+        if self._replicas is None:
+            return None
+        return self._replicas.stats()
+
+    async def monitor_replicas(self) -> None:
+        """Health-check the read replicas every ``replica_check_interval`` seconds.
+
+        Runs until cancelled.  Replicas that failed are retried, and rejoin
+        the rotation once they pass.
+        """
+        if not self.config.replicas:
             return
-        await conn._execute_command(COMMAND.COM_SET_OPTION, _MULTI_STATEMENTS_OFF)
-        pkt = await conn._read_packet()
-        if not pkt.is_ok_packet() and not pkt.is_eof_packet():
-            raise RuntimeError("Failed to disable multi-statement queries")
-        self._safe_conns.add(conn_id)
+        while True:
+            await asyncio.sleep(self.config.replica_check_interval)
+            if self._replicas is not None:
+                await self._replicas.check_all()
 
-    @asynccontextmanager
-    async def acquire_mysql(self) -> AsyncIterator[aiomysql.Connection]:
-        """Acquire a MySQL connection with multi-statements disabled."""
-        async with self.pool.acquire() as conn:
-            self._safe_conns.discard(id(conn))
-            await conn.ping(reconnect=True)
-            await self._disable_multi_statements(conn)
-            yield conn
-
-    async def _connect_mysql(self, host: str, port: int) -> None:
-        print(
-            f"[db-mcp] Connecting to MySQL {host}:{port}"
-            f"/{self.config.db_database} ({self.config.db_mode})...",
-            file=sys.stderr,
-        )
-        self._pool = await aiomysql.create_pool(
-            host=host,
-            port=port,
-            user=self.config.db_user,
-            password=self.config.db_password,
-            db=self.config.db_database,
-            autocommit=True,
-        )
-        # Verify connectivity and disable multi-statement support.
-        async with self.acquire_mysql() as conn:
-            await conn.ping()
-        print("[db-mcp] MySQL connected.", file=sys.stderr)
+    async def keepalive(self) -> None:
+        """Validate idle pooled connections every ``keepalive_interval`` seconds.
+
+        Runs until cancelled.  Errors are logged and never propagate, so a
+        failed round does not stop the loop.
+        """
+        interval = self.config.keepalive_interval
+        if interval <= 0 or not self.config.is_postgresql:
+            return
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if self._pg is not None:
+                    await self._pg.keepalive_round()
+            except Exception as exc:
+                print(f"[db-mcp] Keepalive failed: {exc}", file=sys.stderr)
 
     # ------------------------------------------------------------------
-    # PostgreSQL helpers
+    # SQLite helpers
     # ------------------------------------------------------------------
 
-    @asynccontextmanager
-    async def acquire_pg(self) -> AsyncIterator[asyncpg.Connection]:
-        """Acquire a PostgreSQL connection from the pool.
+    async def _download_sqlite_via_ssh(self) -> str:
+        """Sync the remote SQLite file into its local mirror and return its path."""
+        from db_mcp import ssh
+        from db_mcp.sqlite_sync import evict_mirrors, open_mirror
 
-        Automatically reconnects (including SSH tunnel) if the connection
-        has gone stale (e.g. "Connection reset by peer" after idle timeout).
-        """
-        try:
-            async with self.pg_pool.acquire() as conn:
-                # Ping to detect stale connections before handing off.
-                try:
-                    await conn.fetchval("SELECT 1")
-                except (
-                    asyncpg.ConnectionDoesNotExistError,
-                    asyncpg.InterfaceError,
-                    OSError,
-                ):
-                    # Connection is dead — will reconnect below.
-                    raise _PgReconnectNeeded()
-                yield conn
-        except (
-            asyncpg.ConnectionDoesNotExistError,
-            asyncpg.InterfaceError,
-            OSError,
-            _PgReconnectNeeded,
-        ):
+        cfg = self.config
+        print(
+            f"[db-mcp] Syncing SQLite DB via SSH {cfg.ssh_user}@{cfg.ssh_host}:{cfg.ssh_port}"
+            f" -> {cfg.db_path}...",
+            file=sys.stderr,
+        )
+        if self._ssh_client is None:
+            self._ssh_client = await asyncio.to_thread(ssh.open_client, cfg)
+        self._mirror, self._mirror_lock = await asyncio.to_thread(
+            open_mirror, cfg, self._ssh_client
+        )
+        stats = await asyncio.to_thread(self._mirror.pull, cfg.sqlite_cache_verify)
+        if stats["cached"]:
             print(
-                "[db-mcp] PostgreSQL connection lost, reconnecting...",
+                f"[db-mcp] SQLite DB unchanged since last sync, using {self._mirror.local_path}.",
                 file=sys.stderr,
             )
-            await self._reconnect_pg()
-            async with self.pg_pool.acquire() as conn:
-                yield conn
+        else:
+            print(
+                f"[db-mcp] SQLite DB synced to {self._mirror.local_path}: {stats['transferred']}"
+                f"/{stats['blocks']} blocks ({stats['bytes']} bytes) transferred.",
+                file=sys.stderr,
+            )
+        if self._mirror_lock is not None:
+            await asyncio.to_thread(evict_mirrors, cfg, self._mirror.local_path)
+        return str(self._mirror.local_path)
 
-    async def _connect_postgresql(self, host: str, port: int) -> None:
+    async def _upload_sqlite_via_ssh(self) -> None:
+        """Write local changes back to the remote SQLite file."""
+        if not self._ssh_client or self._mirror is None:
+            return
+        print(f"[db-mcp] Uploading SQLite DB changes to {self.config.db_path}...", file=sys.stderr)
+        stats = await asyncio.to_thread(self._mirror.push)
         print(
-            f"[db-mcp] Connecting to PostgreSQL {host}:{port}"
-            f"/{self.config.db_database} ({self.config.db_mode})...",
+            f"[db-mcp] SQLite DB uploaded: {stats['transferred']}/{stats['blocks']} blocks"
+            f" ({stats['bytes']} bytes).",
             file=sys.stderr,
         )
-        self._pg_pool = await asyncpg.create_pool(
-            host=host,
-            port=port,
-            user=self.config.db_user,
-            password=self.config.db_password,
-            database=self.config.db_database,
-        )
-        # Verify connectivity
-        async with self.acquire_pg() as conn:
-            await conn.fetchval("SELECT 1")
-        print("[db-mcp] PostgreSQL connected.", file=sys.stderr)
-
-    async def _reconnect_pg(self) -> None:
-        """Tear down the existing PG pool (and SSH tunnel) and create new ones."""
-        # Close the old pool gracefully.
-        if self._pg_pool is not None:
-            try:
-                await self._pg_pool.close()
-            except Exception:
-                pass
-            self._pg_pool = None
 
-        # If we were using an SSH tunnel, restart it too — the tunnel
-        # socket may also be dead.
-        if self.config.has_ssh_tunnel:
-            if self._tunnel is not None:
-                try:
-                    self._tunnel.stop()
-                except Exception:
-                    pass
-                self._tunnel = None
-            host, port = self._start_tunnel()
+    def _release_mirror(self) -> None:
+        """Unlock the persistent mirror, or delete a temporary copy."""
+        if self._mirror is None:
+            return
+        if self._mirror_lock is None:
+            self._mirror.discard()
         else:
-            host = self.config.db_host
-            port = self.config.db_port
+            self._mirror_lock.close()
+        self._mirror = None
+        self._mirror_lock = None
 
-        await self._connect_postgresql(host, port)
+    async def _connect_remote_sqlite(self) -> bool:
+        """Query the remote file in place through a helper over SSH.
 
-    # ------------------------------------------------------------------
-    # MongoDB helpers
-    # ------------------------------------------------------------------
-
-    async def _connect_mongodb(self) -> None:
-        print(
-            f"[db-mcp] Connecting to MongoDB {self.config.db_database} "
-            f"({self.config.db_mode})...",
-            file=sys.stderr,
-        )
-        self._mongo_client = motor.motor_asyncio.AsyncIOMotorClient(self.config.db_url)
-        self._mongo_db = self._mongo_client[self.config.db_database]
-        # Verify connectivity
-        await self._mongo_db.command("ping")
-        print("[db-mcp] MongoDB connected.", file=sys.stderr)
-
-    # ------------------------------------------------------------------
-    # SQLite helpers
-    # ------------------------------------------------------------------
+        Returns False (after logging why) when the helper cannot run there,
+        so the caller falls back to a local mirror.
+        """
+        from db_mcp import ssh
+        from db_mcp.backends.sqlite_remote import RemoteSqliteError, RemoteSqlitePool
 
-    def _download_sqlite_via_ssh(self) -> str:
-        """Download a remote SQLite file via SFTP and return local temp path."""
         cfg = self.config
         print(
-            f"[db-mcp] Downloading SQLite DB via SSH {cfg.ssh_user}@{cfg.ssh_host}:{cfg.ssh_port}"
-            f" -> {cfg.db_path}...",
+            f"[db-mcp] Opening remote SQLite {cfg.ssh_user}@{cfg.ssh_host}:{cfg.db_path}"
+            f" ({cfg.db_mode})...",
             file=sys.stderr,
         )
-        client = paramiko.SSHClient()
-        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        connect_kwargs: dict[str, Any] = {
-            "hostname": cfg.ssh_host,
-            "port": cfg.ssh_port,
-            "username": cfg.ssh_user,
-        }
-        if cfg.ssh_key:
-            connect_kwargs["key_filename"] = os.path.expanduser(cfg.ssh_key)
-        if cfg.ssh_password:
-            connect_kwargs["password"] = cfg.ssh_password
-        client.connect(**connect_kwargs)
-        self._ssh_client = client
-
-        sftp = client.open_sftp()
-        tmp = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
-        tmp_path = tmp.name
-        tmp.close()
-        sftp.get(cfg.db_path, tmp_path)
-        sftp.close()
-        print(f"[db-mcp] SQLite DB downloaded to {tmp_path}.", file=sys.stderr)
-        return tmp_path
-
-    def _upload_sqlite_via_ssh(self) -> None:
-        """Upload local SQLite file back to the remote server via SFTP."""
-        if not self._ssh_client or not self._sqlite_path:
-            return
-        cfg = self.config
-        print(f"[db-mcp] Uploading SQLite DB back to {cfg.db_path}...", file=sys.stderr)
-        sftp = self._ssh_client.open_sftp()
-        sftp.put(self._sqlite_path, cfg.db_path)
-        sftp.close()
-        print("[db-mcp] SQLite DB uploaded.", file=sys.stderr)
+        if self._ssh_client is None:
+            self._ssh_client = await asyncio.to_thread(ssh.open_client, cfg)
+        pool = RemoteSqlitePool(
+            self._ssh_client, cfg.db_path, cfg.sqlite_readers, cfg.pool_acquire_timeout
+        )
+        try:
+            await pool.open()
+        except RemoteSqliteError as exc:
+            await pool.close()
+            print(
+                f"[db-mcp] Remote SQLite unavailable ({exc}), falling back to a local copy.",
+                file=sys.stderr,
+            )
+            return False
+        self._sqlite_path = cfg.db_path
+        self._sqlite_pool = pool
+        print("[db-mcp] SQLite connected.", file=sys.stderr)
+        return True
 
     async def _connect_sqlite(self) -> None:
+        from db_mcp.backends.sqlite import SqlitePool
+
+        if self.config.sqlite_remote and await self._connect_remote_sqlite():
+            return
         if self.config.has_ssh_tunnel:
-            self._sqlite_path = self._download_sqlite_via_ssh()
+            self._sqlite_path = await self._download_sqlite_via_ssh()
         else:
             self._sqlite_path = self.config.db_path
 
@@ -320,45 +431,70 @@ class Connection:
             f"[db-mcp] Opening SQLite {self._sqlite_path} ({self.config.db_mode})...",
             file=sys.stderr,
         )
-        # Verify we can open it
-        async with aiosqlite.connect(self._sqlite_path) as db:
-            db.row_factory = aiosqlite.Row
+        pool = SqlitePool(
+            self._sqlite_path,
+            readers=self.config.sqlite_readers,
+            read_only=self.config.is_read_only,
+            wal=self.config.sqlite_wal,
+            acquire_timeout=self.config.pool_acquire_timeout,
+            statement_cache=self.config.statement_cache_size,
+        )
+        await pool.open()
+        self._sqlite_pool = pool
+        # Verify we can read it
+        async with pool.acquire() as db:
             async with db.execute("SELECT 1") as cur:
                 await cur.fetchone()
         print("[db-mcp] SQLite connected.", file=sys.stderr)
 
-    @asynccontextmanager
-    async def acquire_sqlite(self) -> AsyncIterator[aiosqlite.Connection]:
-        """Acquire an aiosqlite connection."""
-        assert self._sqlite_path is not None, "SQLite path not initialized"
-        async with aiosqlite.connect(self._sqlite_path) as db:
-            db.row_factory = aiosqlite.Row
-            yield db
+    async def _discard_ssh(self) -> None:
+        """Drop SSH resources left behind by a failed connection attempt."""
+        if self._ssh_client is not None:
+            await asyncio.to_thread(self._ssh_client.close)
+            self._ssh_client = None
+        if self._tunnel is not None:
+            try:
+                await asyncio.to_thread(self._tunnel.stop)
+            except Exception:
+                pass
+            self._tunnel = None
+        if self._sqlite_path and self.config.has_ssh_tunnel:
+            self._release_mirror()
+            self._sqlite_path = None
 
     async def close(self) -> None:
-        if self._pool is not None:
-            self._pool.close()
-            await self._pool.wait_closed()
-            print("[db-mcp] MySQL disconnected.", file=sys.stderr)
-        if self._pg_pool is not None:
-            await self._pg_pool.close()
-            print("[db-mcp] PostgreSQL disconnected.", file=sys.stderr)
-        if self._mongo_client is not None:
-            self._mongo_client.close()
-            print("[db-mcp] MongoDB disconnected.", file=sys.stderr)
-        if self._sqlite_path and self.config.has_ssh_tunnel:
-            if not self.config.is_read_only:
-                self._upload_sqlite_via_ssh()
+        task = self._connect_task
+        if task is not None and not task.done():
+            task.cancel()
             try:
-                os.unlink(self._sqlite_path)
-            except OSError:
+                await task
+            except (Exception, asyncio.CancelledError):
                 pass
+        if self._replicas is not None:
+            await self._replicas.close()
+            self._replicas = None
+        for tunnel in list(self._replica_tunnels):
+            await asyncio.to_thread(tunnel.stop)
+        self._replica_tunnels.clear()
+        if self._mysql is not None:
+            await self._mysql.close()
+        if self._pg is not None:
+            await self._pg.close()
+        if self._mongo is not None:
+            await self._mongo.close()
+        if self._sqlite_pool is not None:
+            await self._sqlite_pool.close()
+            self._sqlite_pool = None
+        if self._sqlite_path and self.config.has_ssh_tunnel:
+            if not self.config.is_read_only:
+                await self._upload_sqlite_via_ssh()
+            self._release_mirror()
             print("[db-mcp] SQLite disconnected.", file=sys.stderr)
         elif self._sqlite_path:
             print("[db-mcp] SQLite disconnected.", file=sys.stderr)
         if self._ssh_client is not None:
-            self._ssh_client.close()
+            await asyncio.to_thread(self._ssh_client.close)
             print("[db-mcp] SSH connection closed.", file=sys.stderr)
         if self._tunnel is not None:
-            self._tunnel.stop()
+            await asyncio.to_thread(self._tunnel.stop)
             print("[db-mcp] SSH tunnel closed.", file=sys.stderr)
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import csv
+import datetime
+import decimal
+import io
+import json
+import sys
+import uuid
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # optional speed-up: pip install db-mcp-server[fast]
+    orjson = None  # type: ignore[assignment]
+
+FORMATS = ("json", "columnar", "csv")
+
+
+def _hex(value: bytes | bytearray | memoryview) -> str:
+    return bytes(value).hex()
+
+
+# Converters for values json/orjson cannot encode natively, keyed by exact
+# type.  Subclasses and driver types are resolved on first sight and cached.
+_CONVERTERS: dict[type, Callable[[Any], Any]] = {
+    decimal.Decimal: str,
+    datetime.datetime: datetime.datetime.isoformat,
+    datetime.date: datetime.date.isoformat,
+    datetime.time: datetime.time.isoformat,
+    datetime.timedelta: str,
+    uuid.UUID: str,
+    bytes: _hex,
+    bytearray: _hex,
+    memoryview: _hex,
+    set: list,
+    frozenset: list,
+}
+
+
+def _driver_converters() -> dict[type, Callable[[Any], Any]]:
+    """Converters for driver types, looked up only if the driver is loaded."""
+    found: dict[type, Callable[[Any], Any]] = {}
+    bson = sys.modules.get("bson")
+    if bson is not None:
+        found[bson.ObjectId] = str
+        found[bson.Decimal128] = str
+    asyncpg = sys.modules.get("asyncpg")
+    if asyncpg is not None:
+        found[asyncpg.Record] = dict
+    return found
+
+
+def _resolve(tp: type) -> Callable[[Any], Any]:
+    drivers = _driver_converters()
+    conv = drivers.get(tp)
+    if conv is None:
+        for base in tp.__mro__[1:]:
+            conv = _CONVERTERS.get(base) or drivers.get(base)
+            if conv is not None:
+                break
+        else:
+            conv = str
+    _CONVERTERS[tp] = conv
+    return conv
+
+
+def _default(obj: Any) -> Any:
+    conv = _CONVERTERS.get(type(obj))
+    if conv is None:
+        conv = _resolve(type(obj))
+    return conv(obj)
+
+
+_CSV_NATIVE = frozenset({str, int, float, bool, type(None)})
+
+
+def _scalar(value: Any) -> Any:
+    """Convert *value* to something ``csv`` can write as-is."""
+    tp = type(value)
+    if tp in _CSV_NATIVE:
+        return value
+    if tp is dict or tp is list:
+        return to_json(value)
+    return _default(value)
+
+
+def to_json(result: Any) -> str:
+    """Compact JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                result, default=_default, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:
+            # e.g. integers beyond 64 bits (BIGINT UNSIGNED): let json handle it.
+            pass
+    return json.dumps(result, ensure_ascii=False, separators=(",", ":"), default=_default)
+
+
+def _split_rows(result: Any) -> tuple[list[dict], dict] | None:
+    """Return (rows, metadata) if *result* is tabular, else None."""
+    if isinstance(result, dict) and isinstance(result.get("rows"), list):
+        rows, meta = result["rows"], {k: v for k, v in result.items() if k != "rows"}
+    elif isinstance(result, list):
+        rows, meta = result, {}
+    else:
+        return None
+    if not all(isinstance(row, dict) for row in rows):
+        return None
+    return rows, meta
+
+
+def _columns(rows: list[dict]) -> list[str]:
+    # Union of keys in first-seen order: Mongo documents need not share a shape.
+    columns: dict[str, None] = {}
+    for row in rows:
+        for key in row:
+            columns.setdefault(key, None)
+    return list(columns)
+
+
+def to_columnar(result: Any) -> str:
+    """JSON with the column list once and each row as an array."""
+    split = _split_rows(result)
+    if split is None:
+        return to_json(result)
+    rows, meta = split
+    columns = _columns(rows)
+    return to_json(
+        {
+            "columns": columns,
+            "rows": [[row.get(c) for c in columns] for row in rows],
+            **meta,
+        }
+    )
+
+
+def to_csv(result: Any) -> str:
+    """CSV with a header row; response metadata follows as ``# key: value`` lines."""
+    split = _split_rows(result)
+    if split is None:
+        return to_json(result)
+    rows, meta = split
+    columns = _columns(rows)
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow([_scalar(row.get(c)) for c in columns])
+    for key, value in meta.items():
+        out.write(f"# {key}: {to_json(value)}\n")
+    return out.getvalue()
+
+
+_ENCODERS: dict[str, Callable[[Any], str]] = {
+    "json": to_json,
+    "columnar": to_columnar,
+    "csv": to_csv,
+}
+
+
+def encode(result: Any, fmt: str) -> str:
+    try:
+        encoder = _ENCODERS[fmt]
+    except KeyError:
+        raise ValueError(
+            f"Unknown output format {fmt!r}. Use one of: {', '.join(FORMATS)}."
+        ) from None
+    return encoder(result)
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import time
+from collections import deque
+from contextlib import AbstractContextManager, nullcontext
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable
+
+# Samples kept per (tool, phase) for the rolling percentiles.
+_WINDOW = 1024
+# Seconds between Prometheus text dumps.
+_DUMP_INTERVAL = 15.0
+_QUANTILES = (0.5, 0.95, 0.99)
+
+
+class _Call:
+    """Phase durations and row count accumulated by one tool call."""
+
+    __slots__ = ("phases", "rows")
+
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+        self.rows = 0
+
+
+# The tool call being measured in the current task, if metrics are on.
+_current: ContextVar[_Call | None] = ContextVar("db_mcp_call", default=None)
+_NOOP = nullcontext()
+
+
+class _Phase:
+    __slots__ = ("call", "name", "start")
+
+    def __init__(self, call: _Call, name: str) -> None:
+        self.call = call
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc: Any) -> None:
+        elapsed = time.perf_counter() - self.start
+        self.call.phases[self.name] = self.call.phases.get(self.name, 0.0) + elapsed
+
+
+def phase(name: str) -> AbstractContextManager[None]:
+    """Time a block as phase *name* of the current tool call (no-op when not measuring).
+
+    A phase entered several times in one call (e.g. "convert" per fetched
+    batch) is summed.
+    """
+    call = _current.get()
+    if call is None:
+        return _NOOP
+    return _Phase(call, name)
+
+
+def add_rows(n: int) -> None:
+    """Count *n* result rows towards the current tool call."""
+    call = _current.get()
+    if call is not None:
+        call.rows += n
+
+
+class _Series:
+    """Count, sum and max of a duration, plus a window of recent samples."""
+
+    __slots__ = ("count", "total", "max", "samples")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: deque[float] = deque(maxlen=_WINDOW)
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.samples.append(seconds)
+
+    def quantiles(self) -> list[float]:
+        ordered = sorted(self.samples)
+        if not ordered:
+            return [0.0] * len(_QUANTILES)
+        return [ordered[min(len(ordered) - 1, int(q * len(ordered)))] for q in _QUANTILES]
+
+
+class _ToolStats:
+    __slots__ = ("calls", "errors", "rows", "bytes", "phases")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.bytes = 0
+        self.phases: dict[str, _Series] = {}
+
+    def observe(self, name: str, seconds: float) -> None:
+        series = self.phases.get(name)
+        if series is None:
+            series = self.phases[name] = _Series()
+        series.add(seconds)
+
+
+class Metrics:
+    """Per-tool latency and throughput counters.
+
+    Each tool call is split into phases: ``admit`` (waiting for an
+    admission slot), ``acquire`` (waiting for a pooled connection),
+    ``validate`` (SQL / pipeline checks), ``convert`` (driver rows to dicts,
+    including the byte budget), ``format`` (response encoding) and
+    ``execute``, which is everything else, i.e. mostly database round
+    trips.  ``total`` is the whole call.  Percentiles cover the last
+    ``_WINDOW`` calls per tool.
+    """
+
+    def __init__(self) -> None:
+        self._tools: dict[str, _ToolStats] = {}
+        self.started = time.time()
+
+    async def observe(self, tool: str, fn: Callable[[], Awaitable[str]]) -> str:
+        """Run the tool call *fn*, recording its phases, rows and response size."""
+        stats = self._tools.get(tool)
+        if stats is None:
+            stats = self._tools[tool] = _ToolStats()
+        call = _Call()
+        token = _current.set(call)
+        start = time.perf_counter()
+        try:
+            out = await fn()
+        except BaseException:
+            stats.errors += 1
+            raise
+        else:
+            stats.bytes += len(out)
+            return out
+        finally:
+            total = time.perf_counter() - start
+            _current.reset(token)
+            stats.calls += 1
+            stats.rows += call.rows
+            for name, seconds in call.phases.items():
+                stats.observe(name, seconds)
+            stats.observe("execute", max(0.0, total - sum(call.phases.values())))
+            stats.observe("total", total)
+
+    def snapshot(self) -> dict:
+        tools: dict[str, Any] = {}
+        for name, stats in sorted(self._tools.items()):
+            phases = {}
+            for phase_name, series in stats.phases.items():
+                p50, p95, p99 = series.quantiles()
+                phases[phase_name] = {
+                    "count": series.count,
+                    "meanMs": round(series.total / series.count * 1000, 3),
+                    "p50Ms": round(p50 * 1000, 3),
+                    "p95Ms": round(p95 * 1000, 3),
+                    "p99Ms": round(p99 * 1000, 3),
+                    "maxMs": round(series.max * 1000, 3),
+                }
+            tools[name] = {
+                "calls": stats.calls,
+                "errors": stats.errors,
+                "rows": stats.rows,
+                "bytes": stats.bytes,
+                "phases": phases,
+            }
+        return {
+            "enabled": True,
+            "uptimeSeconds": round(time.time() - self.started, 1),
+            "window": _WINDOW,
+            "tools": tools,
+        }
+
+    def prometheus(self) -> str:
+        """The counters in the Prometheus text exposition format."""
+        lines = []
+        counters = (
+            ("calls", "db_mcp_tool_calls_total", "Tool calls."),
+            ("errors", "db_mcp_tool_errors_total", "Tool calls that raised."),
+            ("rows", "db_mcp_tool_rows_total", "Result rows produced."),
+            ("bytes", "db_mcp_tool_response_bytes_total", "Response bytes returned."),
+        )
+        for attr, metric, help_text in counters:
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"]
+            for tool, stats in sorted(self._tools.items()):
+                lines.append(f'{metric}{{tool="{tool}"}} {getattr(stats, attr)}')
+        metric = "db_mcp_tool_phase_seconds"
+        lines += [
+            f"# HELP {metric} Time spent per tool call phase.",
+            f"# TYPE {metric} summary",
+        ]
+        for tool, stats in sorted(self._tools.items()):
+            for phase_name, series in stats.phases.items():
+                labels = f'tool="{tool}",phase="{phase_name}"'
+                for q, value in zip(_QUANTILES, series.quantiles()):
+                    lines.append(f'{metric}{{{labels},quantile="{q}"}} {value:.6f}')
+                lines.append(f"{metric}_sum{{{labels}}} {series.total:.6f}")
+                lines.append(f"{metric}_count{{{labels}}} {series.count}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: str) -> None:
+        """Atomically write the Prometheus text dump to *path*."""
+        tmp = f"{path}.tmp"
+        try:
+            with open(tmp, "w") as f:
+                f.write(self.prometheus())
+            os.replace(tmp, path)
+        except OSError as exc:
+            print(f"[db-mcp] Could not write metrics to {path}: {exc}", file=sys.stderr)
+
+    async def dump_loop(self, path: str) -> None:
+        """Rewrite *path* every ``_DUMP_INTERVAL`` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(_DUMP_INTERVAL)
+            self.dump(path)
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import secrets
+import sys
+import time
+from contextlib import AsyncExitStack
+from typing import Any, Awaitable, Callable, Sequence
+
+from db_mcp.results import RowCollector
+
+
+class ServerCursor:
+    """An open server-side cursor plus the resources (connection, transaction)
+    that must stay checked out while it is alive.
+
+    *finish* is awaited on close with ``exhausted`` telling whether the result
+    was fully read, for backends that must abandon unread results explicitly.
+    """
+
+    def __init__(
+        self,
+        stack: AsyncExitStack,
+        fetch: Callable[[int], Awaitable[Sequence[Any]]],
+        convert: Callable[[Any], dict] | None = None,
+        finish: Callable[[bool], Awaitable[None]] | None = None,
+    ) -> None:
+        self.stack = stack
+        self.fetch = fetch
+        self.convert = convert
+        self.finish = finish
+
+    async def close(self, exhausted: bool) -> None:
+        try:
+            if self.finish is not None:
+                await self.finish(exhausted)
+        finally:
+            await self.stack.aclose()
+
+
+class _Entry:
+    def __init__(self, cursor: ServerCursor, page_size: int) -> None:
+        self.cursor = cursor
+        self.page_size = page_size
+        self.pending: list[dict] = []
+        self.last_used = time.monotonic()
+        self.lock = asyncio.Lock()
+
+
+class CursorRegistry:
+    """Open paginated cursors addressed by opaque continuation tokens.
+
+    Each cursor pins a pool connection, so the number of open cursors is
+    capped (the least recently used idle one is evicted to make room) and
+    cursors idle for longer than ``idle_timeout`` seconds are closed.  A cap
+    of 0 disables pagination.
+    """
+
+    def __init__(self, idle_timeout: float, max_cursors: int, max_bytes: int) -> None:
+        self.idle_timeout = idle_timeout
+        self.max_cursors = max(0, max_cursors)
+        self.max_bytes = max_bytes
+        self._entries: dict[str, _Entry] = {}
+
+    async def _page(self, token: str, entry: _Entry) -> dict:
+        collector = RowCollector(entry.page_size, self.max_bytes)
+        exhausted = await collector.consume(
+            entry.cursor.fetch, entry.cursor.convert, entry.pending
+        )
+        entry.pending = collector.overflow
+        entry.last_used = time.monotonic()
+        if exhausted:
+            self._entries.pop(token, None)
+            await entry.cursor.close(exhausted=True)
+        return {
+            "rows": collector.rows,
+            "rowCount": len(collector.rows),
+            "cursor": None if exhausted else token,
+        }
+
+    def check_enabled(self) -> None:
+        """Raise before a cursor is opened if pagination is disabled."""
+        if not self.max_cursors:
+            raise RuntimeError(
+                "Paginated queries are disabled: no connection can be spared for a "
+                "cursor (DB_MAX_CURSORS=0, or too few read slots; see DB_SQLITE_READERS, "
+                "DB_POOL_MAX_SIZE and DB_MAX_CONCURRENT_READS). Use query instead."
+            )
+
+    async def open(self, cursor: ServerCursor, page_size: int) -> dict:
+        """Register *cursor* and return its first page."""
+        try:
+            self.check_enabled()
+            await self.evict_idle()
+            if len(self._entries) >= self.max_cursors:
+                await self._evict_lru()
+        except BaseException:
+            await cursor.close(exhausted=False)
+            raise
+        token = secrets.token_urlsafe(16)
+        entry = _Entry(cursor, page_size)
+        self._entries[token] = entry
+        async with entry.lock:
+            try:
+                return await self._page(token, entry)
+            except BaseException:
+                self._entries.pop(token, None)
+                await cursor.close(exhausted=False)
+                raise
+
+    async def next(self, token: str) -> dict:
+        entry = self._entries.get(token)
+        if entry is None:
+            raise ValueError(f"Unknown or expired cursor: {token!r}")
+        async with entry.lock:
+            if self._entries.get(token) is not entry:
+                raise ValueError(f"Unknown or expired cursor: {token!r}")
+            try:
+                return await self._page(token, entry)
+            except BaseException:
+                self._entries.pop(token, None)
+                await entry.cursor.close(exhausted=False)
+                raise
+
+    async def close(self, token: str) -> bool:
+        entry = self._entries.pop(token, None)
+        if entry is None:
+            return False
+        async with entry.lock:
+            await entry.cursor.close(exhausted=False)
+        return True
+
+    async def _evict_lru(self) -> None:
+        idle = [(e.last_used, t) for t, e in self._entries.items() if not e.lock.locked()]
+        if not idle:
+            raise RuntimeError(
+                f"Too many open cursors ({self.max_cursors}). "
+                "Close some with close_cursor or wait for them to expire."
+            )
+        _, token = min(idle)
+        await self.close(token)
+
+    async def evict_idle(self) -> None:
+        now = time.monotonic()
+        expired = [
+            t for t, e in self._entries.items()
+            if not e.lock.locked() and now - e.last_used > self.idle_timeout
+        ]
+        for token in expired:
+            try:
+                await self.close(token)
+            except Exception as exc:
+                print(f"[db-mcp] Failed to close idle cursor: {exc}", file=sys.stderr)
+
+    async def sweep(self) -> None:
+        """Close idle cursors periodically (runs until cancelled)."""
+        while True:
+            await asyncio.sleep(max(1.0, self.idle_timeout / 2))
+            await self.evict_idle()
+
+    async def close_all(self) -> None:
+        for token in list(self._entries):
+            try:
+                await self.close(token)
+            except Exception as exc:
+                print(f"[db-mcp] Failed to close cursor: {exc}", file=sys.stderr)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from contextlib import AsyncExitStack, asynccontextmanager, suppress
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from db_mcp.backends.stats import PoolTimeout
+
+
+class ReplicaNode:
+    """One read replica: its pool, load and health."""
+
+    def __init__(self, label: str, pool: Any, open: Callable[[], Awaitable[None]]) -> None:
+        self.label = label
+        # A MySQLPool or PostgresPool; *open* connects it.
+        self.pool = pool
+        self._open = open
+        self.opened = False
+        self.healthy = False
+        self.outstanding = 0
+        self.reads = 0
+        self.failovers = 0
+        self.lag: float | None = None
+        self.last_error: str | None = None
+
+    async def probe(self, max_lag: float) -> None:
+        """Connect if needed and check the replica; raises when it must not serve reads."""
+        if not self.opened:
+            try:
+                await self._open()
+            except BaseException:
+                # Drop a half-opened pool; the next check starts over.
+                with suppress(Exception):
+                    await self.pool.close()
+                raise
+            self.opened = True
+        self.lag = await self.pool.replication_lag()
+        if max_lag:
+            if self.lag is None:
+                raise RuntimeError("replication lag unknown (is replication running?)")
+            if self.lag > max_lag:
+                raise RuntimeError(
+                    f"{self.lag:.1f}s behind the primary (DB_REPLICA_MAX_LAG={max_lag:g})"
+                )
+
+
+class ReplicaSet:
+    """Read replicas of the primary, balanced by least outstanding requests.
+
+    A replica serves reads only while its last health check passed: it is
+    reachable and, with ``max_lag`` set, at most that many seconds behind.
+    A replica that fails a checkout is taken out of rotation at once and
+    the read falls back to the primary; the periodic :meth:`check_all`
+    brings it back once it passes a check again.  With no healthy replica every read goes to
+    the primary.
+    """
+
+    def __init__(self, replicas: list[ReplicaNode], max_lag: float, check_interval: float) -> None:
+        self.replicas = replicas
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.primary_reads = 0
+
+    async def check(self, replica: ReplicaNode) -> None:
+        """Probe *replica* (at most ``check_interval`` seconds) and update its health."""
+        try:
+            try:
+                await asyncio.wait_for(replica.probe(self.max_lag), self.check_interval)
+            except asyncio.TimeoutError:
+                raise RuntimeError(
+                    f"health check timed out after {self.check_interval:g}s"
+                ) from None
+        except Exception as exc:
+            self._mark_down(replica, exc)
+            return
+        if not replica.healthy:
+            print(f"[db-mcp] Replica {replica.label} is serving reads.", file=sys.stderr)
+        replica.healthy = True
+        replica.last_error = None
+
+    def _mark_down(self, replica: ReplicaNode, exc: BaseException) -> None:
+        if replica.healthy or replica.last_error is None:
+            print(
+                f"[db-mcp] Replica {replica.label} out of rotation: {exc}",
+                file=sys.stderr,
+            )
+        replica.healthy = False
+        replica.last_error = str(exc)
+
+    async def check_all(self) -> None:
+        await asyncio.gather(*(self.check(r) for r in self.replicas))
+
+    def pick(self) -> ReplicaNode | None:
+        healthy = [r for r in self.replicas if r.healthy]
+        if not healthy:
+            return None
+        return min(healthy, key=lambda r: (r.outstanding, r.reads))
+
+    @asynccontextmanager
+    async def acquire(self, primary: Any) -> AsyncIterator[tuple[Any, Any]]:
+        """Check out a read connection: ``(conn, pool it came from)``."""
+        replica = self.pick()
+        if replica is None:
+            self.primary_reads += 1
+            async with primary.acquire() as conn:
+                yield conn, primary
+            return
+        replica.outstanding += 1
+        try:
+            async with AsyncExitStack() as stack:
+                try:
+                    conn = await stack.enter_async_context(replica.pool.acquire())
+                    pool = replica.pool
+                    replica.reads += 1
+                except Exception as exc:
+                    # A saturated replica (pool acquire timeout) stays in rotation.
+                    if not isinstance(exc, PoolTimeout):
+                        self._mark_down(replica, exc)
+                    replica.failovers += 1
+                    self.primary_reads += 1
+                    conn = await stack.enter_async_context(primary.acquire())
+                    pool = primary
+                yield conn, pool
+        finally:
+            replica.outstanding -= 1
+
+    def stats(self) -> dict:
+        return {
+            "maxLagSeconds": self.max_lag,
+            "primaryReads": self.primary_reads,
+            "replicas": [
+                {
+                    "endpoint": r.label,
+                    "healthy": r.healthy,
+                    "outstanding": r.outstanding,
+                    "reads": r.reads,
+                    "failovers": r.failovers,
+                    "lagSeconds": None if r.lag is None else round(r.lag, 3),
+                    **({"lastError": r.last_error} if r.last_error else {}),
+                    **({"pool": r.pool.stats()} if r.opened else {}),
+                }
+                for r in self.replicas
+            ],
+        }
+
+    async def close(self) -> None:
+        for replica in self.replicas:
+            if replica.opened:
+                await replica.pool.close()
+                replica.opened = False
+            replica.healthy = False
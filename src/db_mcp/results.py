@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Sequence
+
+from db_mcp.encoding import to_json
+from db_mcp.metrics import add_rows, phase
+
+# Rows pulled from the server per round trip when streaming.
+_FETCH_BATCH = 500
+
+
+class RowCollector:
+    """Accumulate streamed rows until a row-count or output-size budget is hit.
+
+    The byte budget is measured on the compact JSON encoding of each row, so
+    it tracks the size of the tool response rather than driver memory.  A
+    limit of 0 disables that budget.  The first row is always accepted, so a
+    single oversized row cannot stall pagination.
+
+    Rows fetched but not accepted are kept in ``overflow`` for callers that
+    continue reading from the same cursor.
+    """
+
+    def __init__(self, max_rows: int, max_bytes: int) -> None:
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.rows: list[dict] = []
+        self.size = 0
+        self.truncated_by: str | None = None
+        self.overflow: list[dict] = []
+
+    def add(self, row: dict) -> bool:
+        """Append *row*, or return False (dropping it) if it exceeds the budget."""
+        if self.max_rows and len(self.rows) >= self.max_rows:
+            self.truncated_by = "max_rows"
+            return False
+        if self.max_bytes:
+            size = len(to_json(row)) + 1
+            if self.rows and self.size + size > self.max_bytes:
+                self.truncated_by = "max_bytes"
+                return False
+            self.size += size
+        self.rows.append(row)
+        return True
+
+    def _batch_size(self) -> int:
+        if not self.max_rows:
+            return _FETCH_BATCH
+        # One row past the limit is enough to tell whether we truncated.
+        return max(1, min(_FETCH_BATCH, self.max_rows + 1 - len(self.rows)))
+
+    async def consume(
+        self,
+        fetchmany: Callable[[int], Awaitable[Sequence[Any]]],
+        convert: Callable[[Any], dict] | None = None,
+        pending: Sequence[dict] = (),
+    ) -> bool:
+        """Pull batches from *fetchmany* until it is exhausted or the budget is hit.
+
+        *pending* rows (the ``overflow`` of a previous page) are taken first.
+        Returns True if the source was fully read, False if it was cut short
+        (the caller is then responsible for abandoning the server-side cursor).
+        """
+        for i, row in enumerate(pending):
+            if not self.add(row):
+                self.overflow = list(pending[i:])
+                return False
+        while True:
+            batch = await fetchmany(self._batch_size())
+            if not batch:
+                return True
+            with phase("convert"):
+                for i, raw in enumerate(batch):
+                    row = raw if convert is None else convert(raw)
+                    if not self.add(row):
+                        rest = batch[i + 1:]
+                        self.overflow = [row, *(rest if convert is None else map(convert, rest))]
+                        return False
+
+    def result(self) -> dict:
+        add_rows(len(self.rows))
+        result: dict[str, Any] = {
+            "rows": self.rows,
+            "rowCount": len(self.rows),
+            "truncated": self.truncated_by is not None,
+        }
+        if self.truncated_by is not None:
+            result["truncatedBy"] = self.truncated_by
+        return result
@@ -1,41 +1,250 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
+import time
 from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
-from typing import Annotated, Any
+from contextlib import AsyncExitStack, asynccontextmanager, suppress
+from typing import Annotated, Any, Awaitable, Callable
 
 from mcp.server.fastmcp import FastMCP
 
+from db_mcp.admission import AdmissionController, lane_sizes
+from db_mcp.cache import ResultCache, normalize_sql
+from db_mcp.catalog import SchemaCatalog
 from db_mcp.config import get_config
 from db_mcp.connection import Connection
+from db_mcp.encoding import encode, to_json
+from db_mcp.metrics import Metrics, phase
+from db_mcp.pagination import CursorRegistry, ServerCursor
+from db_mcp.singleflight import SingleFlight
+from db_mcp.slowlog import QueryLog, mongo_fingerprint
 from db_mcp.tools.aggregate import aggregate_mongodb
+from db_mcp.tools.batch import (
+    batch_execute_mysql,
+    batch_execute_pg,
+    batch_execute_sqlite,
+    bulk_insert_mongodb,
+    bulk_insert_mysql,
+    bulk_insert_pg,
+    bulk_insert_sqlite,
+    bulk_write_mongodb,
+)
 from db_mcp.tools.describe import describe_mongodb, describe_mysql, describe_pg
+from db_mcp.tools.describe_all import describe_all_mysql, describe_all_pg, describe_all_sqlite
 from db_mcp.tools.describe_sqlite import describe_sqlite
 from db_mcp.tools.execute import execute_mysql, execute_pg
 from db_mcp.tools.execute_sqlite import execute_sqlite
 from db_mcp.tools.list_collections import list_collections as _list_collections
 from db_mcp.tools.list_tables import list_tables as _list_tables, list_tables_pg as _list_tables_pg
 from db_mcp.tools.list_tables_sqlite import list_tables_sqlite as _list_tables_sqlite
+from db_mcp.tools.paginate import (
+    open_cursor_mongodb,
+    open_cursor_mysql,
+    open_cursor_pg,
+    open_cursor_sqlite,
+)
 from db_mcp.tools.query import query_mongodb, query_mysql, query_pg
+from db_mcp.tools.query_many import query_many as _query_many
 from db_mcp.tools.query_sqlite import query_sqlite
 from db_mcp.tools.status import get_status
+from db_mcp.validation import is_read_only_query, validate_aggregate_pipeline
 
 config = get_config()
 _conn = Connection(config)
 
+# Lane limits and cursor cap, from the pool size (see lane_sizes).
+_sizes = lane_sizes(config)
+_admission = AdmissionController(_sizes.limits, config.max_queued)
+_cursors = CursorRegistry(config.cursor_idle_timeout, _sizes.cursors, config.max_bytes)
+# Admission lane of each tool; anything not listed is a read.
+_LANES = {
+    "execute": "write",
+    "batch_execute": "write",
+    "bulk_insert": "write",
+    "bulk_write": "write",
+    "describe": "meta",
+    "list_tables": "meta",
+    "list_collections": "meta",
+    "close_cursor": "meta",
+}
+
+_cache = ResultCache(config.cache_max_bytes, config.cache_ttl)
+_metrics = Metrics() if config.metrics else None
+_querylog = QueryLog(config.slow_query_ms, config.slow_query_log)
+_inflight = SingleFlight()
+_catalog = SchemaCatalog()
+if config.is_mysql or config.is_postgresql:
+    _db_identity = f"{config.db_type}://{config.db_host}:{config.db_port}/{config.db_database}"
+elif config.is_sqlite:
+    _db_identity = f"sqlite://{config.ssh_host}{config.db_path}"
+else:
+    _db_identity = f"mongodb/{config.db_database}"
+
+
+def _format(result: Any, fmt: str | None = None) -> str:
+    with phase("format"):
+        return encode(result, fmt or config.output_format)
+
+
+def _row_count(result: Any) -> int:
+    if isinstance(result, list):
+        return len(result)
+    if isinstance(result, dict):
+        return result.get("rowCount", result.get("affectedRows", 0))
+    return 0
+
+
+async def _load(
+    load: Callable[[], Awaitable[Any]],
+    fmt: str | None = None,
+    statement: str | None = None,
+    fp: str | None = None,
+) -> str:
+    """Encode the result of *load*, recording *statement* in the query log."""
+    if statement is None:
+        return _format(await load(), fmt)
+    start = time.perf_counter()
+    try:
+        result = await load()
+    except Exception as exc:
+        _querylog.record(statement, time.perf_counter() - start, error=str(exc), fp=fp)
+        raise
+    elapsed = time.perf_counter() - start
+    out = _format(result, fmt)
+    _querylog.record(statement, elapsed, _row_count(result), len(out), fp=fp)
+    return out
+
+
+async def _cached(
+    key: tuple,
+    load: Callable[[], Awaitable[Any]],
+    fmt: str | None = None,
+    statement: str | None = None,
+    fp: str | None = None,
+) -> str:
+    """Return the encoded result of *load*, served from the result cache if possible.
+
+    Identical calls already in flight share one database call.  The cache
+    generation is part of the coalescing key, so a call issued after a write
+    never joins a read that started before it.  *statement* (and its
+    fingerprint *fp*, for MongoDB) is recorded in the query log when the
+    database is actually hit.
+    """
+    fmt = fmt or config.output_format
+    full_key = (_db_identity, fmt, *key)
+    if _cache.enabled:
+        cached = _cache.get(full_key)
+        if cached is not None:
+            return cached
+    generation = _cache.generation
+
+    async def run() -> str:
+        out = await _load(load, fmt, statement, fp)
+        _cache.put(full_key, out, generation)
+        return out
+
+    return await _inflight.do((generation, full_key), run)
+
+
+def _pipeline_writes(pipeline: list) -> bool:
+    try:
+        validate_aggregate_pipeline(pipeline, read_only=True)
+    except ValueError:
+        return True
+    return False
+
+
+async def _run_query(
+    sql: str, params: list[Any] | None, load: Callable[[], Awaitable[Any]], fmt: str | None
+) -> str:
+    """Run a SQL query() call, caching it unless it may write."""
+    if is_read_only_query(sql):
+        return await _cached(("query", normalize_sql(sql), to_json(params or [])), load, fmt, sql)
+    # Not cached: it may write or take locks.  Read-write mode lets query()
+    # run anything, so there it counts as a write.
+    out = await _load(load, fmt, sql)
+    if not config.is_read_only:
+        _cache.invalidate()
+    return out
+
+
+def _timeout(timeout: float | None) -> float | None:
+    """Per-call timeout, capped by the server-wide DB_TIMEOUT (None = no limit)."""
+    if timeout and timeout > 0:
+        return min(timeout, config.timeout) if config.timeout else timeout
+    return config.timeout or None
+
+
+async def _gather_queries(
+    queries: list[str],
+    params: list[list[Any] | None] | None,
+    concurrency: int,
+    run: Callable[[str, list[Any] | None], Awaitable[dict]],
+) -> str:
+    """Run a query_many() call, recording each query in the query log."""
+
+    async def one(sql: str, args: list[Any] | None) -> dict:
+        start = time.perf_counter()
+        try:
+            result = await run(sql, args)
+        except Exception as exc:
+            _querylog.record(sql, time.perf_counter() - start, error=str(exc))
+            raise
+        _querylog.record(sql, time.perf_counter() - start, _row_count(result))
+        return result
+
+    # The call itself holds one read slot; fan out only over slots free now,
+    # so query_many cannot drain the pool behind admission control's back.
+    extra = _admission.reserve("read", min(concurrency, _sizes.pool) - 1)
+    try:
+        result = await _query_many(queries, params, one, 1 + extra)
+    finally:
+        _admission.release("read", extra)
+    return _format(result, "json")
+
 
-def _format(result: Any) -> str:
-    return json.dumps(result, indent=2, ensure_ascii=False, default=str)
+def _hold_read_slot(cursor: ServerCursor) -> ServerCursor:
+    """Charge *cursor* to the read lane until it is closed."""
+    _admission.pin("read")
+    stack = AsyncExitStack()
+    stack.callback(_admission.unpin, "read")
+    # Runs first on close: the slot frees up once the connection is back.
+    stack.push_async_exit(cursor.stack)
+    cursor.stack = stack
+    return cursor
+
+
+def _page_size(page_size: int) -> int:
+    if config.max_rows:
+        page_size = min(page_size, config.max_rows)
+    return max(1, page_size)
 
 
 @asynccontextmanager
 async def app_lifespan(server: FastMCP) -> AsyncIterator[None]:
-    await _conn.connect()
+    if config.lazy_connect:
+        _conn.start()
+    else:
+        await _conn.connect()
+    tasks = [
+        asyncio.create_task(_conn.keepalive()),
+        asyncio.create_task(_conn.monitor_replicas()),
+        asyncio.create_task(_cursors.sweep()),
+    ]
+    if _metrics is not None and config.metrics_file:
+        tasks.append(asyncio.create_task(_metrics.dump_loop(config.metrics_file)))
     try:
         yield
     finally:
+        for task in tasks:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        await _cursors.close_all()
         await _conn.close()
+        if _metrics is not None and config.metrics_file:
+            _metrics.dump(config.metrics_file)
 
 
 mcp = FastMCP(
@@ -44,177 +253,515 @@ mcp = FastMCP(
 )
 
 
+def _tool(fn: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+    """Register *fn* as an MCP tool that first waits for the database connection.
+
+    Calls then pass admission control in the lane listed in ``_LANES``.
+    """
+    lane = _LANES.get(fn.__name__, "read")
+
+    async def admitted(*args: Any, **kwargs: Any) -> str:
+        async with _admission.admit(lane):
+            return await fn(*args, **kwargs)
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> str:
+        await _conn.ready()
+        if _metrics is None:
+            return await admitted(*args, **kwargs)
+        return await _metrics.observe(fn.__name__, lambda: admitted(*args, **kwargs))
+
+    return mcp.tool()(wrapper)
+
+
 # --- Tool: query ---
 
 if config.is_mysql:
 
-    @mcp.tool()
+    @_tool
     async def query(
         query: Annotated[str, "SQL SELECT query to execute"],
+        params: Annotated[list[Any] | None, "Values bound to the query's placeholders (%s)"] = None,
+        format: Annotated[str | None, "Output format: json, columnar or csv (default: server setting)"] = None,
+        timeout: Annotated[float | None, "Seconds before the statement is cancelled (default: server setting)"] = None,
     ) -> str:
-        """Execute a read-only query on the MySQL database. Only SELECT, SHOW, DESCRIBE, EXPLAIN, WITH are allowed on read-only databases."""
-        rows = await query_mysql(_conn, config, query)
-        return _format(rows)
+        """Execute a read-only query on the MySQL database. Only SELECT, SHOW, DESCRIBE, EXPLAIN, WITH are allowed on read-only databases. Large results are truncated (see "truncated" in the response)."""
+        return await _run_query(
+            query, params, lambda: query_mysql(_conn, config, query, _timeout(timeout), params), format
+        )
 
 elif config.is_postgresql:
 
-    @mcp.tool()
+    @_tool
     async def query(
         query: Annotated[str, "SQL SELECT query to execute"],
+        params: Annotated[list[Any] | None, "Values bound to the query's placeholders ($1, $2, ...)"] = None,
+        format: Annotated[str | None, "Output format: json, columnar or csv (default: server setting)"] = None,
+        timeout: Annotated[float | None, "Seconds before the statement is cancelled (default: server setting)"] = None,
     ) -> str:
-        """Execute a read-only query on the PostgreSQL database. Only SELECT, SHOW, DESCRIBE, EXPLAIN, WITH are allowed on read-only databases."""
-        rows = await query_pg(_conn, config, query)
-        return _format(rows)
+        """Execute a read-only query on the PostgreSQL database. Only SELECT, SHOW, DESCRIBE, EXPLAIN, WITH are allowed on read-only databases. Large results are truncated (see "truncated" in the response)."""
+        return await _run_query(
+            query, params, lambda: query_pg(_conn, config, query, _timeout(timeout), params), format
+        )
 
 elif config.is_sqlite:
 
-    @mcp.tool()
+    @_tool
     async def query(
         query: Annotated[str, "SQL SELECT query to execute"],
+        params: Annotated[list[Any] | None, "Values bound to the query's placeholders (?)"] = None,
+        format: Annotated[str | None, "Output format: json, columnar or csv (default: server setting)"] = None,
+        timeout: Annotated[float | None, "Seconds before the statement is cancelled (default: server setting)"] = None,
     ) -> str:
-        """Execute a read-only query on the SQLite database. Only SELECT, SHOW, DESCRIBE, EXPLAIN, WITH are allowed on read-only databases."""
-        rows = await query_sqlite(_conn, config, query)
-        return _format(rows)
+        """Execute a read-only query on the SQLite database. Only SELECT, SHOW, DESCRIBE, EXPLAIN, WITH are allowed on read-only databases. Large results are truncated (see "truncated" in the response)."""
+        return await _run_query(
+            query, params, lambda: query_sqlite(_conn, config, query, _timeout(timeout), params), format
+        )
 
 else:
 
-    @mcp.tool()
+    @_tool
     async def query(
         collection: Annotated[str, "Collection name to query"],
         filter: Annotated[dict | None, "MongoDB filter object (default: {})"] = None,
         limit: Annotated[int, "Maximum number of results (default: 100, max: 1000)"] = 100,
+        format: Annotated[str | None, "Output format: json, columnar or csv (default: server setting)"] = None,
+        timeout: Annotated[float | None, "Seconds before the statement is cancelled (default: server setting)"] = None,
     ) -> str:
         """Execute a find query on a MongoDB collection."""
-        rows = await query_mongodb(_conn, collection, filter, limit)
-        return _format(rows)
+        return await _cached(
+            ("query", collection, to_json(filter), limit),
+            lambda: query_mongodb(_conn, collection, filter, limit, _timeout(timeout)),
+            format,
+            f"db.{collection}.find({to_json(filter or {})})",
+            mongo_fingerprint(collection, "find", filter or {}),
+        )
+
+
+# --- Tool: query_many ---
+
+if config.is_mysql:
+
+    @_tool
+    async def query_many(
+        queries: Annotated[list[str], "Read-only SQL queries to run concurrently"],
+        params: Annotated[list[list[Any] | None] | None, "Parameter list for each query, in the same order (%s placeholders)"] = None,
+        concurrency: Annotated[int, "Maximum queries running at once (default: 4, capped by the pool size)"] = 4,
+        timeout: Annotated[float | None, "Seconds before each statement is cancelled (default: server setting)"] = None,
+    ) -> str:
+        """Run several independent read-only queries concurrently on the MySQL database, each on its own pooled connection. Returns the results in order with per-query timings; a failing query reports its error without affecting the others."""
+        return await _gather_queries(
+            queries, params, concurrency, lambda sql, args: query_mysql(_conn, config, sql, _timeout(timeout), args)
+        )
+
+elif config.is_postgresql:
+
+    @_tool
+    async def query_many(
+        queries: Annotated[list[str], "Read-only SQL queries to run concurrently"],
+        params: Annotated[list[list[Any] | None] | None, "Parameter list for each query, in the same order ($1, $2, ... placeholders)"] = None,
+        concurrency: Annotated[int, "Maximum queries running at once (default: 4, capped by the pool size)"] = 4,
+        timeout: Annotated[float | None, "Seconds before each statement is cancelled (default: server setting)"] = None,
+    ) -> str:
+        """Run several independent read-only queries concurrently on the PostgreSQL database, each on its own pooled connection. Returns the results in order with per-query timings; a failing query reports its error without affecting the others."""
+        return await _gather_queries(
+            queries, params, concurrency, lambda sql, args: query_pg(_conn, config, sql, _timeout(timeout), args)
+        )
+
+elif config.is_sqlite:
+
+    @_tool
+    async def query_many(
+        queries: Annotated[list[str], "Read-only SQL queries to run concurrently"],
+        params: Annotated[list[list[Any] | None] | None, "Parameter list for each query, in the same order (? placeholders)"] = None,
+        concurrency: Annotated[int, "Maximum queries running at once (default: 4, capped by DB_SQLITE_READERS)"] = 4,
+        timeout: Annotated[float | None, "Seconds before each statement is cancelled (default: server setting)"] = None,
+    ) -> str:
+        """Run several independent read-only queries concurrently on the SQLite database, each on its own pooled reader. Returns the results in order with per-query timings; a failing query reports its error without affecting the others."""
+        return await _gather_queries(
+            queries, params, concurrency, lambda sql, args: query_sqlite(_conn, config, sql, _timeout(timeout), args)
+        )
+
+
+# --- Tool: query_page / next_page / close_cursor ---
+
+if config.is_mysql:
+
+    @_tool
+    async def query_page(
+        query: Annotated[str, "SQL SELECT query to execute"],
+        page_size: Annotated[int, "Rows per page (default: 100)"] = 100,
+        format: Annotated[str | None, "Output format: json, columnar or csv (default: server setting)"] = None,
+    ) -> str:
+        """Start a paginated read-only query on the MySQL database. Returns the first page and a "cursor" token to pass to next_page (null when there are no more rows)."""
+        _cursors.check_enabled()
+        cursor = _hold_read_slot(await open_cursor_mysql(_conn, config, query))
+        return _format(await _cursors.open(cursor, _page_size(page_size)), format)
+
+elif config.is_postgresql:
+
+    @_tool
+    async def query_page(
+        query: Annotated[str, "SQL SELECT query to execute"],
+        page_size: Annotated[int, "Rows per page (default: 100)"] = 100,
+        format: Annotated[str | None, "Output format: json, columnar or csv (default: server setting)"] = None,
+    ) -> str:
+        """Start a paginated read-only query on the PostgreSQL database. Returns the first page and a "cursor" token to pass to next_page (null when there are no more rows)."""
+        _cursors.check_enabled()
+        cursor = _hold_read_slot(await open_cursor_pg(_conn, config, query))
+        return _format(await _cursors.open(cursor, _page_size(page_size)), format)
+
+elif config.is_sqlite:
+
+    @_tool
+    async def query_page(
+        query: Annotated[str, "SQL SELECT query to execute"],
+        page_size: Annotated[int, "Rows per page (default: 100)"] = 100,
+        format: Annotated[str | None, "Output format: json, columnar or csv (default: server setting)"] = None,
+    ) -> str:
+        """Start a paginated read-only query on the SQLite database. Returns the first page and a "cursor" token to pass to next_page (null when there are no more rows)."""
+        _cursors.check_enabled()
+        cursor = _hold_read_slot(await open_cursor_sqlite(_conn, config, query))
+        return _format(await _cursors.open(cursor, _page_size(page_size)), format)
+
+else:
+
+    @_tool
+    async def query_page(
+        collection: Annotated[str, "Collection name to query"],
+        filter: Annotated[dict | None, "MongoDB filter object (default: {})"] = None,
+        page_size: Annotated[int, "Documents per page (default: 100)"] = 100,
+        format: Annotated[str | None, "Output format: json, columnar or csv (default: server setting)"] = None,
+    ) -> str:
+        """Start a paginated find query on a MongoDB collection. Returns the first page and a "cursor" token to pass to next_page (null when there are no more documents)."""
+        _cursors.check_enabled()
+        size = _page_size(page_size)
+        cursor = await open_cursor_mongodb(_conn, collection, filter, size)
+        return _format(await _cursors.open(cursor, size), format)
+
+
+@_tool
+async def next_page(
+    cursor: Annotated[str, "Cursor token returned by query_page or next_page"],
+    format: Annotated[str | None, "Output format: json, columnar or csv (default: server setting)"] = None,
+) -> str:
+    """Fetch the next page of a paginated query. Cursors expire after a period of inactivity."""
+    return _format(await _cursors.next(cursor), format)
+
+
+@_tool
+async def close_cursor(
+    cursor: Annotated[str, "Cursor token returned by query_page or next_page"],
+) -> str:
+    """Close a paginated query cursor that is no longer needed, releasing its connection."""
+    return _format({"closed": await _cursors.close(cursor)})
 
 
 # --- Tool: execute (MySQL / PostgreSQL only) ---
 
 if config.is_mysql:
 
-    @mcp.tool()
+    @_tool
     async def execute(
         query: Annotated[str, "SQL query to execute (INSERT, UPDATE, DELETE, etc.)"],
+        params: Annotated[list[Any] | None, "Values bound to the statement's placeholders (%s)"] = None,
+        timeout: Annotated[float | None, "Seconds before the statement is cancelled (default: server setting)"] = None,
     ) -> str:
         """Execute a write query on the MySQL database. Only works if the database is configured with mode='read-write'."""
-        result = await execute_mysql(_conn, config, query)
-        return _format(result)
+        out = await _load(
+            lambda: execute_mysql(_conn, config, query, _timeout(timeout), params), None, query
+        )
+        _cache.invalidate()
+        return out
 
 elif config.is_postgresql:
 
-    @mcp.tool()
+    @_tool
     async def execute(
         query: Annotated[str, "SQL query to execute (INSERT, UPDATE, DELETE, etc.)"],
+        params: Annotated[list[Any] | None, "Values bound to the statement's placeholders ($1, $2, ...)"] = None,
+        timeout: Annotated[float | None, "Seconds before the statement is cancelled (default: server setting)"] = None,
     ) -> str:
         """Execute a write query on the PostgreSQL database. Only works if the database is configured with mode='read-write'."""
-        result = await execute_pg(_conn, config, query)
-        return _format(result)
+        out = await _load(
+            lambda: execute_pg(_conn, config, query, _timeout(timeout), params), None, query
+        )
+        _cache.invalidate()
+        return out
 
 elif config.is_sqlite:
 
-    @mcp.tool()
+    @_tool
     async def execute(
         query: Annotated[str, "SQL query to execute (INSERT, UPDATE, DELETE, etc.)"],
+        params: Annotated[list[Any] | None, "Values bound to the statement's placeholders (?)"] = None,
+        timeout: Annotated[float | None, "Seconds before the statement is cancelled (default: server setting)"] = None,
     ) -> str:
         """Execute a write query on the SQLite database. Only works if the database is configured with mode='read-write'."""
-        result = await execute_sqlite(_conn, config, query)
-        return _format(result)
+        out = await _load(
+            lambda: execute_sqlite(_conn, config, query, _timeout(timeout), params), None, query
+        )
+        _cache.invalidate()
+        return out
+
+
+# --- Tool: batch_execute / bulk_insert / bulk_write ---
+
+
+async def _write(statement: str, load: Callable[[], Awaitable[Any]], fp: str | None = None) -> str:
+    """Run a write tool call, then drop cached reads.
+
+    Calls rejected before anything is sent (read-only mode, invalid
+    arguments) raise ValueError and leave the cache alone; any other failure
+    still invalidates, since DDL may have committed.
+    """
+    try:
+        out = await _load(load, None, statement, fp)
+    except ValueError:
+        raise
+    except BaseException:
+        _cache.invalidate()
+        raise
+    _cache.invalidate()
+    return out
+
+
+if config.is_mysql:
+
+    @_tool
+    async def batch_execute(
+        statements: Annotated[list[str] | None, "SQL statements to run in order"] = None,
+        statement: Annotated[str | None, "Parameterized statement run once per row (%s placeholders)"] = None,
+        rows: Annotated[list[list[Any]] | None, "Parameter values, one array per row"] = None,
+        timeout: Annotated[float | None, "Seconds before the batch is cancelled (default: server setting)"] = None,
+    ) -> str:
+        """Run a list of write statements, or one parameterized statement for many rows, in a single transaction on the MySQL database. Reports affected rows per batch; nothing is committed if any statement fails. Only works if the database is configured with mode='read-write'."""
+        return await _write(
+            statement or "; ".join(statements or ()),
+            lambda: batch_execute_mysql(_conn, config, statement, rows, statements, _timeout(timeout)),
+        )
+
+    @_tool
+    async def bulk_insert(
+        table: Annotated[str, "Table to insert into"],
+        columns: Annotated[list[str], "Column names, in the order of the row values"],
+        rows: Annotated[list[list[Any]], "Rows to insert, one array of values per row"],
+        timeout: Annotated[float | None, "Seconds before the batch is cancelled (default: server setting)"] = None,
+    ) -> str:
+        """Insert many rows into a MySQL table in a single transaction, as multi-row INSERTs of up to 1000 rows. Only works if the database is configured with mode='read-write'."""
+        return await _write(
+            f"bulk_insert {table} ({', '.join(columns)})",
+            lambda: bulk_insert_mysql(_conn, config, table, columns, rows, _timeout(timeout)),
+        )
+
+elif config.is_postgresql:
+
+    @_tool
+    async def batch_execute(
+        statements: Annotated[list[str] | None, "SQL statements to run in order"] = None,
+        statement: Annotated[str | None, "Parameterized statement run once per row ($1, $2, ... placeholders)"] = None,
+        rows: Annotated[list[list[Any]] | None, "Parameter values, one array per row"] = None,
+        timeout: Annotated[float | None, "Seconds before the batch is cancelled (default: server setting)"] = None,
+    ) -> str:
+        """Run a list of write statements, or one parameterized statement for many rows, in a single transaction on the PostgreSQL database. Reports affected rows per batch; nothing is committed if any statement fails. Only works if the database is configured with mode='read-write'."""
+        return await _write(
+            statement or "; ".join(statements or ()),
+            lambda: batch_execute_pg(_conn, config, statement, rows, statements, _timeout(timeout)),
+        )
+
+    @_tool
+    async def bulk_insert(
+        table: Annotated[str, "Table to insert into"],
+        columns: Annotated[list[str], "Column names, in the order of the row values"],
+        rows: Annotated[list[list[Any]], "Rows to insert, one array of values per row"],
+        timeout: Annotated[float | None, "Seconds before the batch is cancelled (default: server setting)"] = None,
+    ) -> str:
+        """Insert many rows into a PostgreSQL table in a single transaction using COPY, 1000 rows per batch. Only works if the database is configured with mode='read-write'."""
+        return await _write(
+            f"bulk_insert {table} ({', '.join(columns)})",
+            lambda: bulk_insert_pg(_conn, config, table, columns, rows, _timeout(timeout)),
+        )
+
+elif config.is_sqlite:
+
+    @_tool
+    async def batch_execute(
+        statements: Annotated[list[str] | None, "SQL statements to run in order"] = None,
+        statement: Annotated[str | None, "Parameterized statement run once per row (? placeholders)"] = None,
+        rows: Annotated[list[list[Any]] | None, "Parameter values, one array per row"] = None,
+        timeout: Annotated[float | None, "Seconds before the batch is cancelled (default: server setting)"] = None,
+    ) -> str:
+        """Run a list of write statements, or one parameterized statement for many rows, in a single transaction on the SQLite database. Reports affected rows per batch; nothing is committed if any statement fails. Only works if the database is configured with mode='read-write'."""
+        return await _write(
+            statement or "; ".join(statements or ()),
+            lambda: batch_execute_sqlite(_conn, config, statement, rows, statements, _timeout(timeout)),
+        )
+
+    @_tool
+    async def bulk_insert(
+        table: Annotated[str, "Table to insert into"],
+        columns: Annotated[list[str], "Column names, in the order of the row values"],
+        rows: Annotated[list[list[Any]], "Rows to insert, one array of values per row"],
+        timeout: Annotated[float | None, "Seconds before the batch is cancelled (default: server setting)"] = None,
+    ) -> str:
+        """Insert many rows into a SQLite table in a single transaction with executemany, 1000 rows per batch. Only works if the database is configured with mode='read-write'."""
+        return await _write(
+            f"bulk_insert {table} ({', '.join(columns)})",
+            lambda: bulk_insert_sqlite(_conn, config, table, columns, rows, _timeout(timeout)),
+        )
+
+else:
+
+    @_tool
+    async def bulk_insert(
+        collection: Annotated[str, "Collection to insert into"],
+        documents: Annotated[list[dict[str, Any]], "Documents to insert"],
+        timeout: Annotated[float | None, "Seconds before the batch is cancelled (default: server setting)"] = None,
+    ) -> str:
+        """Insert many documents into a MongoDB collection with insert_many (1000 per batch), in order, stopping at the first error. Only works if the database is configured with mode='read-write'."""
+        return await _write(
+            f"db.{collection}.insertMany([{len(documents)} documents])",
+            lambda: bulk_insert_mongodb(_conn, config, collection, documents, _timeout(timeout)),
+            f"db.{collection}.insertMany(...)",
+        )
+
+    @_tool
+    async def bulk_write(
+        collection: Annotated[str, "Collection to write to"],
+        operations: Annotated[
+            list[dict[str, Any]],
+            'Operations such as {"insertOne": {"document": ...}}, {"updateOne"/"updateMany": {"filter", "update", "upsert"}}, '
+            '{"replaceOne": {"filter", "replacement", "upsert"}}, {"deleteOne"/"deleteMany": {"filter"}}',
+        ],
+        timeout: Annotated[float | None, "Seconds before the batch is cancelled (default: server setting)"] = None,
+    ) -> str:
+        """Run insert/update/replace/delete operations on a MongoDB collection with bulk_write, in order, stopping at the first error (not a transaction). Reports counts per batch. Only works if the database is configured with mode='read-write'."""
+        return await _write(
+            f"db.{collection}.bulkWrite({to_json(operations)})",
+            lambda: bulk_write_mongodb(_conn, config, collection, operations, _timeout(timeout)),
+            f"db.{collection}.bulkWrite(...)",
+        )
 
 
 # --- Tool: describe ---
 
 if config.is_mysql:
 
-    @mcp.tool()
+    @_tool
     async def describe(
         table: Annotated[str, "Table name to describe"],
     ) -> str:
         """Describe the structure of a MySQL table (DESCRIBE)."""
-        rows = await describe_mysql(_conn, table)
-        return _format(rows)
+        return await _cached(("describe", table), lambda: describe_mysql(_conn, table))
 
 elif config.is_postgresql:
 
-    @mcp.tool()
+    @_tool
     async def describe(
         table: Annotated[str, "Table name to describe"],
     ) -> str:
         """Describe the structure of a PostgreSQL table (column info from information_schema)."""
-        rows = await describe_pg(_conn, table)
-        return _format(rows)
+        return await _cached(("describe", table), lambda: describe_pg(_conn, table))
 
 elif config.is_sqlite:
 
-    @mcp.tool()
+    @_tool
     async def describe(
         table: Annotated[str, "Table name to describe"],
     ) -> str:
         """Describe the structure of a SQLite table (PRAGMA table_info)."""
-        rows = await describe_sqlite(_conn, table)
-        return _format(rows)
+        return await _cached(("describe", table), lambda: describe_sqlite(_conn, table))
 
 else:
 
-    @mcp.tool()
+    @_tool
     async def describe(
         collection: Annotated[str, "Collection name to describe"],
     ) -> str:
         """Describe the structure of a MongoDB collection ($collStats)."""
-        rows = await describe_mongodb(_conn, collection)
-        return _format(rows)
+        return await _cached(("describe", collection), lambda: describe_mongodb(_conn, collection))
+
+
+# --- Tool: describe_all (MySQL / PostgreSQL / SQLite) ---
+
+if config.is_mysql:
+
+    @_tool
+    async def describe_all() -> str:
+        """Describe every table in the MySQL database at once: columns, types, nullability, primary keys, foreign keys and indexes."""
+        return await _cached(("describe_all",), lambda: describe_all_mysql(_conn, _catalog))
+
+elif config.is_postgresql:
+
+    @_tool
+    async def describe_all() -> str:
+        """Describe every table in the PostgreSQL database (public schema) at once: columns, types, nullability, primary keys, foreign keys and indexes."""
+        return await _cached(("describe_all",), lambda: describe_all_pg(_conn, _catalog))
+
+elif config.is_sqlite:
+
+    @_tool
+    async def describe_all() -> str:
+        """Describe every table in the SQLite database at once: columns, types, nullability, primary keys, foreign keys and indexes."""
+        return await _cached(("describe_all",), lambda: describe_all_sqlite(_conn, _catalog))
 
 
 # --- Tool: list_tables (MySQL / PostgreSQL / SQLite) ---
 
 if config.is_mysql:
 
-    @mcp.tool()
+    @_tool
     async def list_tables() -> str:
         """List all tables in the MySQL database."""
-        rows = await _list_tables(_conn)
-        return _format(rows)
+        return await _cached(("list_tables",), lambda: _list_tables(_conn))
 
 elif config.is_postgresql:
 
-    @mcp.tool()
+    @_tool
     async def list_tables() -> str:
         """List all tables in the PostgreSQL database (public schema)."""
-        rows = await _list_tables_pg(_conn)
-        return _format(rows)
+        return await _cached(("list_tables",), lambda: _list_tables_pg(_conn))
 
 elif config.is_sqlite:
 
-    @mcp.tool()
+    @_tool
     async def list_tables() -> str:
         """List all tables in the SQLite database."""
-        rows = await _list_tables_sqlite(_conn)
-        return _format(rows)
+        return await _cached(("list_tables",), lambda: _list_tables_sqlite(_conn))
 
 
 # --- Tool: list_collections (MongoDB only) ---
 
 if config.is_mongodb:
 
-    @mcp.tool()
+    @_tool
     async def list_collections() -> str:
         """List all collections in the MongoDB database."""
-        names = await _list_collections(_conn)
-        return _format(names)
+        return await _cached(("list_collections",), lambda: _list_collections(_conn))
 
 
 # --- Tool: aggregate (MongoDB only) ---
 
 if config.is_mongodb:
 
-    @mcp.tool()
+    @_tool
     async def aggregate(
         collection: Annotated[str, "Collection name to aggregate"],
         pipeline: Annotated[list[dict[str, Any]], "MongoDB aggregation pipeline array"],
+        timeout: Annotated[float | None, "Seconds before the statement is cancelled (default: server setting)"] = None,
     ) -> str:
         """Execute an aggregation pipeline on a MongoDB collection. Pipelines with $out/$merge are blocked on read-only databases."""
-        rows = await aggregate_mongodb(_conn, config, collection, pipeline)
-        return _format(rows)
+
+        async def load() -> list[dict]:
+            return await aggregate_mongodb(_conn, config, collection, pipeline, _timeout(timeout))
+
+        statement = f"db.{collection}.aggregate({to_json(pipeline)})"
+        fp = mongo_fingerprint(collection, "aggregate", pipeline)
+        if _pipeline_writes(pipeline):
+            out = await _load(load, None, statement, fp)
+            _cache.invalidate()
+            return out
+        return await _cached(("aggregate", collection, to_json(pipeline)), load, None, statement, fp)
 
 
 # --- Tool: status ---
@@ -222,8 +769,50 @@ if config.is_mongodb:
 
 @mcp.tool()
 async def status() -> str:
-    """Show connection info: type, host, database, mode, status."""
-    return _format(get_status(config))
+    """Show connection info: type, host, database, mode, status, pool, cache, coalescing and admission stats."""
+    return _format(
+        {
+            **get_status(config, _conn),
+            "cache": _cache.stats(),
+            "coalescing": _inflight.stats(),
+            "schemaCatalog": _catalog.stats(),
+            "queryLog": _querylog.stats(),
+            "admission": _admission.stats(),
+        }
+    )
+
+
+# --- Tool: top_queries ---
+
+
+@mcp.tool()
+async def top_queries(
+    limit: Annotated[int, "Number of fingerprints to return (default: 10)"] = 10,
+    order_by: Annotated[str, "Rank by total, mean or max time, or count (default: total)"] = "total",
+) -> str:
+    """Show the most expensive query fingerprints (literals stripped) with count, total/mean/max time, rows and bytes, plus recent slow queries."""
+    return _format(
+        {
+            **_querylog.stats(),
+            "top": _querylog.top(limit, order_by),
+            "recentSlow": list(_querylog.recent)[-limit:],
+        }
+    )
+
+
+# --- Tool: metrics ---
+
+
+@mcp.tool()
+async def metrics(
+    format: Annotated[str, "json, or prometheus for the text exposition format"] = "json",
+) -> str:
+    """Show per-tool call counts, rows, bytes and p50/p95/p99 latency per phase (acquire, validate, execute, convert, format). Requires DB_METRICS=true."""
+    if _metrics is None:
+        return _format({"enabled": False, "hint": "Set DB_METRICS=true to collect tool metrics."})
+    if format == "prometheus":
+        return _metrics.prometheus()
+    return _format(_metrics.snapshot())
 
 
 def main() -> None:
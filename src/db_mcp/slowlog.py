@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import json
+import re
+import sys
+import time
+from collections import deque
+from typing import Any
+
+from db_mcp.encoding import to_json
+
+# Fingerprints tracked at once; beyond that the cheapest one is dropped.
+_MAX_FINGERPRINTS = 1000
+# Recent slow statements kept for the top_queries tool.
+_RECENT_SLOW = 50
+# Longest sample statement kept per fingerprint.
+_SAMPLE_CHARS = 500
+
+# Single-quoted strings, comments and numeric literals; double-quoted and
+# backtick-quoted identifiers are skipped so their digits survive.
+_LITERAL_RE = re.compile(
+    r"""('(?:[^'\\]|\\.|'')*')"""
+    r"""|("(?:[^"\\]|\\.)*"|`[^`]*`)"""
+    r"""|(--[^\n]*|/\*.*?\*/)"""
+    r"""|(\b0x[0-9a-f]+\b|\b\d+(?:\.\d*)?(?:e[+-]?\d+)?\b)""",
+    re.DOTALL | re.IGNORECASE,
+)
+_PLACEHOLDERS = r"\?(?:\s*,\s*\?)*"
+_IN_LIST_RE = re.compile(rf"\bIN\s*\(\s*{_PLACEHOLDERS}\s*\)", re.IGNORECASE)
+_VALUES_RE = re.compile(
+    rf"(\(\s*{_PLACEHOLDERS}\s*\))(?:\s*,\s*\(\s*{_PLACEHOLDERS}\s*\))+"
+)
+_WS_RE = re.compile(r"\s+")
+
+
+def _strip_literal(m: re.Match[str]) -> str:
+    if m.group(2):
+        return m.group(2)
+    if m.group(3):
+        return " "
+    return "?"
+
+
+def fingerprint(sql: str) -> str:
+    """*sql* with literals replaced by ``?``, comments dropped and whitespace collapsed.
+
+    ``IN (?, ?, ...)`` lists and multi-row ``VALUES`` collapse to one
+    placeholder group, so queries differing only in list length share a
+    fingerprint.
+    """
+    text = _LITERAL_RE.sub(_strip_literal, sql)
+    text = _IN_LIST_RE.sub("IN (...)", text)
+    text = _VALUES_RE.sub(r"\1", text)
+    return _WS_RE.sub(" ", text).strip().rstrip(";").rstrip()
+
+
+def _shape(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _shape(v) for k, v in value.items()}
+    if isinstance(value, list):
+        # Lists of values ($in, $nin) collapse like SQL IN lists.
+        shaped = [_shape(v) for v in value]
+        if all(v == "?" for v in shaped):
+            return "?" if shaped else []
+        return shaped
+    return "?"
+
+
+def mongo_fingerprint(collection: str, op: str, spec: Any) -> str:
+    """Fingerprint of a MongoDB call: field names and operators kept, values replaced."""
+    return f"db.{collection}.{op}({to_json(_shape(spec))})"
+
+
+class _Stats:
+    __slots__ = ("count", "errors", "total", "max", "rows", "bytes", "sample")
+
+    def __init__(self, sample: str) -> None:
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.bytes = 0
+        self.sample = sample[:_SAMPLE_CHARS]
+
+
+class QueryLog:
+    """Per-fingerprint statement statistics and a slow-query log.
+
+    Statements at or above ``slow_ms`` are logged as JSON lines to
+    ``path`` (stderr when empty) and kept in a short in-memory list; a
+    ``slow_ms`` of 0 logs nothing.  Only statements that reached the
+    database are recorded: cache hits and coalesced calls are not.
+    """
+
+    def __init__(self, slow_ms: float, path: str = "") -> None:
+        self.slow_ms = slow_ms
+        self.path = path
+        self._stats: dict[str, _Stats] = {}
+        self.recent: deque[dict] = deque(maxlen=_RECENT_SLOW)
+        self.slow = 0
+
+    def record(
+        self,
+        statement: str,
+        seconds: float,
+        rows: int = 0,
+        nbytes: int = 0,
+        error: str | None = None,
+        fp: str | None = None,
+    ) -> None:
+        fp = fp if fp is not None else fingerprint(statement)
+        stats = self._stats.get(fp)
+        if stats is None:
+            if len(self._stats) >= _MAX_FINGERPRINTS:
+                cheapest = min(self._stats, key=lambda k: self._stats[k].total)
+                del self._stats[cheapest]
+            stats = self._stats[fp] = _Stats(statement)
+        stats.count += 1
+        stats.total += seconds
+        stats.max = max(stats.max, seconds)
+        stats.rows += rows
+        stats.bytes += nbytes
+        if error is not None:
+            stats.errors += 1
+
+        ms = seconds * 1000
+        if self.slow_ms and ms >= self.slow_ms:
+            self.slow += 1
+            entry: dict[str, Any] = {
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "ms": round(ms, 1),
+                "rows": rows,
+                "bytes": nbytes,
+                "fingerprint": fp,
+            }
+            if error is not None:
+                entry["error"] = error
+            self.recent.append(entry)
+            self._write(entry)
+
+    def _write(self, entry: dict) -> None:
+        line = json.dumps(entry)
+        if not self.path:
+            print(f"[db-mcp] Slow query: {line}", file=sys.stderr)
+            return
+        try:
+            with open(self.path, "a") as f:
+                f.write(line + "\n")
+        except OSError as exc:
+            print(f"[db-mcp] Could not write slow-query log {self.path}: {exc}", file=sys.stderr)
+
+    def top(self, limit: int, order_by: str = "total") -> list[dict]:
+        """The *limit* most expensive fingerprints by total, mean or max time, or count."""
+        keys = {
+            "total": lambda s: s.total,
+            "mean": lambda s: s.total / s.count,
+            "max": lambda s: s.max,
+            "count": lambda s: s.count,
+        }
+        if order_by not in keys:
+            raise ValueError(f"order_by must be one of {', '.join(keys)}; got {order_by!r}")
+        ranked = sorted(self._stats.items(), key=lambda item: keys[order_by](item[1]), reverse=True)
+        return [
+            {
+                "fingerprint": fp,
+                "count": s.count,
+                "errors": s.errors,
+                "totalMs": round(s.total * 1000, 1),
+                "meanMs": round(s.total / s.count * 1000, 1),
+                "maxMs": round(s.max * 1000, 1),
+                "rows": s.rows,
+                "bytes": s.bytes,
+                "sample": s.sample,
+            }
+            for fp, s in ranked[: max(1, limit)]
+        ]
+
+    def stats(self) -> dict:
+        return {
+            "fingerprints": len(self._stats),
+            "slowThresholdMs": self.slow_ms,
+            "slowQueries": self.slow,
+        }
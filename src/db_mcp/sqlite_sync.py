@@ -0,0 +1,312 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shlex
+import sys
+import tempfile
+from pathlib import Path
+from typing import IO, Any
+
+import paramiko
+
+from db_mcp.config import Config
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking of mirrors.
+    fcntl = None  # type: ignore[assignment]
+
+BLOCK_SIZE = 256 * 1024
+# Blocks requested per SFTP readv call; bounds memory to 16 MiB per batch.
+_READV_BATCH = 64
+
+# Run remotely as `python3 -c`: prints the file size, then one SHA-1 per block.
+_REMOTE_HASHER = """
+import hashlib, os, sys
+f = open(sys.argv[1], "rb")
+w = sys.stdout.write
+w("%d\\n" % os.fstat(f.fileno()).st_size)
+while True:
+    b = f.read(int(sys.argv[2]))
+    if not b:
+        break
+    w(hashlib.sha1(b).hexdigest() + "\\n")
+"""
+
+
+def cache_dir(cfg: Config) -> Path:
+    return Path(os.path.expanduser(cfg.sqlite_cache_dir))
+
+
+def _mirror_name(cfg: Config) -> str:
+    key = f"{cfg.ssh_user}@{cfg.ssh_host}:{cfg.ssh_port}:{cfg.db_path}"
+    return hashlib.sha1(key.encode()).hexdigest()[:20]
+
+
+class SqliteMirror:
+    """Local copy of a remote SQLite file, kept in sync block by block.
+
+    The remote file is hashed in ``BLOCK_SIZE`` blocks by a small Python
+    helper run over SSH exec; only blocks whose hash differs from the local
+    copy are transferred, with pipelined SFTP reads (``readv``) or writes.
+    The local block hashes are kept next to the mirror, so a later session
+    only re-reads the local file if it changed outside this process.
+
+    When the remote host has no ``python3`` the whole file is transferred.
+    """
+
+    def __init__(
+        self,
+        client: paramiko.SSHClient,
+        remote_path: str,
+        local_path: Path,
+        block_size: int = BLOCK_SIZE,
+    ) -> None:
+        self.client = client
+        self.remote_path = remote_path
+        self.local_path = local_path
+        self.block_size = block_size
+        self._index_path = local_path.with_name(local_path.name + ".blocks")
+
+    # -- hashing ---------------------------------------------------------
+
+    def _remote_hashes(self) -> tuple[int, list[str]] | None:
+        cmd = "python3 -c {} {} {}".format(
+            shlex.quote(_REMOTE_HASHER), shlex.quote(self.remote_path), self.block_size
+        )
+        _, stdout, stderr = self.client.exec_command(cmd)
+        lines = stdout.read().decode().split()
+        if stdout.channel.recv_exit_status() != 0 or not lines:
+            err = stderr.read().decode().strip()
+            print(f"[db-mcp] Remote block hashing unavailable: {err}", file=sys.stderr)
+            return None
+        return int(lines[0]), lines[1:]
+
+    def _index(self) -> dict[str, Any] | None:
+        """The saved index, if it still describes the local file."""
+        try:
+            st = self.local_path.stat()
+            index = json.loads(self._index_path.read_text())
+            if (
+                index["blockSize"] == self.block_size
+                and index["size"] == st.st_size
+                and index["mtimeNs"] == st.st_mtime_ns
+            ):
+                return index
+        except (OSError, ValueError, KeyError):
+            pass
+        return None
+
+    def _local_hashes(self) -> list[str]:
+        """Block hashes of the local file, from the index when it is current."""
+        index = self._index()
+        if index is not None:
+            return index["hashes"]
+        if not self.local_path.exists():
+            return []
+        hashes = []
+        with open(self.local_path, "rb") as f:
+            while block := f.read(self.block_size):
+                hashes.append(hashlib.sha1(block).hexdigest())
+        return hashes
+
+    def _remote_stamp(self, sftp: paramiko.SFTPClient) -> list[Any]:
+        """Size, mtime and SQLite file change counter of the remote file.
+
+        SFTP mtimes have one-second resolution; the change counter (header
+        bytes 24-27, bumped on every commit outside WAL mode) catches
+        same-size rewrites within that second.
+        """
+        attrs = sftp.stat(self.remote_path)
+        with sftp.open(self.remote_path, "rb") as f:
+            counter = f.read(28)[24:]
+        return [attrs.st_size or 0, attrs.st_mtime, counter.hex()]
+
+    def _save_index(self, hashes: list[str], remote_stamp: list[Any]) -> None:
+        st = self.local_path.stat()
+        index = {
+            "blockSize": self.block_size,
+            "size": st.st_size,
+            "mtimeNs": st.st_mtime_ns,
+            # Remote file as of the last sync: if unchanged, skip the next one.
+            "remoteStamp": remote_stamp,
+            "hashes": hashes,
+        }
+        self._index_path.write_text(json.dumps(index))
+
+    def _ranges(self, blocks: list[int], size: int) -> list[tuple[int, int]]:
+        return [
+            (i * self.block_size, min(self.block_size, size - i * self.block_size))
+            for i in blocks
+        ]
+
+    # -- transfer --------------------------------------------------------
+
+    def pull(self, verify: bool = False) -> dict[str, Any]:
+        """Bring the local copy up to date with the remote file.
+
+        If the remote size, mtime and change counter match the last sync,
+        nothing is transferred; with *verify*, block hashes are compared
+        regardless.
+        """
+        # Journal files left by an earlier session would be replayed onto
+        # the freshly synced pages.
+        for suffix in ("-wal", "-shm", "-journal"):
+            Path(f"{self.local_path}{suffix}").unlink(missing_ok=True)
+
+        sftp = self.client.open_sftp()
+        try:
+            stamp = self._remote_stamp(sftp)
+            size = stamp[0]
+            index = self._index()
+            if not verify and index is not None and index.get("remoteStamp") == stamp:
+                return {"blocks": len(index["hashes"]), "transferred": 0, "bytes": 0, "cached": True}
+
+            remote = self._remote_hashes()
+            if remote is None:
+                changed = list(range(-(-size // self.block_size)))
+            else:
+                size, hashes = remote
+                local = self._local_hashes()
+                changed = [
+                    i for i, h in enumerate(hashes) if i >= len(local) or local[i] != h
+                ]
+            # The mirror is a full copy of the database: readable by its owner only.
+            flags = os.O_CREAT | os.O_RDWR | getattr(os, "O_BINARY", 0)
+            fd = os.open(self.local_path, flags, 0o600)
+            with os.fdopen(fd, "r+b") as out, sftp.open(self.remote_path, "rb") as src:
+                ranges = self._ranges(changed, size)
+                for start in range(0, len(ranges), _READV_BATCH):
+                    batch = ranges[start : start + _READV_BATCH]
+                    for (offset, _), data in zip(batch, src.readv(batch)):
+                        out.seek(offset)
+                        out.write(data)
+                out.truncate(size)
+        finally:
+            sftp.close()
+        self._save_index(hashes if remote is not None else self._local_hashes(), stamp)
+        return {
+            "blocks": -(-size // self.block_size),
+            "transferred": len(changed),
+            "bytes": sum(n for _, n in self._ranges(changed, size)),
+            "cached": False,
+        }
+
+    def discard(self) -> None:
+        """Delete the local copy, its index and any journal files."""
+        for path in (self.local_path, self._index_path):
+            path.unlink(missing_ok=True)
+        for suffix in ("-wal", "-shm", "-journal"):
+            Path(f"{self.local_path}{suffix}").unlink(missing_ok=True)
+
+    def push(self) -> dict[str, Any]:
+        """Write local changes back to the remote file."""
+        local = self._local_hashes()
+        size = self.local_path.stat().st_size
+        remote = self._remote_hashes()
+        if remote is None:
+            changed = list(range(len(local)))
+        else:
+            _, hashes = remote
+            changed = [i for i, h in enumerate(local) if i >= len(hashes) or hashes[i] != h]
+        sftp = self.client.open_sftp()
+        try:
+            with open(self.local_path, "rb") as src, sftp.open(self.remote_path, "r+b") as out:
+                out.set_pipelined(True)
+                for offset, length in self._ranges(changed, size):
+                    src.seek(offset)
+                    out.seek(offset)
+                    out.write(src.read(length))
+                out.truncate(size)
+            stamp = self._remote_stamp(sftp)
+        finally:
+            sftp.close()
+        self._save_index(local, stamp)
+        return {
+            "blocks": len(local),
+            "transferred": len(changed),
+            "bytes": sum(n for _, n in self._ranges(changed, size)),
+        }
+
+
+def _lock(path: Path) -> IO | None:
+    """Open and exclusively lock *path*, or return None if another process holds it."""
+    lock = open(path, "a")
+    if fcntl is not None:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock.close()
+            return None
+    return lock
+
+
+def _mirror_files(directory: Path, name: str) -> list[Path]:
+    db = directory / f"{name}.db"
+    return [
+        db,
+        directory / f"{name}.db.blocks",
+        *(directory / f"{name}.db{suffix}" for suffix in ("-wal", "-shm", "-journal")),
+    ]
+
+
+def evict_mirrors(cfg: Config, keep: Path) -> None:
+    """Delete least recently used mirrors until the cache fits its size cap.
+
+    A mirror's last use is the mtime of its lock file; mirrors open in
+    another process and the *keep* mirror are never evicted.
+    """
+    limit = cfg.sqlite_cache_max_bytes
+    if not limit:
+        return
+    directory = keep.parent
+    mirrors = []
+    total = 0
+    for lock_path in directory.glob("*.lock"):
+        name = lock_path.stem
+        size = sum(p.stat().st_size for p in _mirror_files(directory, name) if p.exists())
+        total += size
+        if directory / f"{name}.db" != keep:
+            mirrors.append((lock_path.stat().st_mtime, name, size))
+    for _, name, size in sorted(mirrors):
+        if total <= limit:
+            break
+        lock = _lock(directory / f"{name}.lock")
+        if lock is None:
+            continue
+        try:
+            for path in _mirror_files(directory, name):
+                path.unlink(missing_ok=True)
+            (directory / f"{name}.lock").unlink(missing_ok=True)
+        finally:
+            lock.close()
+        total -= size
+        print(f"[db-mcp] Evicted SQLite mirror {name} ({size} bytes).", file=sys.stderr)
+
+
+def open_mirror(cfg: Config, client: paramiko.SSHClient) -> tuple[SqliteMirror, IO | None]:
+    """Return the persistent mirror for the configured database and its lock.
+
+    Mirrors live in ``sqlite_cache_dir``.  If another server process holds
+    the mirror, a private temporary copy is used instead (lock is None).
+    """
+    directory = cache_dir(cfg)
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # mkdir leaves an existing directory's mode alone.
+    os.chmod(directory, 0o700)
+    name = _mirror_name(cfg)
+    lock_path = directory / f"{name}.lock"
+    lock = _lock(lock_path)
+    if lock is None:
+        # mkstemp creates the file with mode 0600; pull() reuses it in place.
+        fd, tmp = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        print(
+            "[db-mcp] SQLite mirror in use by another process, using a temporary copy.",
+            file=sys.stderr,
+        )
+        return SqliteMirror(client, cfg.db_path, Path(tmp)), None
+    os.utime(lock_path)  # last use, for LRU eviction
+    return SqliteMirror(client, cfg.db_path, directory / f"{name}.db"), lock
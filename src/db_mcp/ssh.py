@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import os
+import sys
+from typing import Any
+
+import paramiko
+
+# Compatibility shim: paramiko >=4 removed DSSKey (DSA is deprecated).
+# sshtunnel 0.4.0 still references it, so we provide a stub to prevent crashes.
+if not hasattr(paramiko, "DSSKey"):
+
+    class _DSSKeyStub:
+        """Stub that makes sshtunnel skip DSA keys gracefully."""
+
+        @classmethod
+        def from_private_key_file(cls, *a: Any, **kw: Any) -> None:
+            raise paramiko.SSHException("DSA keys not supported")
+
+    paramiko.DSSKey = _DSSKeyStub  # type: ignore[attr-defined]
+
+from sshtunnel import SSHTunnelForwarder
+
+from db_mcp.config import Config, Replica
+
+
+def start_tunnel(cfg: Config, replica: Replica | None = None) -> SSHTunnelForwarder:
+    """Open an SSH tunnel to ``db_host:db_port`` (or *replica*) on a free local port."""
+    if replica is None:
+        ssh_user, ssh_host, ssh_port = cfg.ssh_user, cfg.ssh_host, cfg.ssh_port
+        remote = (cfg.db_host, cfg.db_port)
+    else:
+        ssh_user, ssh_host, ssh_port = replica.ssh_user, replica.ssh_host, replica.ssh_port
+        remote = (replica.host, replica.port)
+    kwargs: dict[str, Any] = {
+        "ssh_username": ssh_user,
+        "remote_bind_address": remote,
+        "local_bind_address": ("127.0.0.1", 0),
+    }
+    if cfg.ssh_key:
+        kwargs["ssh_pkey"] = os.path.expanduser(cfg.ssh_key)
+    if cfg.ssh_password:
+        kwargs["ssh_password"] = cfg.ssh_password
+
+    print(
+        f"[db-mcp] Opening SSH tunnel via {ssh_user}@{ssh_host}:{ssh_port}"
+        f" -> {remote[0]}:{remote[1]}...",
+        file=sys.stderr,
+    )
+    tunnel = SSHTunnelForwarder(
+        (ssh_host, ssh_port),
+        **kwargs,
+    )
+    tunnel.start()
+    print(
+        f"[db-mcp] SSH tunnel established on 127.0.0.1:{tunnel.local_bind_port}.",
+        file=sys.stderr,
+    )
+    return tunnel
+
+
+def open_client(cfg: Config) -> paramiko.SSHClient:
+    """Open an SSH client session to ``ssh_host``."""
+    client = paramiko.SSHClient()
+    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    connect_kwargs: dict[str, Any] = {
+        "hostname": cfg.ssh_host,
+        "port": cfg.ssh_port,
+        "username": cfg.ssh_user,
+    }
+    if cfg.ssh_key:
+        connect_kwargs["key_filename"] = os.path.expanduser(cfg.ssh_key)
+    if cfg.ssh_password:
+        connect_kwargs["password"] = cfg.ssh_password
+    client.connect(**connect_kwargs)
+    return client
+
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+async def run_with_timeout(
+    work: Awaitable[T],
+    timeout: float | None,
+    on_cancel: Callable[[], Awaitable[None]] | None = None,
+) -> T:
+    """Await *work*, cancelling it after *timeout* seconds (None = no limit).
+
+    Cancelling the awaiting coroutine does not stop a statement already
+    running on the server, so *on_cancel* does that: it runs on timeout and
+    also when the calling task is cancelled (e.g. the MCP client cancelled
+    the request).
+    """
+    try:
+        if timeout:
+            return await asyncio.wait_for(work, timeout)
+        return await work
+    except asyncio.TimeoutError:
+        if on_cancel is not None:
+            await on_cancel()
+        raise TimeoutError(
+            f"Statement cancelled after exceeding the {timeout:g}s timeout."
+        ) from None
+    except asyncio.CancelledError:
+        if on_cancel is not None:
+            await asyncio.shield(on_cancel())
+        raise
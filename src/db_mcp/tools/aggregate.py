@@ -4,6 +4,8 @@ from typing import Any
 
 from db_mcp.config import Config
 from db_mcp.connection import Connection
+from db_mcp.metrics import add_rows
+from db_mcp.timeouts import run_with_timeout
 from db_mcp.validation import sanitize_table_name, validate_aggregate_pipeline
 
 
@@ -12,8 +14,12 @@ async def aggregate_mongodb(
     config: Config,
     collection: str,
     pipeline: list[dict[str, Any]],
+    timeout: float | None = None,
 ) -> list[dict]:
     validate_aggregate_pipeline(pipeline, config.is_read_only)
     safe_name = sanitize_table_name(collection)
-    cursor = conn.db[safe_name].aggregate(pipeline)
-    return await cursor.to_list(1000)
+    options = {"maxTimeMS": int(timeout * 1000)} if timeout else {}
+    cursor = conn.db[safe_name].aggregate(pipeline, **options)
+    rows = await run_with_timeout(cursor.to_list(1000), timeout)
+    add_rows(len(rows))
+    return rows
@@ -0,0 +1,368 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Awaitable, Callable, Sequence
+
+from db_mcp.config import Config
+from db_mcp.connection import Connection
+from db_mcp.timeouts import run_with_timeout
+from db_mcp.validation import sanitize_table_name
+
+# Rows sent per executemany / COPY / insert_many call; each is one entry
+# in the "batches" list of the response.
+_BATCH_ROWS = 1000
+
+# Column names are quoted into the statement, so they must be plain
+# identifiers; unlike table names they are not sanitized, since silently
+# dropping characters would insert into a different column.
+_COLUMN_RE = re.compile(r"[A-Za-z0-9_]+")
+
+
+def _require_read_write(config: Config) -> None:
+    if config.is_read_only:
+        raise ValueError(
+            "This database is in READ-ONLY mode. "
+            "Write operations are not allowed."
+        )
+
+
+def _check_batch(
+    statement: str | None, rows: Sequence[Sequence[Any]] | None, statements: Sequence[str] | None
+) -> None:
+    if statements:
+        if statement is not None or rows is not None:
+            raise ValueError("Pass either statements, or statement with rows, not both.")
+    elif statement is None or rows is None:
+        raise ValueError("Pass statements, or a parameterized statement with rows.")
+
+
+def _check_rows(columns: Sequence[str], rows: Sequence[Sequence[Any]]) -> list[str]:
+    if not columns:
+        raise ValueError("At least one column is required.")
+    for i, row in enumerate(rows):
+        if len(row) != len(columns):
+            raise ValueError(
+                f"Row {i} has {len(row)} values but {len(columns)} columns were given."
+            )
+    for name in columns:
+        if not isinstance(name, str) or not _COLUMN_RE.fullmatch(name):
+            raise ValueError(
+                f"Invalid column name: {name!r}. "
+                "Use letters, digits and underscores only."
+            )
+    return list(columns)
+
+
+def _chunks(rows: Sequence[Sequence[Any]]) -> list[list[Any]]:
+    return [list(rows[i : i + _BATCH_ROWS]) for i in range(0, len(rows), _BATCH_ROWS)]
+
+
+def _summary(batches: list[dict]) -> dict:
+    result: dict[str, Any] = {"batches": batches}
+    counts = [b["affectedRows"] for b in batches if "affectedRows" in b]
+    if len(counts) == len(batches):
+        result["affectedRows"] = sum(counts)
+    return result
+
+
+# --- MySQL ---
+
+
+async def _run_mysql(
+    conn: Connection, timeout: float | None, work: Callable[[Any], Awaitable[dict]]
+) -> dict:
+    """Run *work(cursor)* in one transaction on a pooled MySQL connection."""
+    from db_mcp.backends.mysql import connection_reusable
+
+    async with conn.acquire_mysql() as c:
+        async with c.cursor() as cur:
+
+            async def run() -> dict:
+                await c.begin()
+                result = await work(cur)
+                await c.commit()
+                return result
+
+            try:
+                return await run_with_timeout(run(), timeout, lambda: conn.kill_mysql_query(c))
+            except BaseException as exc:
+                if connection_reusable(exc):
+                    try:
+                        await c.rollback()
+                    except Exception:
+                        c.close()
+                else:
+                    # Dropping the connection rolls the transaction back.
+                    c.close()
+                raise
+
+
+async def batch_execute_mysql(
+    conn: Connection,
+    config: Config,
+    statement: str | None = None,
+    rows: Sequence[Sequence[Any]] | None = None,
+    statements: Sequence[str] | None = None,
+    timeout: float | None = None,
+) -> dict:
+    _require_read_write(config)
+    _check_batch(statement, rows, statements)
+
+    async def work(cur: Any) -> dict:
+        batches = []
+        if statements:
+            for sql in statements:
+                await cur.execute(sql)
+                batches.append({"statements": 1, "affectedRows": cur.rowcount})
+        else:
+            for chunk in _chunks(rows):
+                await cur.executemany(statement, chunk)
+                batches.append({"rows": len(chunk), "affectedRows": cur.rowcount})
+        return _summary(batches)
+
+    return await _run_mysql(conn, timeout, work)
+
+
+async def bulk_insert_mysql(
+    conn: Connection,
+    config: Config,
+    table: str,
+    columns: Sequence[str],
+    rows: Sequence[Sequence[Any]],
+    timeout: float | None = None,
+) -> dict:
+    _require_read_write(config)
+    names = _check_rows(columns, rows)
+    # aiomysql rewrites INSERT ... VALUES executemany into multi-row inserts.
+    quoted = ", ".join(f"`{n}`" for n in names)
+    sql = (
+        f"INSERT INTO `{sanitize_table_name(table)}` ({quoted}) "
+        f"VALUES ({', '.join(['%s'] * len(names))})"
+    )
+
+    async def work(cur: Any) -> dict:
+        batches = []
+        for chunk in _chunks(rows):
+            await cur.executemany(sql, chunk)
+            batches.append({"rows": len(chunk), "affectedRows": cur.rowcount})
+        return _summary(batches)
+
+    return await _run_mysql(conn, timeout, work)
+
+
+# --- PostgreSQL ---
+
+
+def _status_count(status: str | None) -> int:
+    match = re.search(r"(\d+)$", status or "")
+    return int(match.group(1)) if match else 0
+
+
+async def batch_execute_pg(
+    conn: Connection,
+    config: Config,
+    statement: str | None = None,
+    rows: Sequence[Sequence[Any]] | None = None,
+    statements: Sequence[str] | None = None,
+    timeout: float | None = None,
+) -> dict:
+    _require_read_write(config)
+    _check_batch(statement, rows, statements)
+
+    async with conn.acquire_pg() as c:
+
+        async def run() -> dict:
+            batches = []
+            async with c.transaction():
+                if statements:
+                    for sql in statements:
+                        status = await c.execute(sql)
+                        batches.append({"statements": 1, "affectedRows": _status_count(status)})
+                else:
+                    # asyncpg pipelines executemany but reports no row counts.
+                    for chunk in _chunks(rows):
+                        await c.executemany(statement, chunk)
+                        batches.append({"rows": len(chunk)})
+            return _summary(batches)
+
+        # On timeout or cancellation asyncpg sends the server a cancel request.
+        return await run_with_timeout(run(), timeout)
+
+
+async def bulk_insert_pg(
+    conn: Connection,
+    config: Config,
+    table: str,
+    columns: Sequence[str],
+    rows: Sequence[Sequence[Any]],
+    timeout: float | None = None,
+) -> dict:
+    _require_read_write(config)
+    names = _check_rows(columns, rows)
+    safe_table = sanitize_table_name(table)
+
+    async with conn.acquire_pg() as c:
+
+        async def run() -> dict:
+            batches = []
+            async with c.transaction():
+                for chunk in _chunks(rows):
+                    status = await c.copy_records_to_table(
+                        safe_table, records=chunk, columns=names
+                    )
+                    batches.append({"rows": len(chunk), "affectedRows": _status_count(status)})
+            return _summary(batches)
+
+        return await run_with_timeout(run(), timeout)
+
+
+# --- SQLite ---
+
+
+async def _run_sqlite(
+    conn: Connection, timeout: float | None, work: Callable[[Any], Awaitable[dict]]
+) -> dict:
+    """Run *work(db)* in one transaction on the SQLite writer."""
+    async with conn.acquire_sqlite(write=True) as db:
+
+        async def run() -> dict:
+            await db.execute("BEGIN")
+            result = await work(db)
+            await db.commit()
+            return result
+
+        # On failure the pool rolls back the open transaction.
+        return await run_with_timeout(run(), timeout, db.interrupt)
+
+
+async def batch_execute_sqlite(
+    conn: Connection,
+    config: Config,
+    statement: str | None = None,
+    rows: Sequence[Sequence[Any]] | None = None,
+    statements: Sequence[str] | None = None,
+    timeout: float | None = None,
+) -> dict:
+    _require_read_write(config)
+    _check_batch(statement, rows, statements)
+
+    async def work(db: Any) -> dict:
+        batches = []
+        if statements:
+            for sql in statements:
+                async with db.execute(sql) as cur:
+                    batches.append({"statements": 1, "affectedRows": cur.rowcount})
+        else:
+            for chunk in _chunks(rows):
+                async with db.executemany(statement, chunk) as cur:
+                    batches.append({"rows": len(chunk), "affectedRows": cur.rowcount})
+        return _summary(batches)
+
+    return await _run_sqlite(conn, timeout, work)
+
+
+async def bulk_insert_sqlite(
+    conn: Connection,
+    config: Config,
+    table: str,
+    columns: Sequence[str],
+    rows: Sequence[Sequence[Any]],
+    timeout: float | None = None,
+) -> dict:
+    _require_read_write(config)
+    names = _check_rows(columns, rows)
+    quoted = ", ".join(f'"{n}"' for n in names)
+    sql = (
+        f'INSERT INTO "{sanitize_table_name(table)}" ({quoted}) '
+        f"VALUES ({', '.join(['?'] * len(names))})"
+    )
+
+    async def work(db: Any) -> dict:
+        batches = []
+        for chunk in _chunks(rows):
+            async with db.executemany(sql, chunk) as cur:
+                batches.append({"rows": len(chunk), "affectedRows": cur.rowcount})
+        return _summary(batches)
+
+    return await _run_sqlite(conn, timeout, work)
+
+
+# --- MongoDB ---
+
+
+async def bulk_insert_mongodb(
+    conn: Connection,
+    config: Config,
+    collection: str,
+    documents: Sequence[dict[str, Any]],
+    timeout: float | None = None,
+) -> dict:
+    _require_read_write(config)
+    coll = conn.db[sanitize_table_name(collection)]
+
+    async def run() -> dict:
+        batches = []
+        for chunk in _chunks(documents):
+            result = await coll.insert_many(chunk, ordered=True)
+            batches.append({"rows": len(chunk), "affectedRows": len(result.inserted_ids)})
+        return _summary(batches)
+
+    return await run_with_timeout(run(), timeout)
+
+
+def _write_model(op: dict[str, Any]) -> Any:
+    from pymongo import DeleteMany, DeleteOne, InsertOne, ReplaceOne, UpdateMany, UpdateOne
+
+    if len(op) != 1:
+        raise ValueError(f"Each operation must have exactly one key, got {sorted(op)}.")
+    (name, args), = op.items()
+    if not isinstance(args, dict):
+        raise ValueError(f"Arguments of {name} must be an object.")
+    try:
+        if name == "insertOne":
+            return InsertOne(args["document"])
+        if name in ("updateOne", "updateMany"):
+            model = UpdateOne if name == "updateOne" else UpdateMany
+            return model(args["filter"], args["update"], upsert=bool(args.get("upsert")))
+        if name == "replaceOne":
+            return ReplaceOne(
+                args["filter"], args["replacement"], upsert=bool(args.get("upsert"))
+            )
+        if name in ("deleteOne", "deleteMany"):
+            return (DeleteOne if name == "deleteOne" else DeleteMany)(args["filter"])
+    except KeyError as exc:
+        raise ValueError(f"{name} requires {exc.args[0]!r}.") from None
+    raise ValueError(
+        f"Unknown operation {name!r}. Use insertOne, updateOne, updateMany, "
+        "replaceOne, deleteOne or deleteMany."
+    )
+
+
+async def bulk_write_mongodb(
+    conn: Connection,
+    config: Config,
+    collection: str,
+    operations: Sequence[dict[str, Any]],
+    timeout: float | None = None,
+) -> dict:
+    _require_read_write(config)
+    coll = conn.db[sanitize_table_name(collection)]
+    models = [_write_model(op) for op in operations]
+
+    async def run() -> dict:
+        batches = []
+        for chunk in _chunks(models):
+            result = await coll.bulk_write(chunk, ordered=True)
+            batches.append(
+                {
+                    "operations": len(chunk),
+                    "insertedCount": result.inserted_count,
+                    "matchedCount": result.matched_count,
+                    "modifiedCount": result.modified_count,
+                    "deletedCount": result.deleted_count,
+                    "upsertedCount": result.upserted_count,
+                }
+            )
+        return {"batches": batches}
+
+    return await run_with_timeout(run(), timeout)
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
-import aiomysql
-
 from db_mcp.connection import Connection
 from db_mcp.validation import sanitize_table_name
 
 
 async def describe_mysql(conn: Connection, table: str) -> list[dict]:
+    import aiomysql
+
     safe_name = sanitize_table_name(table)
-    async with conn.acquire_mysql() as c:
+    async with conn.acquire_mysql(read=True) as c:
         async with c.cursor(aiomysql.DictCursor) as cur:
             await cur.execute(f"DESCRIBE {safe_name}")
             return await cur.fetchall()
@@ -16,7 +16,7 @@ async def describe_mysql(conn: Connection, table: str) -> list[dict]:
 
 async def describe_pg(conn: Connection, table: str) -> list[dict]:
     safe_name = sanitize_table_name(table)
-    async with conn.acquire_pg() as c:
+    async with conn.acquire_pg(read=True) as c:
         rows = await c.fetch(
             "SELECT column_name, data_type, is_nullable, column_default "
             "FROM information_schema.columns "
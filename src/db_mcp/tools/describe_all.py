@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+from db_mcp.catalog import SchemaCatalog, new_table
+from db_mcp.connection import Connection
+
+# Every snapshot is built from two catalog queries: one row per column, and
+# one row per key column of every index / foreign key, ordered by position.
+# Key rows carry: table_name, kind ('index' | 'fk'), name, is_unique,
+# is_primary, column_name, seq, ref_table, ref_column.
+
+
+def _build(columns: Iterable[dict], keys: Iterable[dict]) -> dict:
+    tables: dict[str, dict[str, Any]] = {}
+    for col in columns:
+        tables.setdefault(col["table_name"], new_table())["columns"].append(
+            {
+                "name": col["column_name"],
+                "type": col["data_type"],
+                "nullable": bool(col["nullable"]),
+                "default": col["column_default"],
+            }
+        )
+
+    groups: dict[tuple[str, str, str], dict[str, Any]] = {}
+    for key in keys:
+        table = tables.setdefault(key["table_name"], new_table())
+        group_key = (key["table_name"], key["kind"], key["name"])
+        group = groups.get(group_key)
+        if group is None:
+            if key["kind"] == "fk":
+                group = {"name": key["name"], "columns": [], "references": {
+                    "table": key["ref_table"], "columns": []}}
+                table["foreignKeys"].append(group)
+            else:
+                group = {"name": key["name"], "columns": [], "unique": bool(key["is_unique"])}
+                table["indexes"].append(group)
+                if key["is_primary"]:
+                    group["primary"] = True
+            groups[group_key] = group
+        group["columns"].append(key["column_name"])
+        if key["kind"] == "fk":
+            group["references"]["columns"].append(key["ref_column"])
+
+    for table in tables.values():
+        for index in table["indexes"]:
+            if index.pop("primary", False):
+                table["primaryKey"] = list(index["columns"])
+    return {"tables": tables}
+
+
+# ----------------------------------------------------------------------
+# MySQL
+# ----------------------------------------------------------------------
+
+_MYSQL_FINGERPRINT = """
+SELECT
+  (SELECT CONCAT(COUNT(*), ':', COALESCE(SUM(CRC32(CONCAT_WS('|',
+      TABLE_NAME, COLUMN_NAME, ORDINAL_POSITION, COLUMN_TYPE, IS_NULLABLE,
+      COALESCE(COLUMN_DEFAULT, ''), COLUMN_KEY))), 0))
+   FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = DATABASE()) AS cols,
+  (SELECT CONCAT(COUNT(*), ':', COALESCE(SUM(CRC32(CONCAT_WS('|',
+      TABLE_NAME, INDEX_NAME, NON_UNIQUE, SEQ_IN_INDEX, COALESCE(COLUMN_NAME, '')))), 0))
+   FROM information_schema.STATISTICS WHERE TABLE_SCHEMA = DATABASE()) AS idx,
+  (SELECT CONCAT(COUNT(*), ':', COALESCE(SUM(CRC32(CONCAT_WS('|',
+      TABLE_NAME, CONSTRAINT_NAME, COLUMN_NAME, ORDINAL_POSITION,
+      COALESCE(REFERENCED_TABLE_NAME, ''), COALESCE(REFERENCED_COLUMN_NAME, '')))), 0))
+   FROM information_schema.KEY_COLUMN_USAGE WHERE TABLE_SCHEMA = DATABASE()) AS fks
+"""
+
+_MYSQL_COLUMNS = """
+SELECT TABLE_NAME AS table_name, COLUMN_NAME AS column_name,
+       COLUMN_TYPE AS data_type, IS_NULLABLE = 'YES' AS nullable,
+       COLUMN_DEFAULT AS column_default
+FROM information_schema.COLUMNS
+WHERE TABLE_SCHEMA = DATABASE()
+ORDER BY TABLE_NAME, ORDINAL_POSITION
+"""
+
+_MYSQL_KEYS = """
+SELECT TABLE_NAME AS table_name, 'index' AS kind, INDEX_NAME AS name,
+       NON_UNIQUE = 0 AS is_unique, INDEX_NAME = 'PRIMARY' AS is_primary,
+       COLUMN_NAME AS column_name, SEQ_IN_INDEX AS seq,
+       NULL AS ref_table, NULL AS ref_column
+FROM information_schema.STATISTICS
+WHERE TABLE_SCHEMA = DATABASE()
+UNION ALL
+SELECT TABLE_NAME, 'fk', CONSTRAINT_NAME, 0, 0, COLUMN_NAME, ORDINAL_POSITION,
+       REFERENCED_TABLE_NAME, REFERENCED_COLUMN_NAME
+FROM information_schema.KEY_COLUMN_USAGE
+WHERE TABLE_SCHEMA = DATABASE() AND REFERENCED_TABLE_NAME IS NOT NULL
+ORDER BY table_name, kind, name, seq
+"""
+
+
+async def describe_all_mysql(conn: Connection, catalog: SchemaCatalog) -> dict:
+    import aiomysql
+
+    async with conn.acquire_mysql() as c:
+        async with c.cursor() as cur:
+            await cur.execute(_MYSQL_FINGERPRINT)
+            fingerprint = await cur.fetchone()
+        cached = catalog.lookup(fingerprint)
+        if cached is not None:
+            return cached
+        async with c.cursor(aiomysql.DictCursor) as cur:
+            await cur.execute(_MYSQL_COLUMNS)
+            columns = await cur.fetchall()
+            await cur.execute(_MYSQL_KEYS)
+            keys = await cur.fetchall()
+    return catalog.store(fingerprint, _build(columns, keys))
+
+
+# ----------------------------------------------------------------------
+# PostgreSQL (public schema, like describe / list_tables)
+# ----------------------------------------------------------------------
+
+# DDL updates catalog rows (new xmin); VACUUM / ANALYZE update in place.
+_PG_FINGERPRINT = """
+SELECT md5(coalesce(string_agg(x, ',' ORDER BY x), '')) FROM (
+  SELECT c.oid::text || ':' || c.xmin::text AS x
+  FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace
+  WHERE n.nspname = 'public'
+  UNION ALL
+  SELECT a.attrelid::text || '.' || a.attnum::text || ':' || a.xmin::text
+  FROM pg_attribute a
+  JOIN pg_class c ON c.oid = a.attrelid
+  JOIN pg_namespace n ON n.oid = c.relnamespace
+  WHERE n.nspname = 'public' AND a.attnum > 0
+  UNION ALL
+  SELECT d.oid::text || ':' || d.xmin::text
+  FROM pg_attrdef d
+  JOIN pg_class c ON c.oid = d.adrelid
+  JOIN pg_namespace n ON n.oid = c.relnamespace
+  WHERE n.nspname = 'public'
+  UNION ALL
+  SELECT con.oid::text || ':' || con.xmin::text
+  FROM pg_constraint con JOIN pg_namespace n ON n.oid = con.connamespace
+  WHERE n.nspname = 'public'
+) s
+"""
+
+_PG_COLUMNS = """
+SELECT c.relname AS table_name, a.attname AS column_name,
+       format_type(a.atttypid, a.atttypmod) AS data_type,
+       NOT a.attnotnull AS nullable,
+       pg_get_expr(d.adbin, d.adrelid) AS column_default
+FROM pg_class c
+JOIN pg_namespace n ON n.oid = c.relnamespace
+JOIN pg_attribute a ON a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+LEFT JOIN pg_attrdef d ON d.adrelid = c.oid AND d.adnum = a.attnum
+WHERE n.nspname = 'public' AND c.relkind IN ('r', 'p', 'v', 'm', 'f')
+ORDER BY c.relname, a.attnum
+"""
+
+_PG_KEYS = """
+SELECT t.relname AS table_name, 'index' AS kind, i.relname AS name,
+       ix.indisunique AS is_unique, ix.indisprimary AS is_primary,
+       pg_get_indexdef(ix.indexrelid, k.seq, true) AS column_name, k.seq AS seq,
+       NULL::name AS ref_table, NULL::name AS ref_column
+FROM pg_index ix
+JOIN pg_class i ON i.oid = ix.indexrelid
+JOIN pg_class t ON t.oid = ix.indrelid
+JOIN pg_namespace n ON n.oid = t.relnamespace
+CROSS JOIN LATERAL generate_series(1, ix.indnkeyatts) AS k(seq)
+WHERE n.nspname = 'public'
+UNION ALL
+SELECT t.relname, 'fk', con.conname, false, false, a.attname, k.seq::int,
+       ft.relname, fa.attname
+FROM pg_constraint con
+JOIN pg_class t ON t.oid = con.conrelid
+JOIN pg_namespace n ON n.oid = t.relnamespace
+JOIN pg_class ft ON ft.oid = con.confrelid
+CROSS JOIN LATERAL unnest(con.conkey, con.confkey) WITH ORDINALITY AS k(attnum, fattnum, seq)
+JOIN pg_attribute a ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+JOIN pg_attribute fa ON fa.attrelid = con.confrelid AND fa.attnum = k.fattnum
+WHERE n.nspname = 'public' AND con.contype = 'f'
+ORDER BY table_name, kind, name, seq
+"""
+
+
+async def describe_all_pg(conn: Connection, catalog: SchemaCatalog) -> dict:
+    async with conn.acquire_pg() as c:
+        fingerprint = await c.fetchval(_PG_FINGERPRINT)
+        cached = catalog.lookup(fingerprint)
+        if cached is not None:
+            return cached
+        columns = await c.fetch(_PG_COLUMNS)
+        keys = await c.fetch(_PG_KEYS)
+    return catalog.store(fingerprint, _build(columns, keys))
+
+
+# ----------------------------------------------------------------------
+# SQLite
+# ----------------------------------------------------------------------
+
+_SQLITE_COLUMNS = """
+SELECT m.name AS table_name, p.name AS column_name, p.type AS data_type,
+       NOT p."notnull" AS nullable, p.dflt_value AS column_default, p.pk AS pk
+FROM sqlite_master m JOIN pragma_table_info(m.name) p
+WHERE m.type IN ('table', 'view') AND m.name NOT LIKE 'sqlite_%'
+ORDER BY m.name, p.cid
+"""
+
+_SQLITE_KEYS = """
+SELECT m.name AS table_name, 'index' AS kind, il.name AS name,
+       il."unique" AS is_unique, il.origin = 'pk' AS is_primary,
+       ii.name AS column_name, ii.seqno AS seq,
+       NULL AS ref_table, NULL AS ref_column
+FROM sqlite_master m
+JOIN pragma_index_list(m.name) il
+JOIN pragma_index_info(il.name) ii
+WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%'
+UNION ALL
+SELECT m.name, 'fk', 'fk_' || f.id, 0, 0, f."from", f.seq, f."table", f."to"
+FROM sqlite_master m JOIN pragma_foreign_key_list(m.name) f
+WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%'
+ORDER BY table_name, kind, name, seq
+"""
+
+
+async def _sqlite_rows(db: Any, sql: str) -> list[dict]:
+    async with db.execute(sql) as cur:
+        rows = await cur.fetchall()
+        columns = [d[0] for d in cur.description] if cur.description else []
+        return [dict(zip(columns, row)) for row in rows]
+
+
+async def describe_all_sqlite(conn: Connection, catalog: SchemaCatalog) -> dict:
+    async with conn.acquire_sqlite() as db:
+        async with db.execute("PRAGMA schema_version") as cur:
+            row = await cur.fetchone()
+        fingerprint = row[0] if row else None
+        cached = catalog.lookup(fingerprint)
+        if cached is not None:
+            return cached
+        columns = await _sqlite_rows(db, _SQLITE_COLUMNS)
+        keys = await _sqlite_rows(db, _SQLITE_KEYS)
+
+    snapshot = _build(columns, keys)
+    # An INTEGER PRIMARY KEY (rowid alias) has no index, so primary keys
+    # come from table_info rather than the index list.
+    pk_columns: dict[str, list[tuple[int, str]]] = {}
+    for col in columns:
+        if col["pk"]:
+            pk_columns.setdefault(col["table_name"], []).append((col["pk"], col["column_name"]))
+    for name, cols in pk_columns.items():
+        snapshot["tables"][name]["primaryKey"] = [c for _, c in sorted(cols)]
+    return catalog.store(fingerprint, snapshot)
@@ -1,28 +1,53 @@
 from __future__ import annotations
 
 import re
+from typing import Any, Sequence
 
 from db_mcp.config import Config
 from db_mcp.connection import Connection
+from db_mcp.timeouts import run_with_timeout
 
 
-async def execute_mysql(conn: Connection, config: Config, sql: str) -> dict:
+async def execute_mysql(
+    conn: Connection,
+    config: Config,
+    sql: str,
+    timeout: float | None = None,
+    params: Sequence[Any] | None = None,
+) -> dict:
     if config.is_read_only:
         raise ValueError(
             "This database is in READ-ONLY mode. "
             "Write operations are not allowed."
         )
 
+    from db_mcp.backends.mysql import connection_reusable
+
     async with conn.acquire_mysql() as c:
         async with c.cursor() as cur:
-            await cur.execute(sql)
+            try:
+                await run_with_timeout(
+                    cur.execute(sql, params or None), timeout, lambda: conn.kill_mysql_query(c)
+                )
+            except BaseException as exc:
+                if not connection_reusable(exc):
+                    c.close()
+                raise
             return {
                 "affectedRows": cur.rowcount,
                 "insertId": cur.lastrowid or 0,
             }
 
 
-async def execute_pg(conn: Connection, config: Config, sql: str) -> dict:
+async def execute_pg(
+    conn: Connection,
+    config: Config,
+    sql: str,
+    timeout: float | None = None,
+    params: Sequence[Any] | None = None,
+) -> dict:
+    import asyncpg
+
     if config.is_read_only:
         raise ValueError(
             "This database is in READ-ONLY mode. "
@@ -30,7 +55,23 @@ async def execute_pg(conn: Connection, config: Config, sql: str) -> dict:
         )
 
     async with conn.acquire_pg() as c:
-        status = await c.execute(sql)
+
+        async def run() -> str:
+            if not params:
+                # Simple query protocol: allows several ;-separated statements.
+                return await c.execute(sql)
+            stmt = await conn.prepare_pg(c, sql)
+            if stmt is None:
+                return await c.execute(sql, *params)
+            await stmt.fetch(*params)
+            return stmt.get_statusmsg()
+
+        try:
+            # On timeout or cancellation asyncpg sends the server a cancel request.
+            status = await run_with_timeout(run(), timeout)
+        except asyncpg.InvalidCachedStatementError:
+            conn.forget_pg_statement(c, sql)
+            raise
         # asyncpg returns status strings like "INSERT 0 1", "DELETE 3", "UPDATE 5"
         match = re.search(r"(\d+)$", status or "")
         affected = int(match.group(1)) if match else 0
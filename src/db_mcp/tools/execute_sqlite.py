@@ -1,20 +1,34 @@
 from __future__ import annotations
 
+from typing import Any, Sequence
+
 from db_mcp.config import Config
 from db_mcp.connection import Connection
+from db_mcp.timeouts import run_with_timeout
 
 
-async def execute_sqlite(conn: Connection, config: Config, sql: str) -> dict:
+async def execute_sqlite(
+    conn: Connection,
+    config: Config,
+    sql: str,
+    timeout: float | None = None,
+    params: Sequence[Any] | None = None,
+) -> dict:
     if config.is_read_only:
         raise ValueError(
             "This database is in READ-ONLY mode. "
             "Write operations are not allowed."
         )
 
-    async with conn.acquire_sqlite() as db:
-        async with db.execute(sql) as cur:
-            await db.commit()
-            return {
-                "affectedRows": cur.rowcount,
-                "lastRowId": cur.lastrowid or 0,
-            }
+    async with conn.acquire_sqlite(write=True) as db:
+
+        async def run() -> dict:
+            conn.sqlite_statement(db, sql)
+            async with db.execute(sql, params or None) as cur:
+                await db.commit()
+                return {
+                    "affectedRows": cur.rowcount,
+                    "lastRowId": cur.lastrowid or 0,
+                }
+
+        return await run_with_timeout(run(), timeout, db.interrupt)
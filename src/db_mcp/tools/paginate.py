@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from contextlib import AsyncExitStack
+from typing import Any
+
+from db_mcp.config import Config
+from db_mcp.connection import Connection
+from db_mcp.pagination import ServerCursor
+from db_mcp.validation import sanitize_table_name, validate_read_only_query
+
+
+async def open_cursor_mysql(conn: Connection, config: Config, sql: str) -> ServerCursor:
+    import aiomysql
+
+    from db_mcp.backends.mysql import connection_reusable
+
+    if config.is_read_only:
+        validate_read_only_query(sql)
+
+    stack = AsyncExitStack()
+    try:
+        c = await stack.enter_async_context(conn.acquire_mysql())
+        cur = await c.cursor(aiomysql.SSDictCursor)
+        try:
+            await cur.execute(sql)
+        except BaseException as exc:
+            if not connection_reusable(exc):
+                c.close()
+            raise
+    except BaseException:
+        await stack.aclose()
+        raise
+
+    async def finish(exhausted: bool) -> None:
+        if exhausted:
+            await cur.close()
+        else:
+            # See query_mysql: an unread unbuffered result can only be
+            # abandoned by dropping the connection.
+            c.close()
+
+    return ServerCursor(stack, cur.fetchmany, finish=finish)
+
+
+async def open_cursor_pg(conn: Connection, config: Config, sql: str) -> ServerCursor:
+    if config.is_read_only:
+        validate_read_only_query(sql)
+
+    stack = AsyncExitStack()
+    try:
+        c = await stack.enter_async_context(conn.acquire_pg())
+        await stack.enter_async_context(c.transaction(readonly=config.is_read_only))
+        cur = await c.cursor(sql)
+    except BaseException:
+        await stack.aclose()
+        raise
+    return ServerCursor(stack, cur.fetch, dict)
+
+
+async def open_cursor_sqlite(conn: Connection, config: Config, sql: str) -> ServerCursor:
+    if config.is_read_only:
+        validate_read_only_query(sql)
+
+    stack = AsyncExitStack()
+    try:
+        db = await stack.enter_async_context(conn.acquire_sqlite())
+        cur = await stack.enter_async_context(db.execute(sql))
+    except BaseException:
+        await stack.aclose()
+        raise
+    columns = [d[0] for d in cur.description] if cur.description else []
+    return ServerCursor(stack, cur.fetchmany, lambda row: dict(zip(columns, row)))
+
+
+async def open_cursor_mongodb(
+    conn: Connection,
+    collection: str,
+    filter_obj: dict[str, Any] | None,
+    page_size: int,
+) -> ServerCursor:
+    safe_name = sanitize_table_name(collection)
+    cursor = conn.db[safe_name].find(filter_obj or {}).batch_size(page_size)
+
+    async def finish(exhausted: bool) -> None:
+        await cursor.close()
+
+    return ServerCursor(AsyncExitStack(), cursor.to_list, finish=finish)
@@ -1,32 +1,97 @@
 from __future__ import annotations
 
-from typing import Any
-
-import aiomysql
+from typing import Any, Sequence
 
 from db_mcp.config import Config
 from db_mcp.connection import Connection
-from db_mcp.validation import validate_read_only_query
+from db_mcp.metrics import add_rows
+from db_mcp.results import RowCollector
+from db_mcp.timeouts import run_with_timeout
+from db_mcp.validation import is_read_only_query, validate_read_only_query
+
 
+async def query_mysql(
+    conn: Connection,
+    config: Config,
+    sql: str,
+    timeout: float | None = None,
+    params: Sequence[Any] | None = None,
+) -> dict:
+    import aiomysql
+
+    from db_mcp.backends.mysql import connection_reusable
 
-async def query_mysql(conn: Connection, config: Config, sql: str) -> list[dict]:
     if config.is_read_only:
         validate_read_only_query(sql)
 
-    async with conn.acquire_mysql() as c:
-        async with c.cursor(aiomysql.DictCursor) as cur:
-            await cur.execute(sql)
-            rows = await cur.fetchall()
-    return rows
+    collector = RowCollector(config.max_rows, config.max_bytes)
+    # Only statements that validate as reads may go to a replica.
+    read = is_read_only_query(sql)
+    async with conn.acquire_mysql(read=read) as c:
+        await conn.set_mysql_statement_timeout(c, timeout)
+        cur = await c.cursor(aiomysql.SSDictCursor)
+
+        async def run() -> bool:
+            # aiomysql interpolates %s parameters client-side, escaped.
+            await cur.execute(sql, params or None)
+            return await collector.consume(cur.fetchmany)
 
+        try:
+            exhausted = await run_with_timeout(run(), timeout, lambda: conn.kill_mysql_query(c))
+        except BaseException as exc:
+            if connection_reusable(exc):
+                # A server error ends the result; the connection stays pooled.
+                try:
+                    await cur.close()
+                except Exception:
+                    c.close()
+            else:
+                c.close()
+            raise
+        if exhausted:
+            await cur.close()
+        else:
+            # MySQL keeps sending an unbuffered result until it is read to
+            # the end; dropping the connection is the only way to abandon
+            # it.  The pool discards closed connections on release.
+            c.close()
+    return collector.result()
+
+
+async def query_pg(
+    conn: Connection,
+    config: Config,
+    sql: str,
+    timeout: float | None = None,
+    params: Sequence[Any] | None = None,
+) -> dict:
+    import asyncpg
 
-async def query_pg(conn: Connection, config: Config, sql: str) -> list[dict]:
     if config.is_read_only:
         validate_read_only_query(sql)
 
-    async with conn.acquire_pg() as c:
-        rows = await c.fetch(sql)
-        return [dict(r) for r in rows]
+    collector = RowCollector(config.max_rows, config.max_bytes)
+    read = is_read_only_query(sql)
+    async with conn.acquire_pg(read=read) as c:
+        async with c.transaction(readonly=config.is_read_only):
+            if timeout:
+                await c.execute(f"SET LOCAL statement_timeout = {int(timeout * 1000)}")
+
+            async def run() -> None:
+                args = params or ()
+                stmt = await conn.prepare_pg(c, sql)
+                cur = await (stmt.cursor(*args) if stmt is not None else c.cursor(sql, *args))
+                await collector.consume(cur.fetch, dict)
+
+            try:
+                # asyncpg sends a cancel request itself when the call is cancelled.
+                await run_with_timeout(run(), timeout)
+            except asyncpg.InvalidCachedStatementError:
+                # The schema changed under the cached statement: prepare it
+                # afresh on the next call.
+                conn.forget_pg_statement(c, sql)
+                raise
+    return collector.result()
 
 
 async def query_mongodb(
@@ -34,9 +99,14 @@ async def query_mongodb(
     collection: str,
     filter_obj: dict[str, Any] | None = None,
     limit: int = 100,
+    timeout: float | None = None,
 ) -> list[dict]:
     if filter_obj is None:
         filter_obj = {}
     capped = min(limit, 1000)
-    results = await conn.db[collection].find(filter_obj).limit(capped).to_list(capped)
+    cursor = conn.db[collection].find(filter_obj).limit(capped)
+    if timeout:
+        cursor = cursor.max_time_ms(int(timeout * 1000))
+    results = await run_with_timeout(cursor.to_list(capped), timeout)
+    add_rows(len(results))
     return results
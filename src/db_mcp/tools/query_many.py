@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Sequence
+
+from db_mcp.validation import validate_read_only_query
+
+# Most queries accepted by one query_many call.
+MAX_QUERIES = 50
+
+
+async def query_many(
+    queries: Sequence[str],
+    params: Sequence[Sequence[Any] | None] | None,
+    run: Callable[[str, Sequence[Any] | None], Awaitable[dict]],
+    concurrency: int,
+) -> dict:
+    """Run read-only *queries* concurrently, at most *concurrency* at a time.
+
+    Every query is validated before any is sent.  *run* executes one query
+    on its own pooled connection.  A failing query reports its error in
+    place and does not affect the others; results keep the input order.
+    """
+    if not queries:
+        raise ValueError("At least one query is required.")
+    if len(queries) > MAX_QUERIES:
+        raise ValueError(f"At most {MAX_QUERIES} queries per call; got {len(queries)}.")
+    if params is not None and len(params) != len(queries):
+        raise ValueError(
+            f"params must have one entry per query: got {len(params)} for {len(queries)} queries."
+        )
+    for i, sql in enumerate(queries):
+        try:
+            validate_read_only_query(sql)
+        except ValueError as exc:
+            raise ValueError(f"Query {i}: {exc}") from None
+
+    gate = asyncio.Semaphore(max(1, concurrency))
+
+    async def one(i: int) -> dict:
+        async with gate:
+            start = time.perf_counter()
+            try:
+                result = await run(queries[i], params[i] if params is not None else None)
+            except Exception as exc:
+                result = {"error": str(exc)}
+            result["ms"] = round((time.perf_counter() - start) * 1000, 3)
+            return result
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(one(i) for i in range(len(queries))))
+    return {
+        "results": results,
+        "totalMs": round((time.perf_counter() - start) * 1000, 3),
+    }
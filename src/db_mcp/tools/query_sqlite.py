@@ -1,16 +1,32 @@
 from __future__ import annotations
 
+from typing import Any, Sequence
+
 from db_mcp.config import Config
 from db_mcp.connection import Connection
+from db_mcp.results import RowCollector
+from db_mcp.timeouts import run_with_timeout
 from db_mcp.validation import validate_read_only_query
 
 
-async def query_sqlite(conn: Connection, config: Config, sql: str) -> list[dict]:
+async def query_sqlite(
+    conn: Connection,
+    config: Config,
+    sql: str,
+    timeout: float | None = None,
+    params: Sequence[Any] | None = None,
+) -> dict:
     if config.is_read_only:
         validate_read_only_query(sql)
 
+    collector = RowCollector(config.max_rows, config.max_bytes)
     async with conn.acquire_sqlite() as db:
-        async with db.execute(sql) as cur:
-            rows = await cur.fetchall()
-            columns = [d[0] for d in cur.description] if cur.description else []
-            return [dict(zip(columns, row)) for row in rows]
+
+        async def run() -> None:
+            conn.sqlite_statement(db, sql)
+            async with db.execute(sql, params or None) as cur:
+                columns = [d[0] for d in cur.description] if cur.description else []
+                await collector.consume(cur.fetchmany, lambda row: dict(zip(columns, row)))
+
+        await run_with_timeout(run(), timeout, db.interrupt)
+    return collector.result()
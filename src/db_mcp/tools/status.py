@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 from db_mcp.config import Config
+from db_mcp.connection import Connection
 
 
-def get_status(config: Config) -> dict:
+def get_status(config: Config, conn: Connection) -> dict:
     info: dict = {
         "type": config.db_type,
         "database": config.db_database,
         "mode": config.db_mode,
-        "status": "connected",
+        "status": conn.state,
     }
+    if conn.connect_seconds is not None:
+        info["connectSeconds"] = round(conn.connect_seconds, 3)
+    if conn.last_error:
+        info["lastError"] = conn.last_error
     if config.is_mysql or config.is_postgresql:
         info["host"] = f"{config.db_host}:{config.db_port}"
         info["user"] = config.db_user
@@ -17,6 +22,15 @@ def get_status(config: Config) -> dict:
         info["path"] = config.db_path
     else:
         info["url"] = config.db_url
+    pool = conn.pool_stats()
+    if pool is not None:
+        info["pool"] = pool
+    replicas = conn.replica_stats()
+    if replicas is not None:
+        info["readReplicas"] = replicas
+    statements = conn.statement_cache_stats()
+    if statements is not None:
+        info["statementCache"] = statements
     if config.has_ssh_tunnel:
         info["ssh_tunnel"] = f"{config.ssh_user}@{config.ssh_host}:{config.ssh_port}"
     return info
@@ -1,80 +1,159 @@
 from __future__ import annotations
 
+import hashlib
 import re
+from collections import OrderedDict
+from typing import Iterator
 
-_READ_ONLY_PREFIXES = ("select", "show", "describe", "explain", "with")
+from db_mcp.metrics import phase
 
+_READ_ONLY_PREFIXES = ("select", "show", "describe", "explain", "with")
 
-def _split_statements(sql: str) -> list[str]:
-    """Split SQL into individual statements by semicolons.
 
-    Respects single-quoted, double-quoted, and backtick-quoted strings so that
-    semicolons inside literals are **not** treated as statement separators.
+# One statement: runs of plain code, quoted strings and identifiers,
+# comments and PostgreSQL dollar-quoted strings, up to (not including) the
+# next top-level ";".  Quotes honour backslash escapes and doubled quotes;
+# an unterminated string or comment runs to the end of the input.
+_STATEMENT_RE = re.compile(
+    r"""
+    (?:
+        [^;'"`$/-]+
+      | '(?:[^'\\]+|\\.|'')*'?
+      | "(?:[^"\\]+|\\.|"")*"?
+      | `(?:[^`]+|``)*`?
+      | --[^\n]*
+      | /\*.*?(?:\*/|\Z)
+      | (?<![\w$])\$(?P<tag>(?:[A-Za-z_]\w*)?)\$.*?(?:\$(?P=tag)\$|\Z)
+      | [$/-]
+    )*
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+# Whitespace and comments before a statement's first keyword.
+_LEADING_RE = re.compile(r"(?:\s+|--[^\n]*|/\*.*?(?:\*/|\Z))*", re.DOTALL)
+# MySQL/MariaDB executable comments (/*! ... */, /*M! ... */): MySQL runs
+# their body as SQL, so they may hide a write behind a SELECT.  They are
+# refused wherever they appear, even inside a string literal, rather than
+# trusting the lexer to agree with the server's quoting rules (e.g.
+# NO_BACKSLASH_ESCAPES).
+_EXECUTABLE_COMMENT_MARKERS = ("/*!", "/*M!")
+# Keywords that keep a statement that validates as a read from being
+# cached or sent to a replica, matched on the lowercased SQL.  "dml" are the
+# data-modifying statements a PostgreSQL WITH may wrap (... RETURNING); the
+# rest make even a SELECT write or take locks: SELECT ... INTO, row locks,
+# sequences, advisory and named locks, session settings, notifications.
+# _WRITE_HINT_RE finds candidates (a flat alternation of literals, which
+# the regex engine scans far faster than the full pattern) and
+# _WRITE_HINT_MATCH confirms them.
+_WRITE_HINT_RE = re.compile(
+    "insert|update|delete|merge|into|for|lock|nextval|setval|set_config|pg_|get_lock|release_"
+)
+_WRITE_HINT_MATCH = re.compile(
+    r"""
+    (?P<dml>insert|update|delete|merge)\b
+  | into\b
+  | for\s+(?:no\s+key\s+)?(?:update|share)\b
+  | lock\s+in\s+share\s+mode\b
+  | (?:nextval|setval|set_config|pg_notify|pg_(?:try_)?advisory_\w+
+      |get_lock|release_lock|release_all_locks)\s*\(
+    """,
+    re.VERBOSE,
+)
+
+_READ_ONLY_ERROR = (
+    "Only SELECT, SHOW, DESCRIBE, EXPLAIN, WITH queries are allowed "
+    "on read-only databases."
+)
+_EXECUTABLE_COMMENT_ERROR = (
+    "MySQL executable comments (/*! ... */) are not allowed on read-only databases."
+)
+
+# Verdicts (None = allowed, else the error message) for SQL that needs a full
+# lex, keyed by a digest so large queries are not kept in memory.
+_VERDICT_CACHE_SIZE = 1024
+_verdicts: OrderedDict[bytes, str | None] = OrderedDict()
+
+
+def _statement_starts(sql: str) -> Iterator[int]:
+    """Offsets of the first keyword of each non-empty statement in *sql*.
+
+    Semicolons inside strings, quoted identifiers, comments and
+    ``$tag$ ... $tag$`` bodies do not end a statement.
     """
-    statements: list[str] = []
-    current: list[str] = []
-    in_quote: str | None = None
-    i = 0
-
-    while i < len(sql):
-        ch = sql[i]
-
-        # Inside a quoted string, handle backslash escapes (e.g. \' or \")
-        if in_quote is not None and ch == "\\":
-            current.append(ch)
-            i += 1
-            if i < len(sql):
-                current.append(sql[i])
-                i += 1
-            continue
-
-        # Quote characters: toggle in/out of quoted context
-        if ch in ("'", '"', "`"):
-            if in_quote is None:
-                in_quote = ch
-            elif in_quote == ch:
-                # Check for doubled-quote escape (e.g. '' inside a string)
-                if i + 1 < len(sql) and sql[i + 1] == ch:
-                    current.append(ch)
-                    current.append(ch)
-                    i += 2
-                    continue
-                in_quote = None
-            current.append(ch)
-            i += 1
-            continue
-
-        # Semicolons outside of any quoted context mark statement boundaries
-        if ch == ";" and in_quote is None:
-            stmt = "".join(current).strip()
-            if stmt:
-                statements.append(stmt)
-            current = []
-            i += 1
-            continue
-
-        current.append(ch)
-        i += 1
-
-    # Trailing statement (no terminating semicolon)
-    stmt = "".join(current).strip()
-    if stmt:
-        statements.append(stmt)
-
-    return statements
+    if ";" not in sql:
+        # A single statement: no need to lex past its first keyword.
+        first = _LEADING_RE.match(sql).end()
+        if first < len(sql):
+            yield first
+        return
+    pos = 0
+    end = len(sql)
+    while pos <= end:
+        stmt_end = _STATEMENT_RE.match(sql, pos).end()
+        first = _LEADING_RE.match(sql, pos, stmt_end).end()
+        if first < stmt_end:
+            yield first
+        pos = stmt_end + 1  # skip the ";"
+
+
+def _check_read_only(sql: str) -> str | None:
+    # "!" is a single-byte scan; the marker search costs far more on big SQL.
+    if "!" in sql and any(marker in sql for marker in _EXECUTABLE_COMMENT_MARKERS):
+        return _EXECUTABLE_COMMENT_ERROR
+    found = False
+    for start in _statement_starts(sql):
+        found = True
+        if not sql[start : start + 8].lower().startswith(_READ_ONLY_PREFIXES):
+            return _READ_ONLY_ERROR
+    return None if found else "Empty query."
 
 
 def validate_read_only_query(sql: str) -> None:
-    statements = _split_statements(sql)
-    if not statements:
-        raise ValueError("Empty query.")
-    for stmt in statements:
-        trimmed = stmt.lower()
-        if not any(trimmed.startswith(p) for p in _READ_ONLY_PREFIXES):
-            raise ValueError(
-                "Only SELECT, SHOW, DESCRIBE, EXPLAIN, WITH queries are allowed "
-                "on read-only databases."
-            )
+    with phase("validate"):
+        if ";" not in sql:
+            # Single statement: checking it is cheaper than hashing it.
+            verdict = _check_read_only(sql)
+        else:
+            key = hashlib.blake2b(sql.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+            try:
+                verdict = _verdicts[key]
+                _verdicts.move_to_end(key)
+            except KeyError:
+                verdict = _verdicts[key] = _check_read_only(sql)
+                if len(_verdicts) > _VERDICT_CACHE_SIZE:
+                    _verdicts.popitem(last=False)
+    if verdict is not None:
+        raise ValueError(verdict)
+
+
+def is_read_only_query(sql: str) -> bool:
+    """Whether *sql* only reads, so its result may be cached or served by a replica.
+
+    Stricter than :func:`validate_read_only_query`: a SELECT may still write
+    or lock (``INTO``, ``FOR UPDATE``/``FOR SHARE``, ``nextval()``,
+    ``pg_advisory_lock()``, ``GET_LOCK()``, ...), and a PostgreSQL ``WITH``
+    may wrap ``INSERT``/``UPDATE``/``DELETE ... RETURNING``.  Those keywords
+    count wherever they appear, even inside a string or identifier.
+    """
+    try:
+        validate_read_only_query(sql)
+    except ValueError:
+        return False
+    lowered = sql.lower()
+    dml = False
+    for candidate in _WRITE_HINT_RE.finditer(lowered):
+        pos = candidate.start()
+        if pos and (lowered[pos - 1].isalnum() or lowered[pos - 1] == "_"):
+            continue  # inside a longer word
+        match = _WRITE_HINT_MATCH.match(lowered, pos)
+        if match is None:
+            continue
+        if match.group("dml") is None:
+            return False
+        dml = True
+    if not dml:
+        return True
+    return not any(sql[start : start + 4].lower() == "with" for start in _statement_starts(sql))
 
 
 def sanitize_table_name(name: str) -> str:
@@ -0,0 +1,137 @@
+import asyncio
+
+import pytest
+
+from db_mcp.admission import AdmissionController, lane_sizes
+from db_mcp.config import Config, Replica
+
+
+def _controller(reads: int) -> AdmissionController:
+    return AdmissionController({"read": reads, "write": 1, "meta": 1}, max_queue=10)
+
+
+def test_reserve_takes_only_free_slots():
+    async def main():
+        adm = _controller(4)
+        async with adm.admit("read"):
+            assert adm.reserve("read", 10) == 3
+            assert adm.reserve("read", 1) == 0
+            adm.release("read", 3)
+            assert adm.reserve("read", 2) == 2
+            adm.release("read", 2)
+        assert adm.stats()["read"]["active"] == 0
+
+    asyncio.run(main())
+
+
+def test_pinned_slot_outlives_the_call():
+    async def main():
+        adm = _controller(2)
+        async with adm.admit("read"):
+            adm.pin("read")  # e.g. the cursor this call opened
+        async with adm.admit("read"):
+            # Lane full: one running call plus the pinned cursor.
+            waiter = asyncio.create_task(_enter(adm))
+            await asyncio.sleep(0)
+            assert adm.stats()["read"]["waiting"] == 1
+        await asyncio.sleep(0)
+        assert waiter.done()
+        adm.unpin("read")
+        stats = adm.stats()["read"]
+        assert (stats["active"], stats["pinned"]) == (0, 0)
+
+    asyncio.run(main())
+
+
+def test_pinning_over_the_limit_frees_nothing_on_release():
+    async def main():
+        adm = _controller(1)
+        async with adm.admit("read"):
+            adm.pin("read")  # active 2 > limit 1
+            waiter = asyncio.create_task(_enter(adm))
+            await asyncio.sleep(0)
+        # The call finished, but the pinned cursor still fills the lane.
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        adm.unpin("read")
+        await asyncio.wait_for(waiter, 1)
+
+    asyncio.run(main())
+
+
+async def _enter(adm: AdmissionController) -> None:
+    async with adm.admit("read"):
+        pass
+
+
+def _config(**overrides) -> Config:
+    fields = dict(
+        db_type="postgresql",
+        db_mode="read-write",
+        db_database="db",
+        db_host="localhost",
+        db_port=5432,
+        db_user="user",
+        db_password="",
+        db_url="",
+        db_path="",
+        ssh_host="",
+        ssh_port=22,
+        ssh_user="",
+        ssh_key="",
+        ssh_password="",
+    )
+    fields.update(overrides)
+    return Config(**fields)
+
+
+def test_lanes_leave_a_connection_for_metadata():
+    sizes = lane_sizes(_config(pool_max_size=10))
+    assert (sizes.pool, sizes.writes, sizes.reads, sizes.cursors) == (10, 3, 6, 5)
+
+
+def test_read_only_database_takes_no_write_slots():
+    sizes = lane_sizes(_config(db_mode="read-only", pool_max_size=10))
+    assert (sizes.writes, sizes.reads) == (0, 9)
+    # The write lane still lets calls through, to be rejected.
+    assert AdmissionController(sizes.limits, 1).stats()["write"]["limit"] == 1
+
+
+def test_replicas_add_read_slots_but_not_cursors():
+    replicas = (Replica("r1", 5432), Replica("r2", 5432))
+    sizes = lane_sizes(_config(pool_max_size=4, replicas=replicas))
+    assert (sizes.primary_reads, sizes.reads, sizes.cursors) == (2, 10, 1)
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        dict(pool_max_size=1),
+        dict(pool_max_size=2),
+        dict(pool_max_size=10, max_concurrent_reads=1),
+        dict(db_type="sqlite", db_path="/tmp/t.db", sqlite_readers=1),
+    ],
+)
+def test_cursors_disabled_with_a_single_read_slot(overrides, capsys):
+    assert lane_sizes(_config(**overrides)).cursors == 0
+    assert "query_page disabled" in capsys.readouterr().err
+
+
+def test_cursors_disabled_by_config_is_not_logged(capsys):
+    assert lane_sizes(_config(pool_max_size=1, max_cursors=0)).cursors == 0
+    assert capsys.readouterr().err == ""
+
+
+@pytest.mark.parametrize(
+    "url, pool",
+    [
+        ("mongodb://localhost:27017", 100),
+        ("mongodb://localhost:27017/?maxPoolSize=5", 5),
+        ("mongodb+srv://cluster.example/db?retryWrites=true&maxpoolsize=20", 20),
+        ("mongodb://localhost:27017/?maxPoolSize=0", 100),
+    ],
+)
+def test_mongodb_lanes_follow_the_client_pool(url, pool):
+    sizes = lane_sizes(_config(db_type="mongodb", db_url=url, pool_max_size=10))
+    assert sizes.pool == pool
+    assert sizes.reads == pool - 1 - sizes.writes
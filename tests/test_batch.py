@@ -0,0 +1,19 @@
+import pytest
+
+from db_mcp.tools.batch import _check_rows
+
+
+def test_column_names_pass_through():
+    assert _check_rows(["id", "user_id", "2fa"], [[1, 2, 3]]) == ["id", "user_id", "2fa"]
+
+
+@pytest.mark.parametrize("name", ["user-id", "name`", 'a"b', "", "id; DROP TABLE t"])
+def test_invalid_column_name_is_rejected(name):
+    with pytest.raises(ValueError, match="Invalid column name") as exc:
+        _check_rows(["id", name], [[1, 2]])
+    assert repr(name) in str(exc.value)
+
+
+def test_row_length_must_match_columns():
+    with pytest.raises(ValueError, match="Row 1 has 1 values"):
+        _check_rows(["a", "b"], [[1, 2], [3]])
@@ -0,0 +1,94 @@
+import asyncio
+import sqlite3
+import time
+
+import pytest
+
+from db_mcp import sqlite_sync, ssh
+from db_mcp.config import Config
+from db_mcp.connection import Connection
+
+# How long the simulated SSH work blocks its thread.
+_BLOCK_SECONDS = 0.5
+
+
+class _Client:
+    def close(self) -> None:
+        pass
+
+
+class _SlowMirror:
+    """A mirror whose sync blocks like a slow SFTP transfer."""
+
+    def __init__(self, local_path) -> None:
+        self.local_path = local_path
+
+    def pull(self, verify: bool = False) -> dict:
+        time.sleep(_BLOCK_SECONDS)
+        return {"cached": True}
+
+    def discard(self) -> None:
+        pass
+
+
+async def _max_stall(work) -> float:
+    """Run *work* next to a 10 ms ticker; return the longest tick delay in seconds."""
+    stall = 0.0
+    done = False
+
+    async def ticker() -> None:
+        nonlocal stall
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            stall = max(stall, time.perf_counter() - start - 0.01)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.02)
+    try:
+        await work
+    finally:
+        done = True
+        await task
+    return stall
+
+
+@pytest.fixture
+def ssh_sqlite(monkeypatch, tmp_path):
+    db = tmp_path / "mirror.db"
+    sqlite3.connect(db).close()
+    for name, value in {
+        "DB_TYPE": "sqlite",
+        "DB_PATH": "/srv/app.db",
+        "SSH_HOST": "example.invalid",
+        "SSH_PASSWORD": "secret",
+        "DB_SQLITE_CACHE_DIR": str(tmp_path),
+    }.items():
+        monkeypatch.setenv(name, value)
+
+    def open_client(cfg):
+        time.sleep(_BLOCK_SECONDS)
+        return _Client()
+
+    monkeypatch.setattr(ssh, "open_client", open_client)
+    monkeypatch.setattr(sqlite_sync, "open_mirror", lambda cfg, client: (_SlowMirror(db), None))
+    return Config.from_env()
+
+
+def test_loop_stays_responsive_during_ssh_sync(ssh_sqlite):
+    async def main():
+        conn = Connection(ssh_sqlite)
+        started = time.perf_counter()
+        conn.start()
+        stall = await _max_stall(conn.ready())
+        elapsed = time.perf_counter() - started
+        try:
+            assert conn.state == "connected"
+            # SSH login plus transfer blocked their threads for ~1 s, yet the
+            # ticker never waited more than a small fraction of that.
+            assert elapsed >= 2 * _BLOCK_SECONDS
+            assert stall < _BLOCK_SECONDS / 2
+        finally:
+            await conn.close()
+
+    asyncio.run(main())
@@ -0,0 +1,35 @@
+import asyncio
+
+import pymysql
+import pytest
+
+from db_mcp.backends.mysql import connection_reusable
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [
+        pymysql.err.ProgrammingError(1064, "You have an error in your SQL syntax"),
+        pymysql.err.ProgrammingError(1146, "Table 'db.nope' doesn't exist"),
+        pymysql.err.IntegrityError(1062, "Duplicate entry '1' for key 'PRIMARY'"),
+        pymysql.err.OperationalError(3024, "Query execution was interrupted"),
+    ],
+)
+def test_server_errors_keep_the_connection(exc):
+    assert connection_reusable(exc)
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [
+        pymysql.err.OperationalError(2013, "Lost connection to MySQL server during query"),
+        pymysql.err.OperationalError(2006, "MySQL server has gone away"),
+        pymysql.err.InterfaceError(0, ""),
+        pymysql.err.InternalError("Packet sequence number wrong"),
+        TimeoutError("Statement cancelled"),
+        asyncio.CancelledError(),
+        ConnectionResetError(),
+    ],
+)
+def test_connection_errors_drop_the_connection(exc):
+    assert not connection_reusable(exc)
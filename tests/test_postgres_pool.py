@@ -0,0 +1,112 @@
+import asyncio
+import time
+
+import pytest
+
+from db_mcp.backends.postgresql import PostgresPool
+from db_mcp.backends.stats import PoolTimeout
+from db_mcp.config import Config
+
+
+def _config(**overrides) -> Config:
+    fields = dict(
+        db_type="postgresql",
+        db_mode="read-only",
+        db_database="db",
+        db_host="localhost",
+        db_port=5432,
+        db_user="user",
+        db_password="",
+        db_url="",
+        db_path="",
+        ssh_host="",
+        ssh_port=22,
+        ssh_user="",
+        ssh_key="",
+        ssh_password="",
+    )
+    fields.update(overrides)
+    return Config(**fields)
+
+
+class _Raw:
+    def is_closed(self) -> bool:
+        return False
+
+
+class _Conn:
+    def __init__(self, pool: "_Pool") -> None:
+        self._pool = pool
+        self._con = _Raw()
+        self.pings = 0
+
+    async def fetchval(self, sql: str):
+        self.pings += 1
+        # Every idle member must still be in the pool while one is pinged.
+        self._pool.idle_during_ping.append(len(self._pool.idle))
+        await asyncio.sleep(0)
+        return 1
+
+
+class _Pool:
+    """Just enough of asyncpg.Pool: a LIFO of idle connections."""
+
+    def __init__(self, size: int) -> None:
+        self.conns = [_Conn(self) for _ in range(size)]
+        self.idle = list(self.conns)
+        self.idle_during_ping: list[int] = []
+
+    async def acquire(self) -> _Conn:
+        while not self.idle:
+            await asyncio.sleep(3600)
+        return self.idle.pop()
+
+    async def release(self, conn: _Conn) -> None:
+        self.idle.append(conn)
+
+    def get_idle_size(self) -> int:
+        return len(self.idle)
+
+
+def _pool(size: int, **config) -> tuple[PostgresPool, _Pool]:
+    async def endpoint():
+        raise AssertionError("unexpected reconnect")
+
+    pg = PostgresPool(_config(**config), endpoint)
+    pg._pool = fake = _Pool(size)
+    return pg, fake
+
+
+def test_acquire_timeout_does_not_reconnect():
+    async def main():
+        pg, fake = _pool(1, pool_acquire_timeout=0.05)
+        async with pg.acquire():
+            with pytest.raises(PoolTimeout):
+                async with pg.acquire():
+                    pass
+        assert pg._pool is fake
+        assert pg.metrics.timeouts == 1
+
+    asyncio.run(main())
+
+
+def test_keepalive_round_releases_members_it_does_not_ping():
+    async def main():
+        pg, fake = _pool(4, keepalive_interval=30.0)
+        # LIFO: the two members on top were used just now, the two below
+        # have not been used since the keepalive interval.
+        stale, fresh = fake.conns[:2], fake.conns[2:]
+        for conn in stale:
+            pg._last_used[conn._con] = time.monotonic() - 60
+        for conn in fresh:
+            pg._last_used[conn._con] = time.monotonic()
+
+        await pg.keepalive_round()
+
+        assert [c.pings for c in stale] == [1, 1]
+        assert [c.pings for c in fresh] == [0, 0]
+        assert len(fake.idle) == 4
+        # Both recently used members were idle again before any ping ran.
+        assert min(fake.idle_during_ping) >= 2
+
+    asyncio.run(main())
@@ -0,0 +1,144 @@
+import asyncio
+import os
+import signal
+import sqlite3
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from db_mcp.backends.sqlite_remote import RemoteSqlite, RemoteSqliteError, _Channel
+from db_mcp.timeouts import run_with_timeout
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="runs the helper under sh")
+
+_ENDLESS = (
+    "WITH RECURSIVE c(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM c) SELECT count(*) FROM c"
+)
+
+
+class _Stdin:
+    def __init__(self, pipe) -> None:
+        self._pipe = pipe
+        self.channel = SimpleNamespace(close=self.close)
+
+    def write(self, data: str) -> None:
+        self._pipe.write(data.encode())
+
+    def flush(self) -> None:
+        self._pipe.flush()
+
+    def close(self) -> None:
+        try:
+            self._pipe.close()
+        except OSError:
+            pass
+
+
+class _Client:
+    """Runs exec commands locally, like sshd would on the remote host."""
+
+    def __init__(self, prelude: str = "", python: str = sys.executable) -> None:
+        self.prelude = prelude
+        self.python = python
+        self.processes: list[subprocess.Popen] = []
+
+    def exec_command(self, cmd: str):
+        cmd = self.prelude + cmd.replace("python3", self.python, 1)
+        proc = subprocess.Popen(
+            cmd,
+            shell=True,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True,
+        )
+        self.processes.append(proc)
+        return _Stdin(proc.stdin), proc.stdout, proc.stderr
+
+    def kill(self) -> None:
+        for proc in self.processes:
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            proc.wait()
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = tmp_path / "remote.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE t (id INTEGER)")
+        conn.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(3)])
+    conn.close()
+    return str(path)
+
+
+@pytest.fixture
+def client():
+    client = _Client()
+    yield client
+    client.kill()
+
+
+def test_query(client, db):
+    async def main():
+        conn = RemoteSqlite(await asyncio.to_thread(_Channel, client, db))
+        async with conn.execute("SELECT id FROM t ORDER BY id") as cur:
+            return await cur.fetchall()
+
+    assert asyncio.run(main()) == [(0,), (1,), (2,)]
+
+
+def test_banner_lines_are_skipped(db):
+    client = _Client(prelude="echo 'Welcome to db1'; echo '{not json'; ")
+    try:
+        assert _Channel(client, db).sqlite_version == sqlite3.sqlite_version
+    finally:
+        client.kill()
+
+
+@pytest.mark.parametrize(
+    "client",
+    [
+        _Client(python="/nonexistent/python3"),
+        _Client(prelude="echo 'Welcome to db1'; exit 0; "),
+    ],
+    ids=["no interpreter", "banner only"],
+)
+def test_startup_failure_is_a_remote_sqlite_error(client, db):
+    try:
+        with pytest.raises(RemoteSqliteError):
+            _Channel(client, db)
+    finally:
+        client.kill()
+
+
+def test_transport_error_is_a_remote_sqlite_error(db):
+    class _Closed:
+        def exec_command(self, cmd):
+            raise EOFError()
+
+    with pytest.raises(RemoteSqliteError, match="EOFError"):
+        _Channel(_Closed(), db)
+
+
+def test_interrupt_stops_the_remote_statement(client, db):
+    async def main():
+        conn = RemoteSqlite(await asyncio.to_thread(_Channel, client, db))
+
+        async def run():
+            async with conn.execute(_ENDLESS) as cur:
+                await cur.fetchall()
+
+        with pytest.raises(TimeoutError):
+            await run_with_timeout(run(), 0.2, conn.interrupt)
+        try:
+            await asyncio.to_thread(client.processes[0].wait, 5)
+        finally:
+            # Unblock the abandoned round trip if the helper kept running.
+            client.kill()
+
+    asyncio.run(main())
@@ -0,0 +1,104 @@
+import io
+import os
+import stat
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from db_mcp import sqlite_sync
+from db_mcp.config import Config
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX file modes")
+
+_DATA = b"SQLite format 3\x00" + bytes(range(256)) * 64
+
+
+class _RemoteFile(io.BytesIO):
+    def readv(self, chunks):
+        for offset, length in chunks:
+            self.seek(offset)
+            yield self.read(length)
+
+
+class _Sftp:
+    def stat(self, path):
+        return SimpleNamespace(st_size=len(_DATA), st_mtime=0)
+
+    def open(self, path, mode):
+        return _RemoteFile(_DATA)
+
+    def close(self) -> None:
+        pass
+
+
+class _Client:
+    """SSH client without python3 on the remote side: whole-file transfers."""
+
+    def open_sftp(self):
+        return _Sftp()
+
+    def exec_command(self, cmd):
+        channel = SimpleNamespace(recv_exit_status=lambda: 127)
+        stdout = SimpleNamespace(read=lambda: b"", channel=channel)
+        stderr = SimpleNamespace(read=lambda: b"python3: not found")
+        return None, stdout, stderr
+
+
+def _mode(path) -> int:
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def _config(cache_dir) -> Config:
+    return Config(
+        db_type="sqlite",
+        db_mode="read-only",
+        db_database="",
+        db_host="",
+        db_port=0,
+        db_user="",
+        db_password="",
+        db_url="",
+        db_path="/srv/app.db",
+        ssh_host="db.example",
+        ssh_port=22,
+        ssh_user="user",
+        ssh_key="",
+        ssh_password="",
+        sqlite_cache_dir=str(cache_dir),
+    )
+
+
+def test_mirror_is_private(tmp_path):
+    old = os.umask(0o022)
+    try:
+        directory = tmp_path / "cache"
+        directory.mkdir(mode=0o755)
+        mirror, lock = sqlite_sync.open_mirror(_config(directory), _Client())
+        try:
+            mirror.pull()
+        finally:
+            lock.close()
+    finally:
+        os.umask(old)
+    assert mirror.local_path.read_bytes() == _DATA
+    assert _mode(directory) == 0o700
+    assert _mode(mirror.local_path) == 0o600
+
+
+def test_temporary_mirror_is_private(tmp_path):
+    cfg = _config(tmp_path / "cache")
+    _, lock = sqlite_sync.open_mirror(cfg, _Client())
+    try:
+        # Another process holds the persistent mirror.
+        mirror, second = sqlite_sync.open_mirror(cfg, _Client())
+    finally:
+        lock.close()
+    try:
+        assert second is None
+        assert _mode(mirror.local_path) == 0o600
+        mirror.pull()
+        assert mirror.local_path.read_bytes() == _DATA
+        assert _mode(mirror.local_path) == 0o600
+    finally:
+        mirror.discard()
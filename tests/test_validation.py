@@ -0,0 +1,121 @@
+import pytest
+
+from db_mcp.validation import is_read_only_query, validate_read_only_query
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT 1",
+        "  select * from t where name = 'a;b'",
+        "/* report */ SELECT 1",
+        "-- note\nSELECT 1",
+        "SELECT 1; SHOW TABLES;",
+        "WITH x AS (SELECT 1) SELECT * FROM x",
+        "SELECT /*+ MAX_EXECUTION_TIME(1000) */ * FROM t",
+        "SELECT $$;DROP$$",
+    ],
+)
+def test_reads_are_allowed(sql):
+    validate_read_only_query(sql)
+    assert is_read_only_query(sql)
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "UPDATE t SET name = 'x'",
+        "SELECT 1; DELETE FROM t",
+        "/* SELECT */ DELETE FROM t",
+        "SELECT 'a'';'; DROP TABLE t",
+    ],
+)
+def test_writes_are_rejected(sql):
+    with pytest.raises(ValueError, match="Only SELECT"):
+        validate_read_only_query(sql)
+    assert not is_read_only_query(sql)
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "/*!UPDATE t SET name = (*/ SELECT 'x')",
+        "/*!50000 DELETE FROM t WHERE id IN (*/ SELECT 1)",
+        "/*M!100000 DELETE FROM t WHERE id IN (*/ SELECT 1)",
+        "SELECT * FROM t /*!50000 INTO OUTFILE '/tmp/t' */",
+        "SELECT 1; /*!DELETE FROM t WHERE id IN (*/ SELECT 1)",
+    ],
+)
+def test_mysql_executable_comments_are_rejected(sql):
+    with pytest.raises(ValueError, match="executable comments"):
+        validate_read_only_query(sql)
+    assert not is_read_only_query(sql)
+
+
+def test_empty_query():
+    with pytest.raises(ValueError, match="Empty query"):
+        validate_read_only_query(" -- nothing\n ; ")
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "WITH moved AS (DELETE FROM t WHERE id = 1 RETURNING *) SELECT * FROM moved",
+        "with n as (insert into t (name) values ('x') returning id) select id from n",
+        "WITH u AS (UPDATE t SET name = 'x' RETURNING id) SELECT count(*) FROM u",
+        "SELECT 1; WITH d AS (DELETE FROM t RETURNING 1) SELECT * FROM d",
+    ],
+)
+def test_data_modifying_with_is_not_a_read(sql):
+    validate_read_only_query(sql)
+    assert not is_read_only_query(sql)
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "WITH x AS (SELECT last_update FROM t) SELECT * FROM x",
+        "SELECT * FROM t WHERE action = 'delete'",
+    ],
+)
+def test_reads_mentioning_dml_words(sql):
+    assert is_read_only_query(sql)
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT nextval('orders_id_seq')",
+        "SELECT pg_catalog.setval('orders_id_seq', 42)",
+        "SELECT id INTO TEMP recent FROM orders",
+        "SELECT count(*) INTO @n FROM orders",
+        "SELECT * FROM orders INTO OUTFILE '/tmp/orders.csv'",
+        "SELECT * FROM jobs WHERE id = 1 FOR UPDATE",
+        "SELECT * FROM jobs FOR UPDATE SKIP LOCKED",
+        "SELECT * FROM jobs\nFOR  NO KEY UPDATE",
+        "select * from jobs for share",
+        "SELECT * FROM jobs LOCK IN SHARE MODE",
+        "SELECT pg_advisory_lock(1)",
+        "SELECT pg_try_advisory_xact_lock(1)",
+        "SELECT GET_LOCK('job', 10)",
+        "SELECT RELEASE_LOCK('job')",
+        "SELECT set_config('search_path', 'x', false)",
+        "SELECT pg_notify('jobs', 'new')",
+    ],
+)
+def test_side_effecting_select_is_not_a_read(sql):
+    validate_read_only_query(sql)
+    assert not is_read_only_query(sql)
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT format, information FROM forecast",
+        "SELECT * FROM intouch WHERE lockout = 0",
+        "SELECT max_nextval FROM seqs",
+        "SELECT * FROM t WHERE note = 'for sure'",
+    ],
+)
+def test_reads_mentioning_side_effect_words(sql):
+    assert is_read_only_query(sql)